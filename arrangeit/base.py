@@ -19,22 +19,43 @@ import logging
 import os
 import queue
 import sys
+import threading
+import tkinter as tk
+from collections import deque
+from time import perf_counter
 
 import pynput
 
 from arrangeit.data import WindowModel, WindowsCollection
+from arrangeit.events import EventsRecorder, EventsRingBuffer, LatencyStats
+from arrangeit.screenshots import (
+    DesktopSnapshot,
+    ScreenshotsCache,
+    ScreenshotsPrefetcher,
+)
 from arrangeit.settings import MESSAGES, Settings
+from arrangeit.snapping import SnappingIndex, nearest_intersections
 from arrangeit.utils import (
     Rectangle,
-    check_intersections,
+    clear_snapping_cache,
     get_component_class,
     get_cursor_name,
+    get_geometry_string,
+    get_prepared_screenshot,
     get_snapping_sources_for_rect,
+    get_value_if_valid_type,
+    get_visible_wids,
     offset_for_intersections,
     platform_user_data_path,
     quarter_by_smaller,
 )
-from arrangeit.view import ViewApplication, get_screenshot_widget, get_tkinter_root
+from arrangeit.view import (
+    ViewApplication,
+    fonts,
+    get_screenshot_widget,
+    get_tkinter_root,
+    icons_cache,
+)
 
 
 class BaseApp:
@@ -44,10 +65,13 @@ class BaseApp:
     :type BaseApp.controller: type(:class:`BaseController`) instance (platform specific)
     :var BaseApp.collector: object responsible for collecting windows data
     :type BaseApp.collector: type(:class:`BaseCollector`) instance (platform specific)
+    :var BaseApp.snapping_sources: snapping indexes grouped by workspace number
+    :type BaseApp.snapping_sources: dict (int: :class:`SnappingIndex`)
     """
 
     controller = None
     collector = None
+    snapping_sources = None
 
     def __init__(self):
         """Instantiates platform specific Controller and Collector classes."""
@@ -102,6 +126,13 @@ class BaseApp:
             return True
 
         setattr(Settings, name, value)
+        if name == "SNAP_PIXELS":
+            self.snapping_sources = None
+            clear_snapping_cache()
+        elif name.endswith("_FONT_INCREASE"):
+            fonts.update(name)
+        elif name == "ICONS_CACHE_BYTES":
+            icons_cache.set_memory_limit(value)
         logging.info("Settings %s changed.", name)
         return self._save_setting([name], value)
 
@@ -159,6 +190,10 @@ class BaseApp:
         """Override if platform needs cleanup after screenshot is taken."""
         return None
 
+    def shutdown_cleanup(self):
+        """Override if platform needs cleanup before the program exits."""
+        return None
+
     ## COMMANDS
     def _save_setting(self, names, value):
         """Saves user settings with provided names with provided value
@@ -194,6 +229,9 @@ class BaseApp:
 
         and all monitors snapping rects as values.
 
+        Every workspace gets its own list so windows snapping rects added later
+        to one workspace don't show up in the others.
+
         :returns: dict
         """
         monitors_snapping_rects = [
@@ -201,45 +239,112 @@ class BaseApp:
             for rect in self.collector.get_monitors_rects()
         ]
         return {
-            workspace[0]: monitors_snapping_rects
+            workspace[0]: list(monitors_snapping_rects)
             for workspace in self.collector.get_available_workspaces()
         }
 
+    def _add_snapping_sources(self, model):
+        """Creates snapping rectangles for provided model and adds them to
+
+        the snapping index of the workspace the model is going to be placed on.
+
+        :param model: window model
+        :type model: :class:`WindowModel`
+        :var ws: model's workspace number
+        :type ws: int
+        """
+        ws = model.changed_ws if model.is_ws_changed else model.ws
+        self.snapping_sources[ws].append(
+            get_snapping_sources_for_rect(
+                (model.changed_x, model.changed_y, model.changed_w, model.changed_h),
+                Settings.SNAP_PIXELS,
+            ),
+            key=model.wid,
+        )
+
     def create_snapping_sources(self, for_model):
         """Returns collection of snapping rectangless grouped by workspace.
 
         Snapping rectangle is created around window connected edge points pair with
         height (or width) of 2*SNAP_PIXELS and width (or height) of related window side.
         Snapping rects for all available monitors are created for each workspace.
+        Collected rectangles are put in :class:`SnappingIndex` instances
+        so the snapping check doesn't have to traverse them all on every mouse move.
+
+        Collection is created only once per session (or after snapping size change)
+        and later just updated by :func:`update_snapping_sources`. Provided model
+        is excluded from snapping targets if SNAP_INCLUDE_SELF setting isn't set.
 
         :param for_model: current model
         :type for_model: :class:`WindowModel`
-        :returns: dict (int: list of four-tuples)
+        :returns: dict (int: :class:`SnappingIndex`)
         """
-        sources = self._initialize_snapping_sources()
+        if self.snapping_sources is None:
+            self.snapping_sources = {
+                ws: SnappingIndex(monitors)
+                for ws, monitors in self._initialize_snapping_sources().items()
+            }
+            for model in list(self.collector.collection.generator()):
+                self._add_snapping_sources(model)
+
+        excluded = None if Settings.SNAP_INCLUDE_SELF else for_model.wid
+        for index in self.snapping_sources.values():
+            index.excluded = excluded
+        return self.snapping_sources
+
+    def get_stacked_windows(self, workspace):
+        """Override if platform can provide windows stacking order.
+
+        Returned list holds (wid, (x, y, width, height)) pairs of the windows
+        visible on provided workspace ordered from bottom to top.
+
+        :param workspace: workspace number
+        :type workspace: int
+        :returns: list
+        """
+        return []
 
-        for model in list(self.collector.collection.generator()):
-            if model == for_model and not Settings.SNAP_INCLUDE_SELF:
-                continue
+    def grab_monitor_image(self, rect):
+        """Override if platform can grab raw image of the desktop area.
 
-            ws = model.changed_ws if model.is_ws_changed else model.ws
-            sources[ws].append(
-                get_snapping_sources_for_rect(
-                    (
-                        model.changed_x,
-                        model.changed_y,
-                        model.changed_w,
-                        model.changed_h,
-                    ),
-                    Settings.SNAP_PIXELS,
-                )
-            )
-        return sources
+        :param rect: monitor rectangle (x, y, width, height)
+        :type rect: (int, int, int, int)
+        :returns: :class:`PIL.Image.Image` or None
+        """
+        return None
+
+    def grab_window_image(self, model):
+        """Override if platform can grab raw window image without root window.
+
+        Returned tuple holds raw image and its placement offset (x, y).
+
+        :param model: model of the window we want screenshot from
+        :type model: :class:`WindowModel`
+        :returns: (:class:`PIL.Image.Image`, (int, int)) or None
+        """
+        return None
 
     def grab_window_screen(self, model, root_wid=None):
         """Method must be overridden."""
         raise NotImplementedError
 
+    def update_snapping_sources(self, model):
+        """Recreates snapping rectangles only for provided model
+
+        that has just been moved, resized, skipped or sent to other workspace.
+
+        :param model: window model
+        :type model: :class:`WindowModel`
+        :returns: Boolean
+        """
+        if self.snapping_sources is None or model.wid is None:
+            return True
+
+        for index in self.snapping_sources.values():
+            index.remove(model.wid)
+        self._add_snapping_sources(model)
+        return False
+
 
 class BaseController:
     """Base Controller class holding common code for all the platforms.
@@ -268,6 +373,28 @@ class BaseController:
     :type snapping_targets: dict
     :var BaseController.timer: id of active timer
     :type BaseController.timer: int
+    :var BaseController.dropped_moves: number of mouse moves skipped by coalescing
+    :type BaseController.dropped_moves: int
+    :var BaseController.latency: mouse events latencies statistics
+    :type BaseController.latency: :class:`LatencyStats`
+    :var BaseController.root_geometry: cached root window geometry [x, y, w, h]
+    :type BaseController.root_geometry: list
+    :var BaseController.screen_size: cached screen size (width, height)
+    :type BaseController.screen_size: (int, int)
+    :var BaseController.applied_geometry: last applied root geometry [x, y, w, h]
+    :type BaseController.applied_geometry: list
+    :var BaseController.pending_geometry: root geometry waiting for idle [x, y, w, h]
+    :type BaseController.pending_geometry: list
+    :var BaseController.geometry_idle: id of scheduled idle geometry update
+    :type BaseController.geometry_idle: str
+    :var BaseController.recorder: mouse and key events recorder
+    :type BaseController.recorder: :class:`EventsRecorder`
+    :var BaseController.prefetcher: upcoming windows screenshots preparer
+    :type BaseController.prefetcher: :class:`ScreenshotsPrefetcher`
+    :var BaseController.screenshots: prepared windows screenshots cache
+    :type BaseController.screenshots: :class:`ScreenshotsCache`
+    :var BaseController.snapshot: monitors images grabbed for current workspace
+    :type BaseController.snapshot: :class:`DesktopSnapshot`
     """
 
     app = None
@@ -282,15 +409,47 @@ class BaseController:
     screenshot_when_exposed = False
     snapping_targets = None
     timer = None
+    dropped_moves = 0
+    latency = None
+    root_geometry = None
+    screen_size = None
+    applied_geometry = None
+    pending_geometry = None
+    geometry_idle = None
+    recorder = None
+    prefetcher = None
+    screenshots = None
+    snapshot = None
 
     def __init__(self, app):
         """Sets app attribute to provided argument, model attribute to new empty model
 
         and calls :func:`setup`.
+
+        Creates events recorder if TRACE_FILE setting is set, screenshots
+        prefetcher if SCREENSHOT_PREFETCH_COUNT setting is greater than zero
+        and screenshots cache if SCREENSHOTS_CACHE_BYTES setting is greater than zero.
+
+        :var trace: trace file path
+        :type trace: str
+        :var cache_bytes: screenshots cache memory limit
+        :type cache_bytes: int
         """
         self.app = app
         self.model = WindowModel()
         self.mouse = BaseMouse()
+        self.latency = LatencyStats()
+        trace = get_value_if_valid_type(Settings.TRACE_FILE, str)
+        if trace:
+            try:
+                self.recorder = EventsRecorder(trace)
+            except OSError as exception:
+                logging.error("Can't record events to %s: %s", trace, exception)
+        if get_value_if_valid_type(Settings.SCREENSHOT_PREFETCH_COUNT, int):
+            self.prefetcher = ScreenshotsPrefetcher()
+        cache_bytes = get_value_if_valid_type(Settings.SCREENSHOTS_CACHE_BYTES, int)
+        if cache_bytes:
+            self.screenshots = ScreenshotsCache(cache_bytes)
         self.setup()
 
     ## CONFIGURATION
@@ -312,6 +471,9 @@ class BaseController:
         calculated from available width and height for screen as quarter of
         the smaller element. Returned width and height have 16:9 aspect ratio.
 
+        Pending geometry update is applied before and the last applied geometry
+        is forgotten, so the next :func:`apply_geometry` isn't skipped.
+
         :param root: root tkinter window
         :type root: :class:`tkinter.Tk` instance
         :var width: root width in pixels
@@ -324,7 +486,12 @@ class BaseController:
                 *self.app.collector.get_smallest_monitor_size(), Settings.ROOT_SIZE
             )
             self.default_size = (width, height)
+        self.flush_geometry()
+        self.applied_geometry = None
         root.geometry("{}x{}".format(*self.default_size))
+        self.cache_root_geometry(
+            width=self.default_size[0], height=self.default_size[1]
+        )
 
     def set_screenshot(self):
         """Creates and places screenshot of model window as background image.
@@ -338,9 +505,7 @@ class BaseController:
         if Settings.SCREENSHOT_DISABLED:
             return True
 
-        self.screenshot, offset = self.app.grab_window_screen(
-            self.model, root_wid=self.view.get_root_wid()
-        )
+        self.screenshot, offset = self.get_screenshot()
         self.screenshot_widget.config(image=self.screenshot)
         self.screenshot_widget.place(
             x=offset[0] + Settings.SCREENSHOT_SHIFT_PIXELS,
@@ -363,6 +528,36 @@ class BaseController:
         self.screenshot_widget = get_screenshot_widget(root)
         self.view = ViewApplication(master=root, controller=self)
 
+    def remove_mouse_wakeup(self):
+        """Removes mouse wakeup pipe file handler from Tkinter and closes the pipe."""
+        if self.mouse.wakeup_reader is None:
+            return
+        if hasattr(self.view.master.tk, "deletefilehandler"):
+            try:
+                self.view.master.tk.deletefilehandler(self.mouse.wakeup_reader)
+            except (RuntimeError, tk.TclError):
+                pass
+        self.mouse.close_wakeup()
+
+    def setup_mouse_wakeup(self):
+        """Registers mouse wakeup pipe in Tkinter as a file handler.
+
+        Tkinter's file handlers aren't available in MS Windows, so True is returned
+        there and in the case of any error to signal polling should be used instead.
+
+        :returns: Boolean
+        """
+        if not hasattr(self.view.master.tk, "createfilehandler"):
+            return True
+        try:
+            self.view.master.tk.createfilehandler(
+                self.mouse.open_wakeup(), tk.READABLE, self.on_mouse_wakeup
+            )
+        except (OSError, RuntimeError, tk.TclError):
+            self.mouse.close_wakeup()
+            return True
+        return False
+
     def setup_root_window(self, root):
         """Sets provided root window appearance common for all platforms.
 
@@ -374,13 +569,15 @@ class BaseController:
 
         root.wm_attributes("-topmost", True)
         root.config(background=Settings.MAIN_BG)
+        root.bind("<Configure>", self.on_configure)
 
     ## DOMAIN LOGIC
     def apply_snapping(self, new_x, new_y, sources, intersections):
-        """Moves cursor and sets new state and corner if snapping occured on new side.
+        """Places root window to snapped geometry and moves cursor to it.
 
-        State and corner can change only for positioning phase, so for resizing phase
-        this method just calls and returns :func:`BaseMouse.move_cursor`.
+        State and corner can change only for positioning phase, where they are set
+        if snapping occured on new side. Root geometry is applied together with
+        cursor warp, as listener's echo of the warp is never dispatched.
 
         :param new_x: new cursor position on x-axis
         :type new_x: int
@@ -392,25 +589,34 @@ class BaseController:
         :type intersections: tuple
         :var new_state: positioning state
         :type new_state: int
+        :var width: root window width
+        :type width: int
+        :var height: root window height
+        :type height: int
         """
         if self.state < Settings.RESIZE:
 
             new_state = self.check_snapping_state(sources, intersections)
 
             if new_state is not None:
+                width, height = self.get_root_geometry()[2:]
                 if new_state in (1, 2) and self.state in (0, 3):
-                    new_x += self.view.master.winfo_width() - 2 * Settings.SHIFT_CURSOR
+                    new_x += width - 2 * Settings.SHIFT_CURSOR
                 elif new_state in (0, 3) and self.state in (1, 2):
-                    new_x -= self.view.master.winfo_width() - 2 * Settings.SHIFT_CURSOR
+                    new_x -= width - 2 * Settings.SHIFT_CURSOR
 
                 if new_state in (2, 3) and self.state in (0, 1):
-                    new_y += self.view.master.winfo_height() - 2 * Settings.SHIFT_CURSOR
+                    new_y += height - 2 * Settings.SHIFT_CURSOR
                 elif new_state in (0, 1) and self.state in (2, 3):
-                    new_y -= self.view.master.winfo_height() - 2 * Settings.SHIFT_CURSOR
+                    new_y -= height - 2 * Settings.SHIFT_CURSOR
 
                 self.state = new_state
                 self.setup_corner()
 
+            self.apply_geometry(*self.get_root_rect(new_x, new_y)[:2])
+        else:
+            self.apply_geometry(*self.get_resized_rect(new_x, new_y))
+
         self.mouse.move_cursor(new_x, new_y)
 
     def check_snapping(self, x, y):
@@ -420,7 +626,8 @@ class BaseController:
         or returns False if no snapping has occurred.
 
         Calls :func:`apply_snapping` to change state and corner if snapping occurs on
-        different corner that current state/corner.
+        different corner that current state/corner. Snapping is done to the closest
+        edges found by :func:`nearest_intersections`.
 
         :param x: absolute horizontal axis mouse position in pixels
         :type x: int
@@ -441,7 +648,7 @@ class BaseController:
                 Settings.SNAP_PIXELS,
                 corner=None if self.state < Settings.RESIZE else self.state % 10,
             )
-            intersections = check_intersections(
+            intersections = nearest_intersections(
                 sources, self.snapping_targets[self.view.workspaces.active]
             )
             offset = offset_for_intersections(intersections, Settings.SNAP_PIXELS)
@@ -485,7 +692,7 @@ class BaseController:
             if Settings.CORNER_RECT_INDEXES[self.state] != (index0, index1):
                 new_state = Settings.CORNER_RECT_INDEXES.index((index0, index1))
 
-        return None if new_state == self.state else self.state
+        return None if new_state == self.state else new_state
 
     def listed_window_activated(self, wid):
         """Calls task that restarts positioning routine from provided window id
@@ -496,7 +703,6 @@ class BaseController:
         :type wid: int
         """
         self.app.run_task("rerun_from_window", wid, self.model.wid)
-        self.view.windows.clear_list()
         self.view.windows.add_windows(
             self.app.collector.collection.get_windows_list()[1:]
         )
@@ -512,8 +718,11 @@ class BaseController:
         and populates view widgets with new model data.
 
         Sets program to be in positioning phase by setting LOCATE state.
+        Snapping rectangles of the previous model are updated as it could be changed.
         Also changes and moves cursor and root window to model's window position.
-        Grabs and sets screenshot image of the model's window.
+        Schedules desktop snapshot if workspace has changed, grabs and sets screenshot
+        image of the model's window and schedules prefetching of the upcoming
+        windows screenshots for the idle time.
         If there are no values left in collection then saves and exits app.
         Switches workspace if it's changed.
 
@@ -526,6 +735,7 @@ class BaseController:
         :returns: Boolean
         """
         self.state = Settings.LOCATE
+        self.app.update_snapping_sources(self.model)
         old_workspace = (
             from_workspace
             if from_workspace is not None
@@ -550,18 +760,18 @@ class BaseController:
         self.snapping_targets = self.app.create_snapping_sources(self.model)
         self.set_default_geometry(self.view.master)
         self.view.update_widgets(self.model)
+        self.take_desktop_snapshot()
         if not self.screenshot_when_exposed:
             self.set_screenshot()
         self.place_on_top_left()
-        if first_time:
-            self.view.master.geometry(
-                "+{}+{}".format(
-                    *self.get_root_rect(
-                        self.model.x + Settings.SHIFT_CURSOR,
-                        self.model.y + Settings.SHIFT_CURSOR,
-                    )[:2]
-                )
-            )
+        self.apply_geometry(
+            *self.get_root_rect(
+                self.model.x + Settings.SHIFT_CURSOR,
+                self.model.y + Settings.SHIFT_CURSOR,
+            )[:2]
+        )
+        if self.prefetcher is not None:
+            self.view.master.after_idle(self.prefetch_screenshots)
         return False
 
     def run(self, generator):
@@ -643,12 +853,17 @@ class BaseController:
         :type x: int
         :param y: current vertical axis mouse position in pixels
         :type y: int
+        :var width: root window width
+        :type width: int
+        :var height: root window height
+        :type height: int
         :var params: rect attributes we're going to change
         :type params: dict
         """
+        width, height = self.get_root_geometry()[2:]
         params = {
-            "w": self.view.master.winfo_width(),
-            "h": self.view.master.winfo_height(),
+            "w": width,
+            "h": height,
             "x": x - Settings.SHIFT_CURSOR,
             "y": y - Settings.SHIFT_CURSOR,
         }
@@ -677,6 +892,72 @@ class BaseController:
         self.display_message(MESSAGES["msg_workspace_changed"])
 
     ## COMMANDS
+    def apply_geometry(self, x=None, y=None, width=None, height=None):
+        """Sets root window geometry from provided values and caches them.
+
+        Position is set only if both x and y are provided, the same as size
+        for width and height. Nothing is set if provided values are the same as
+        the last applied ones. If GEOMETRY_IDLE_BATCHING setting is set then
+        values are merged into pending geometry applied by :func:`flush_geometry`
+        when Tkinter becomes idle.
+
+        :param x: root window position on x-axis
+        :type x: int
+        :param y: root window position on y-axis
+        :type y: int
+        :param width: root window width
+        :type width: int
+        :param height: root window height
+        :type height: int
+        :var values: provided geometry values
+        :type values: tuple
+        """
+        values = (x, y, width, height)
+        if self.applied_geometry is not None and all(
+            value is None or value == applied
+            for value, applied in zip(values, self.applied_geometry)
+        ):
+            return
+
+        if self.applied_geometry is None:
+            self.applied_geometry = [None, None, None, None]
+        for index, value in enumerate(values):
+            if value is not None:
+                self.applied_geometry[index] = value
+        self.cache_root_geometry(x=x, y=y, width=width, height=height)
+
+        if Settings.GEOMETRY_IDLE_BATCHING is True:
+            if self.pending_geometry is None:
+                self.pending_geometry = [None, None, None, None]
+            for index, value in enumerate(values):
+                if value is not None:
+                    self.pending_geometry[index] = value
+            if self.geometry_idle is None:
+                self.geometry_idle = self.view.master.after_idle(self.flush_geometry)
+            return
+
+        self.view.master.geometry(get_geometry_string(*values))
+
+    def cache_root_geometry(self, x=None, y=None, width=None, height=None):
+        """Updates cached root window geometry with provided values.
+
+        Values that aren't provided are left intact.
+
+        :param x: root window position on x-axis
+        :type x: int
+        :param y: root window position on y-axis
+        :type y: int
+        :param width: root window width
+        :type width: int
+        :param height: root window height
+        :type height: int
+        """
+        if self.root_geometry is None:
+            self.root_geometry = [None, None, None, None]
+        for index, value in enumerate((x, y, width, height)):
+            if value is not None:
+                self.root_geometry[index] = value
+
     def change_position(self, x, y):
         """Changes root window position to provided x and y
 
@@ -690,7 +971,7 @@ class BaseController:
         if self.check_snapping(x, y):
             return True
 
-        self.view.master.geometry("+{}+{}".format(*self.get_root_rect(x, y)[:2]))
+        self.apply_geometry(*self.get_root_rect(x, y)[:2])
         return None
 
     def change_size(self, x, y):
@@ -705,14 +986,6 @@ class BaseController:
         :type y: int
         :var position: eventual position of minimum sized root
         :type position: tuple (int, int)
-        :var width: root window calculated width
-        :type width: int
-        :var height: root window calculated height
-        :type height: int
-        :var left: root window calculated position on x-axis
-        :type left: int
-        :var top: root window calculated position on y-axis
-        :type top: int
         """
         position = self.check_current_size(x, y)
         if position:
@@ -721,30 +994,7 @@ class BaseController:
         if self.check_snapping(x, y):
             return True
 
-        width = min(
-            self.model.changed_x - x + Settings.SHIFT_CURSOR, self.model.changed_x
-        )
-        height = min(
-            self.model.changed_y - y + Settings.SHIFT_CURSOR, self.model.changed_y
-        )
-        left = x - Settings.SHIFT_CURSOR
-        top = y - Settings.SHIFT_CURSOR
-
-        if (self.state % 10) // 2:
-            height = min(
-                y - self.model.changed_y + Settings.SHIFT_CURSOR,
-                self.view.master.winfo_screenheight() - self.model.changed_y,
-            )
-            top = self.model.changed_y
-
-        if (self.state % 10) % 3:
-            width = min(
-                x - self.model.changed_x + Settings.SHIFT_CURSOR,
-                self.view.master.winfo_screenwidth() - self.model.changed_x,
-            )
-            left = self.model.changed_x
-
-        self.view.master.geometry("{}x{}+{}+{}".format(width, height, left, top))
+        self.apply_geometry(*self.get_resized_rect(x, y))
         return None
 
     def change_setting(self, name, value):
@@ -807,6 +1057,225 @@ class BaseController:
         if not permanent:
             self.set_timer()
 
+    def flush_geometry(self):
+        """Cancels scheduled idle update and applies pending root geometry."""
+        if self.geometry_idle is not None:
+            self.view.master.after_cancel(self.geometry_idle)
+            self.geometry_idle = None
+        if self.pending_geometry is not None:
+            self.view.master.geometry(get_geometry_string(*self.pending_geometry))
+            self.pending_geometry = None
+
+    def grab_desktop_snapshot(self, snapshot):
+        """Grabs images of all the monitors for provided snapshot if it's current one.
+
+        Only the windows not overlapped by other windows or by root window,
+        taken at its actual geometry on the screen, are marked as visible in the
+        snapshot. Snapshot is left empty if platform can't grab monitors images.
+
+        :param snapshot: snapshot scheduled by :func:`take_desktop_snapshot`
+        :type snapshot: :class:`DesktopSnapshot`
+        :var monitors: monitors (rect, image) pairs
+        :type monitors: list of (tuple, :class:`PIL.Image.Image`)
+        :var master: root window
+        :type master: :class:`tkinter.Tk`
+        :returns: Boolean
+        """
+        if snapshot is not self.snapshot:
+            return True
+
+        monitors = [
+            (rect, self.app.grab_monitor_image(rect))
+            for rect in self.app.collector.get_monitors_rects()
+        ]
+        if not monitors or any(image is None for _, image in monitors):
+            return True
+
+        master = self.view.master
+        snapshot.monitors = monitors
+        snapshot.visible = get_visible_wids(
+            self.app.get_stacked_windows(snapshot.workspace),
+            occluders=(
+                (
+                    master.winfo_rootx(),
+                    master.winfo_rooty(),
+                    master.winfo_width(),
+                    master.winfo_height(),
+                ),
+            ),
+        )
+        return None
+
+    def grab_screenshot(self):
+        """Returns model window's screenshot prepared from desktop snapshot
+
+        if it's available for the window, otherwise grabbed by the app.
+
+        Snapshot image is placed without offset as it includes window decoration.
+
+        :var grabbed: monitor image and window box inside it
+        :type grabbed: (:class:`PIL.Image.Image`, (int, int, int, int))
+        :returns: (:class:`PIL.ImageTk.PhotoImage`, (int, int))
+        """
+        grabbed = self.get_snapshot_image(self.model)
+        if grabbed is not None:
+            return (
+                get_prepared_screenshot(
+                    grabbed[0],
+                    blur_size=Settings.SCREENSHOT_BLUR_PIXELS,
+                    grayscale=Settings.SCREENSHOT_TO_GRAYSCALE,
+                    downscale=Settings.SCREENSHOT_DOWNSCALE_FACTOR,
+                    size=self.get_screen_size(),
+                    box=grabbed[1],
+                ),
+                (0, 0),
+            )
+        return self.app.grab_window_screen(
+            self.model, root_wid=self.view.get_root_wid()
+        )
+
+    def get_root_geometry(self):
+        """Returns cached root window geometry as (x, y, width, height).
+
+        Only the values not cached yet are retrieved from Tkinter and then cached.
+
+        :var master: root window
+        :type master: :class:`tkinter.Tk`
+        :returns: (int, int, int, int)
+        """
+        if self.root_geometry is None:
+            self.root_geometry = [None, None, None, None]
+        master = self.view.master
+        for index, getter in enumerate(
+            (master.winfo_x, master.winfo_y, master.winfo_width, master.winfo_height)
+        ):
+            if self.root_geometry[index] is None:
+                self.root_geometry[index] = getter()
+        return tuple(self.root_geometry)
+
+    def get_screen_size(self):
+        """Returns cached screen size as (width, height).
+
+        :returns: (int, int)
+        """
+        if self.screen_size is None:
+            self.screen_size = (
+                self.view.master.winfo_screenwidth(),
+                self.view.master.winfo_screenheight(),
+            )
+        return self.screen_size
+
+    def get_screenshot(self):
+        """Returns screenshot of model window and its offset.
+
+        Cached screenshot is returned if it's been prepared for current geometry
+        and preparation settings, then prefetched screenshot is tried and
+        if there's none screenshot is prepared right away by :func:`grab_screenshot`.
+        Prefetched or grabbed screenshot is cached afterward.
+
+        :var key: model window geometry
+        :type key: tuple
+        :var cache_key: model window geometry and preparation settings
+        :type cache_key: tuple
+        :var screenshot: screenshot and offset
+        :type screenshot: (:class:`PIL.ImageTk.PhotoImage`, (int, int))
+        :returns: (:class:`PIL.ImageTk.PhotoImage`, (int, int))
+        """
+        if self.screenshots is None and self.prefetcher is None:
+            return self.grab_screenshot()
+
+        key = self.get_screenshot_key(self.model)
+        cache_key = key + (
+            Settings.SCREENSHOT_BLUR_PIXELS,
+            Settings.SCREENSHOT_TO_GRAYSCALE,
+            Settings.SCREENSHOT_DOWNSCALE_FACTOR,
+        )
+        if self.screenshots is not None:
+            screenshot = self.screenshots.get(self.model.wid, cache_key)
+            if screenshot is not None:
+                return screenshot
+
+        screenshot = (
+            self.prefetcher.pop(self.model.wid, key)
+            if self.prefetcher is not None
+            else None
+        )
+        if screenshot is None:
+            screenshot = self.grab_screenshot()
+        if self.screenshots is not None:
+            self.screenshots.put(self.model.wid, cache_key, *screenshot)
+        return screenshot
+
+    def get_snapshot_image(self, model):
+        """Returns desktop snapshot's monitor image and provided model's box in it.
+
+        :param model: window model
+        :type model: :class:`WindowModel`
+        :returns: (:class:`PIL.Image.Image`, (int, int, int, int)) or None
+        """
+        if self.snapshot is None or self.snapshot.workspace != model.workspace:
+            return None
+        return self.snapshot.get(model.wid, model.rect)
+
+    def get_screenshot_key(self, model):
+        """Returns provided model's window geometry used to validate its screenshot.
+
+        :param model: window model
+        :type model: :class:`WindowModel`
+        :returns: (int, int, int, int)
+        """
+        return (model.changed_x, model.changed_y, model.changed_w, model.changed_h)
+
+    def get_resized_rect(self, x, y):
+        """Returns root window rect for provided cursor position in resizing phase
+
+        calculated in regard to model's changed x and y and limited by screen size.
+
+        :param x: absolute horizontal axis mouse position in pixels
+        :type x: int
+        :param y: absolute vertical axis mouse position in pixels
+        :type y: int
+        :var width: root window calculated width
+        :type width: int
+        :var height: root window calculated height
+        :type height: int
+        :var left: root window calculated position on x-axis
+        :type left: int
+        :var top: root window calculated position on y-axis
+        :type top: int
+        :var screen_width: screen width in pixels
+        :type screen_width: int
+        :var screen_height: screen height in pixels
+        :type screen_height: int
+        :returns: (int, int, int, int)
+        """
+        screen_width, screen_height = self.get_screen_size()
+
+        width = min(
+            self.model.changed_x - x + Settings.SHIFT_CURSOR, self.model.changed_x
+        )
+        height = min(
+            self.model.changed_y - y + Settings.SHIFT_CURSOR, self.model.changed_y
+        )
+        left = x - Settings.SHIFT_CURSOR
+        top = y - Settings.SHIFT_CURSOR
+
+        if (self.state % 10) // 2:
+            height = min(
+                y - self.model.changed_y + Settings.SHIFT_CURSOR,
+                screen_height - self.model.changed_y,
+            )
+            top = self.model.changed_y
+
+        if (self.state % 10) % 3:
+            width = min(
+                x - self.model.changed_x + Settings.SHIFT_CURSOR,
+                screen_width - self.model.changed_x,
+            )
+            left = self.model.changed_x
+
+        return (left, top, width, height)
+
     def get_root_rect(self, x, y):
         """Returns current root position and size calculated from provided x, y.
 
@@ -816,12 +1285,8 @@ class BaseController:
         :type y: int
         :returns: (int, int, int, int)
         """
-        left, top, width, height = (
-            x - Settings.SHIFT_CURSOR,
-            y - Settings.SHIFT_CURSOR,
-            self.view.master.winfo_width(),
-            self.view.master.winfo_height(),
-        )
+        left, top = x - Settings.SHIFT_CURSOR, y - Settings.SHIFT_CURSOR
+        width, height = self.get_root_geometry()[2:]
         if (self.state % 10) % 3:  # 1 and 2 have different new_x
             left -= width - 2 * Settings.SHIFT_CURSOR
         if (self.state % 10) // 2:  # 2 and 3 have different new_y
@@ -834,26 +1299,60 @@ class BaseController:
 
         :param number: number of 1 to 16 representing ordinal in list
         :type number: int
-        :var windows: available workspaces in view
-        :type windows: :class:`WorkspacesCollection`
+        :var wid: id of window on related position in list
+        :type wid: int
         """
-        windows = self.view.windows.winfo_children()
-        if len(windows) >= number:
-            self.listed_window_activated(windows[number - 1].wid)
+        wid = self.view.windows.get_wid(number - 1)
+        if wid is not None:
+            self.listed_window_activated(wid)
 
-    def mouse_move(self, x, y):
+    def mouse_move(self, x, y, captured=None):
         """Moves root Tkinter window to provided mouse coordinates.
 
+        If event capture time is provided then the latency is recorded.
+
         :param x: absolute horizontal axis mouse position in pixels
         :type x: int
         :param y: absolute vertical axis mouse position in pixels
         :type y: int
+        :param captured: performance counter value at the time of event capture
+        :type captured: float
+        :var snapped: is root window snapped instead of moved or resized
+        :type snapped: Boolean or None
         """
         if self.state < Settings.RESIZE:
-            self.change_position(x, y)
+            snapped = self.change_position(x, y)
 
         elif self.state < Settings.OTHER:
-            self.change_size(x, y)
+            snapped = self.change_size(x, y)
+
+        else:
+            return
+
+        if captured is not None:
+            self.latency.record(perf_counter() - captured, snapped is True)
+
+    def log_latency_stats(self):
+        """Logs mouse events latencies statistics, mouse queue metrics
+
+        and screenshots cache metrics.
+        """
+        summary = self.latency.summary()
+        logging.info(
+            "Mouse latency: %s events, %s snapping hits, "
+            "p50 %s ms, p95 %s ms, p99 %s ms, %s coalesced moves.",
+            summary["events"],
+            summary["snapping_hits"],
+            *(
+                "-" if summary[key] is None else "{:.3f}".format(summary[key])
+                for key in ("p50", "p95", "p99")
+            ),
+            self.dropped_moves,
+        )
+        if hasattr(self.mouse.queue, "metrics"):
+            logging.info("Mouse queue: %s", self.mouse.queue.metrics())
+        if self.screenshots is not None:
+            logging.info("Screenshots cache: %s", self.screenshots.metrics())
 
     def mouse_scroll(self, counter=False):
         """Cycles through window corners in both directions.
@@ -870,15 +1369,20 @@ class BaseController:
         :type x: int
         :var y: absolute vertical axis mouse position in pixels
         :type y: int
+        :var width: root window width
+        :type width: int
+        :var height: root window height
+        :type height: int
         """
-        x = self.view.master.winfo_x() + Settings.SHIFT_CURSOR
-        y = self.view.master.winfo_y() + Settings.SHIFT_CURSOR
+        x, y, width, height = self.get_root_geometry()
+        x += Settings.SHIFT_CURSOR
+        y += Settings.SHIFT_CURSOR
 
         if self.state % 3:
-            x += self.view.master.winfo_width() - 2 * Settings.SHIFT_CURSOR
+            x += width - 2 * Settings.SHIFT_CURSOR
 
         if self.state // 2:
-            y += self.view.master.winfo_height() - 2 * Settings.SHIFT_CURSOR
+            y += height - 2 * Settings.SHIFT_CURSOR
 
         self.mouse.move_cursor(x, y)
         self.setup_corner()
@@ -896,7 +1400,7 @@ class BaseController:
     def place_on_opposite_corner(self):
         """Changes and moves cursor to model windows corner opposite to positioning phase
 
-        and so triggers master resizing.
+        and resizes master to model window's size together with the cursor move.
 
         :var left: x-axis part of the cursor position
         :type left: int
@@ -910,7 +1414,7 @@ class BaseController:
             top = (
                 min(
                     self.model.changed_y + self.model.h,
-                    self.view.master.winfo_screenheight(),
+                    self.get_screen_size()[1],
                 )
                 - Settings.SHIFT_CURSOR
             )
@@ -918,23 +1422,73 @@ class BaseController:
             left = (
                 min(
                     self.model.changed_x + self.model.w,
-                    self.view.master.winfo_screenwidth(),
+                    self.get_screen_size()[0],
                 )
                 - Settings.SHIFT_CURSOR
             )
 
+        self.apply_geometry(*self.get_resized_rect(left, top))
         self.mouse.move_cursor(left, top)
         self.setup_corner()
 
+    def prefetch_screenshots(self):
+        """Grabs raw images of the upcoming windows and prepares them in background.
+
+        Only the windows on current model's workspace are grabbed, as the windows
+        on other workspaces aren't visible. Raw images are taken from desktop
+        snapshot if possible. Screenshots of the windows not being among upcoming
+        anymore are dropped.
+
+        :var count: number of the upcoming windows
+        :type count: int
+        :var models: upcoming windows models on the current workspace
+        :type models: list of :class:`WindowModel`
+        :var grabbed: raw image, offset and window box inside image
+        :type grabbed: (:class:`PIL.Image.Image`, (int, int), tuple)
+        """
+        count = get_value_if_valid_type(Settings.SCREENSHOT_PREFETCH_COUNT, int)
+        if not count or Settings.SCREENSHOT_DISABLED:
+            return True
+
+        models = [
+            model
+            for model in self.app.collector.collection.get_next_models(
+                self.model.wid, count
+            )
+            if model.workspace == self.model.workspace
+        ]
+        self.prefetcher.retain([model.wid for model in models])
+        for model in models:
+            if model.wid in self.prefetcher:
+                continue
+            grabbed = self.get_snapshot_image(model)
+            if grabbed is not None:
+                grabbed = (grabbed[0], (0, 0), grabbed[1])
+            else:
+                grabbed = self.app.grab_window_image(model)
+                if grabbed is None:
+                    continue
+                grabbed = (*grabbed, None)
+            self.prefetcher.put(
+                model.wid,
+                self.get_screenshot_key(model),
+                grabbed[0],
+                grabbed[1],
+                blur_size=Settings.SCREENSHOT_BLUR_PIXELS,
+                grayscale=Settings.SCREENSHOT_TO_GRAYSCALE,
+                downscale=Settings.SCREENSHOT_DOWNSCALE_FACTOR,
+                size=self.get_screen_size(),
+                box=grabbed[2],
+            )
+        return None
+
     def recapture_mouse(self):
         """Starts mouse listener and positioning/resizing routine."""
         self.view.setup_bindings()
         self.state = Settings.LOCATE
         self.set_default_geometry(self.view.master)
-        self.mouse.move_cursor(
-            self.view.master.winfo_x() + Settings.SHIFT_CURSOR,
-            self.view.master.winfo_y() + Settings.SHIFT_CURSOR,
-        )
+        x, y = self.get_root_geometry()[:2]
+        self.mouse.move_cursor(x + Settings.SHIFT_CURSOR, y + Settings.SHIFT_CURSOR)
         self.setup_corner()
         self.display_message("")
         self.mouse.start()
@@ -949,20 +1503,12 @@ class BaseController:
         self.display_message(MESSAGES["msg_capture_mouse"])
 
     def remove_listed_window(self, wid):
-        """Destroys window widget from windows list and refreshes the list afterward.
+        """Removes window from windows list and refreshes the list afterward.
 
-        :param wid: id of window that will be destroyed
+        :param wid: id of window that will be removed
         :type wid: int
         """
-        try:
-            next(
-                widget
-                for widget in self.view.windows.winfo_children()
-                if widget.wid == wid
-            ).destroy()
-        except StopIteration:
-            pass
-        self.view.windows.place_children()
+        self.view.windows.remove_window(wid)
 
     def resizing_state_counterpart(self):
         """Returns resizing counterpart to current positioning state."""
@@ -973,7 +1519,21 @@ class BaseController:
         self.app.run_task("save_default")
 
     def shutdown(self):
-        """Stops mouse listener, destroys Tkinter root window and exits."""
+        """Stops mouse listener, destroys Tkinter root window and exits.
+
+        Mouse latency statistics are logged before if LATENCY_STATS setting is set,
+        events trace file is closed if events are recorded, screenshots
+        prefetcher's worker thread is stopped if it's created, mouse wakeup
+        pipe is removed from Tkinter and closed and platform cleanup is run.
+        """
+        if Settings.LATENCY_STATS is True:
+            self.log_latency_stats()
+        if self.recorder is not None:
+            self.recorder.close()
+        if self.prefetcher is not None:
+            self.prefetcher.shutdown()
+        self.remove_mouse_wakeup()
+        self.app.run_task("shutdown_cleanup")
         self.mouse.stop()
         self.view.master.destroy()
         sys.exit(0)
@@ -988,9 +1548,7 @@ class BaseController:
         :param y: absolute vertical axis mouse position in pixels
         :type y: int
         """
-        self.view.master.geometry(
-            "{}x{}+{}+{}".format(Settings.MIN_WIDTH, Settings.MIN_HEIGHT, x, y)
-        )
+        self.apply_geometry(x, y, Settings.MIN_WIDTH, Settings.MIN_HEIGHT)
 
     def set_timer(self):
         """Cancels previous timer if it exists and creates a new one."""
@@ -1034,17 +1592,49 @@ class BaseController:
         )
         self.display_message(MESSAGES["msg_switch_workspace"])
 
+    def take_desktop_snapshot(self):
+        """Schedules grabbing of all the monitors images
+
+        if model's workspace isn't grabbed yet.
+
+        Empty snapshot for model's workspace is set right away, so windows
+        screenshots are grabbed separately until the images are grabbed by
+        :func:`grab_desktop_snapshot`. Grabbing is deferred for
+        SCREENSHOT_DESKTOP_GRAB_DELAY milliseconds after pending Tkinter tasks
+        are processed, so workspace switch and root window geometry changes
+        are shown on the screen by then. Nothing is grabbed if
+        SCREENSHOT_DESKTOP_GRAB setting isn't set.
+
+        :returns: Boolean
+        """
+        if Settings.SCREENSHOT_DESKTOP_GRAB is not True or Settings.SCREENSHOT_DISABLED:
+            return True
+        if (
+            self.snapshot is not None
+            and self.snapshot.workspace == self.model.workspace
+        ):
+            return True
+
+        self.snapshot = DesktopSnapshot(self.model.workspace, [], set())
+        self.view.master.update_idletasks()
+        self.view.master.after(
+            Settings.SCREENSHOT_DESKTOP_GRAB_DELAY,
+            self.grab_desktop_snapshot,
+            self.snapshot,
+        )
+        return None
+
     def workspace_activated_by_digit(self, number):
         """Activates workspace with humanized number equal to provided number.
 
         :param number: number of 1 to 9 representing workspace
         :type number: int
-        :var workspaces: available workspaces in view
-        :type workspaces: :class:`WorkspacesCollection`
+        :var workspace: number of workspace on related position in view
+        :type workspace: int
         """
-        workspaces = self.view.workspaces.winfo_children()
-        if len(workspaces) >= number:
-            self.workspace_activated(workspaces[number - 1].number)
+        workspace = self.view.workspaces.get_number(number - 1)
+        if workspace is not None:
+            self.workspace_activated(workspace)
 
     ## EVENTS CALLBACKS
     def on_continue(self, event):
@@ -1052,6 +1642,17 @@ class BaseController:
         self.recapture_mouse()
         return "break"
 
+    def on_configure(self, event):
+        """Updates cached root window geometry from root's configure event.
+
+        Configure events of root's children are ignored.
+
+        :param event: catched event
+        :type event: Tkinter event
+        """
+        if event.widget is self.view.master:
+            self.root_geometry = [event.x, event.y, event.width, event.height]
+
     def on_focus(self, event):
         """Calls task top activate root if Tkinter has lost focus."""
         if self.view.focus_get() is None:
@@ -1062,9 +1663,14 @@ class BaseController:
     def on_key_pressed(self, event):
         """Calls method related to pressed key.
 
+        Pressed key is recorded if events recorder exists.
+
         :param event: catched event
         :type event: Tkinter event
         """
+        if self.recorder is not None:
+            self.recorder.record("k", event.keysym)
+
         if event.keysym in ("Escape",):
             self.shutdown()
 
@@ -1080,6 +1686,9 @@ class BaseController:
         elif event.keysym in ("M", "m"):
             self.switch_restored()
 
+        elif event.keysym in ("S", "s"):
+            self.log_latency_stats()
+
         elif event.keysym in ("Alt_L", "Alt_R", "Shift_L", "Shift_R"):
             self.release_mouse()
 
@@ -1138,29 +1747,70 @@ class BaseController:
 
     ## MAIN LOOPS
     def check_mouse(self):
+        """Dispatches queued mouse events and calls itself in regular interval
+
+        defined in settings.
+        """
+        self.dispatch_mouse_events()
+        self.view.master.after(Settings.MOUSE_CHECK_INTERVAL, self.check_mouse)
+
+    def dispatch_mouse_events(self):
         """Runs method that corresponds to retrieved item from mouse queue.
 
         There are only two possibilities for item type: Boolean (scroll direction)
         or tuple (mouse position).
 
-        Method calls itself in regular interval defined in settings.
+        If MOUSE_COALESCE_MOVES setting is set then only the newest of consecutive
+        mouse positions is processed and the skipped ones are counted in
+        ``dropped_moves``. Pending position is processed before any scroll event
+        so the order of moves and scrolls stays the same. All the retrieved items
+        are recorded if events recorder exists.
+
+        :var position: the newest position waiting to be processed
+        :type position: (int, int) or None
         """
+        position = None
         while True:
             item = self.mouse.get_item()
             if item is None:
                 break
+            if self.recorder is not None:
+                self.recorder.record_item(item)
             if isinstance(item, bool):
+                if position is not None:
+                    self.view.master.after_idle(self.mouse_move, *position)
+                    position = None
                 self.view.master.after_idle(self.mouse_scroll, item)
+            elif Settings.MOUSE_COALESCE_MOVES:
+                if position is not None:
+                    self.dropped_moves += 1
+                position = item
             else:
                 self.view.master.after_idle(self.mouse_move, *item)
 
-        self.view.master.after(Settings.MOUSE_CHECK_INTERVAL, self.check_mouse)
+        if position is not None:
+            self.view.master.after_idle(self.mouse_move, *position)
 
     def mainloop(self):
-        """Tkinter main loop."""
-        self.view.master.after(Settings.MOUSE_CHECK_INTERVAL, self.check_mouse)
+        """Tkinter main loop.
+
+        If MOUSE_EVENT_DRIVEN setting is set then mouse events are dispatched only
+        when mouse listener signals they exist, otherwise mouse queue is polled.
+        Polling is also used if mouse wakeup can't be set on this platform.
+        """
+        if not Settings.MOUSE_EVENT_DRIVEN or self.setup_mouse_wakeup():
+            self.view.master.after(Settings.MOUSE_CHECK_INTERVAL, self.check_mouse)
         self.view.mainloop()
 
+    def on_mouse_wakeup(self, *args):
+        """Clears mouse wakeup signal and dispatches queued mouse events.
+
+        :param args: file descriptor and event mask provided by Tkinter
+        :type args: tuple
+        """
+        self.mouse.clear_wakeup()
+        self.dispatch_mouse_events()
+
 
 class BaseCollector:
     """Base Collector class holding common code for all the platforms.
@@ -1248,22 +1898,76 @@ class BaseMouse:
     """Class responsible for listening and controlling system-wide mouse events.
 
     :var queue: mouse events queue
-    :type queue: :class:`queue.Queue`
+    :type queue: :class:`EventsRingBuffer` or :class:`queue.Queue`
     :var listener: class as separate thread listening for mouse events
     :type listener: :class:`pynput.mouse.Listener`
     :var control: class for retrieving and setting cursor position
     :type control: :class:`pynput.mouse.Controller`
+    :var wakeup_reader: file descriptor of wakeup pipe read by Tkinter
+    :type wakeup_reader: int
+    :var wakeup_writer: file descriptor of wakeup pipe written by listener
+    :type wakeup_writer: int
+    :var signaled: is wakeup signal sent and not yet cleared
+    :type signaled: Boolean
+    :var timestamped: should capture time be added to mouse positions
+    :type timestamped: Boolean
+    :var warps: pending cursor warps as (position, expiration time) tuples
+    :type warps: :class:`collections.deque`
+    :var warps_lock: lock guarding warps collection used from both threads
+    :type warps_lock: :class:`threading.Lock`
+    :var suppressed: number of suppressed warp echo events
+    :type suppressed: int
     """
 
     queue = None
     listener = None
     control = None
+    wakeup_reader = None
+    wakeup_writer = None
+    signaled = False
+    timestamped = False
+    warps = None
+    warps_lock = None
+    suppressed = 0
 
     def __init__(self):
-        """Instatiates and sets queue."""
-        self.queue = queue.Queue()
+        """Instatiates and sets queue.
+
+        Fixed-capacity ring buffer is used as the queue if MOUSE_BUFFER_SIZE
+        setting is a positive integer, otherwise unbounded :class:`queue.Queue`
+        is created.
+
+        :var size: ring buffer capacity
+        :type size: int or None
+        """
+        size = get_value_if_valid_type(Settings.MOUSE_BUFFER_SIZE, int)
+        self.queue = EventsRingBuffer(size) if size else queue.Queue()
+        self.timestamped = Settings.LATENCY_STATS is True
+        self.warps = deque(maxlen=16)
+        self.warps_lock = threading.Lock()
         self.control = pynput.mouse.Controller()
 
+    def clear_wakeup(self):
+        """Reads all the pending bytes from wakeup pipe and resets wakeup signal.
+
+        Signal is reset only after the pipe is emptied, so a byte written by
+        listener in between is never drained while signal stays set.
+        """
+        if self.wakeup_reader is not None:
+            try:
+                while os.read(self.wakeup_reader, 4096):
+                    pass
+            except BlockingIOError:
+                pass
+        self.signaled = False
+
+    def close_wakeup(self):
+        """Closes wakeup pipe file descriptors if they are opened."""
+        for fd in (self.wakeup_reader, self.wakeup_writer):
+            if fd is not None:
+                os.close(fd)
+        self.wakeup_reader, self.wakeup_writer = None, None
+
     def cursor_position(self):
         """Returns current cursor position.
 
@@ -1281,13 +1985,60 @@ class BaseMouse:
         except queue.Empty:
             return None
 
+    def is_warp_echo(self, position):
+        """Checks is provided position reported by listener as the result of
+
+        programmatic cursor warp and removes found warp from pending warps.
+
+        Expired warps are removed first, so an echo that has never arrived
+        can't suppress later user's move to the same position.
+
+        :param position: absolute mouse position in pixels
+        :type position: (int, int)
+        :var now: current performance counter value
+        :type now: float
+        :returns: Boolean
+        """
+        now = perf_counter()
+        with self.warps_lock:
+            while self.warps and self.warps[0][1] < now:
+                self.warps.popleft()
+            for warp in self.warps:
+                if warp[0] == position:
+                    self.warps.remove(warp)
+                    return True
+        return False
+
     def move_cursor(self, x, y):
-        """Moves cursor position to a point defined by provided x and y."""
+        """Moves cursor position to a point defined by provided x and y.
+
+        Warp is remembered before the move, so listener's echo of it is recognized
+        by :func:`is_warp_echo` and not put in queue.
+        """
+        with self.warps_lock:
+            self.warps.append(
+                ((int(x), int(y)), perf_counter() + Settings.WARP_ECHO_TIMEOUT)
+            )
         self.control.position = (x, y)
 
+    def open_wakeup(self):
+        """Creates non-blocking pipe for waking up Tkinter thread and returns
+
+        its file descriptor to be read from.
+
+        :returns: int
+        """
+        self.wakeup_reader, self.wakeup_writer = os.pipe()
+        os.set_blocking(self.wakeup_reader, False)
+        os.set_blocking(self.wakeup_writer, False)
+        return self.wakeup_reader
+
     def on_move(self, x, y):
         """Puts provided x and y in queue as position tuple.
 
+        Performance counter value is added to position if ``timestamped`` is set.
+        Echoes of cursor warps made by :func:`move_cursor` are counted and dropped.
+
         NOTE: int(x) and int(y) are needed for Darwin - making a specific
         platform mouse module just for that is avoided.
 
@@ -1296,7 +2047,12 @@ class BaseMouse:
         :param y: absolute vertical axis mouse position in pixels
         :type y: int
         """
-        self.queue.put((int(x), int(y)))
+        position = (int(x), int(y))
+        if self.warps and self.is_warp_echo(position):
+            self.suppressed += 1
+            return
+        self.queue.put(position + (perf_counter(),) if self.timestamped else position)
+        self.signal()
 
     def on_scroll(self, x, y, dx, dy):
         """Puts scroll direction as Boolean value in queue.
@@ -1314,6 +2070,20 @@ class BaseMouse:
         :type dy: int
         """
         self.queue.put(dy > 0)
+        self.signal()
+
+    def signal(self):
+        """Writes a byte to wakeup pipe if it's opened and not already signaled.
+
+        Only a single byte is written until Tkinter thread clears the signal,
+        so the pipe can't be filled no matter how many events are queued.
+        """
+        if self.wakeup_writer is not None and not self.signaled:
+            self.signaled = True
+            try:
+                os.write(self.wakeup_writer, b"\0")
+            except OSError:
+                pass
 
     def start(self):
         """Initializes and starts listener for move and scroll events."""
@@ -276,6 +276,24 @@ class WindowsCollection:
         except StopIteration:
             return None
 
+    def get_next_models(self, wid, count):
+        """Returns up to ``count`` models following the one with provided wid.
+
+        :param wid: window id (xid, hwnd, ...)
+        :type wid: int
+        :param count: maximum number of returned models
+        :type count: int
+        :var index: index of model with provided wid
+        :type index: int
+        :returns: list of WindowModel instances
+        """
+        index = next(
+            (i for i, model in enumerate(self._members) if model.wid == wid), None
+        )
+        if index is None:
+            return []
+        return self._members[index + 1 : index + 1 + count]
+
     def repopulate_for_wid(self, wid, remove_before):
         """Repopulates collection starting from the window with identifier ``wid``
 
@@ -0,0 +1,287 @@
+# arrangeit - cross-platform desktop utility for easy windows management
+# Copyright (C) 1999-2019 Ivica Paleka
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+
+import json
+from collections import deque
+from itertools import count
+from queue import Empty
+from time import perf_counter
+
+TRACE_HEADER = {"format": "arrangeit-trace", "version": 1}
+
+
+def read_trace(filename):
+    """Yields events from trace file with provided name created by :class:`EventsRecorder`
+
+    as (elapsed, kind, value) tuples where kind is "m" for mouse position,
+    "s" for mouse scroll direction and "k" for pressed key symbol.
+
+    :param filename: trace file path
+    :type filename: str
+    :var header: trace file's first line data
+    :type header: dict
+    :returns: generator of (float, str, object)
+    """
+    with open(filename, "r") as trace:
+        header = json.loads(next(trace, "{}"))
+        if header.get("format") != TRACE_HEADER["format"]:
+            raise ValueError("{} isn't arrangeit trace file.".format(filename))
+        for line in trace:
+            if line.strip():
+                elapsed, kind, value = json.loads(line)
+                yield (elapsed, kind, tuple(value) if kind == "m" else value)
+
+
+class EventsRingBuffer:
+    """Fixed-capacity buffer of mouse events with the interface of :class:`queue.Queue`
+
+    used by mouse listener thread as producer and Tkinter thread as consumer.
+
+    Positions are kept in a ring of provided capacity where the newest position
+    overwrites the oldest one if consumer can't keep up, so stale positions aren't
+    replayed after consumer stalls. Scroll directions (Boolean items) are never
+    dropped. Both collections are :class:`collections.deque` instances which
+    appends and pops are atomic, so no locking is needed for a single producer
+    and a single consumer. Items are tagged with sequence number from shared
+    counter and they are returned in the order they are put in buffer.
+
+    :var moves: ring of (sequence, position) tuples
+    :type moves: :class:`collections.deque`
+    :var scrolls: (sequence, direction) tuples
+    :type scrolls: :class:`collections.deque`
+    :var sequence: sequence numbers generator
+    :type sequence: :class:`itertools.count`
+    :var overwritten: number of positions dropped because of the full ring
+    :type overwritten: int
+    :var high_water: the biggest number of positions found in ring
+    :type high_water: int
+    """
+
+    moves = None
+    scrolls = None
+    sequence = None
+    overwritten = 0
+    high_water = 0
+
+    def __init__(self, capacity):
+        """Creates empty collections with positions ring of provided capacity.
+
+        :param capacity: maximum number of positions kept in buffer
+        :type capacity: int
+        """
+        self.moves = deque(maxlen=capacity)
+        self.scrolls = deque()
+        self.sequence = count()
+
+    def __len__(self):
+        """Returns number of all the items in buffer."""
+        return len(self.moves) + len(self.scrolls)
+
+    @property
+    def capacity(self):
+        """Returns maximum number of positions kept in buffer.
+
+        :returns: int
+        """
+        return self.moves.maxlen
+
+    def get(self, block=False):
+        """Removes and returns the oldest item from buffer.
+
+        Buffer is never blocking, ``block`` argument is here just for
+        compatibility with :class:`queue.Queue`.
+
+        :param block: ignored
+        :type block: Boolean
+        :var collection: collection holding the oldest item
+        :type collection: :class:`collections.deque`
+        :returns: (int, int) or Boolean
+        """
+        if self.moves and (not self.scrolls or self.moves[0][0] < self.scrolls[0][0]):
+            collection = self.moves
+        elif self.scrolls:
+            collection = self.scrolls
+        else:
+            raise Empty
+        return collection.popleft()[1]
+
+    def metrics(self):
+        """Returns dictionary with buffer usage metrics.
+
+        :returns: dict
+        """
+        return {
+            "capacity": self.capacity,
+            "size": len(self),
+            "high_water": self.high_water,
+            "overwritten": self.overwritten,
+        }
+
+    def put(self, item):
+        """Adds provided item to buffer.
+
+        If ring is full then the oldest position is dropped and counted.
+
+        :param item: mouse position or scroll direction
+        :type item: (int, int) or Boolean
+        """
+        if isinstance(item, bool):
+            self.scrolls.append((next(self.sequence), item))
+            return
+
+        if len(self.moves) == self.moves.maxlen:
+            self.overwritten += 1
+        self.moves.append((next(self.sequence), item))
+        self.high_water = max(self.high_water, len(self.moves))
+
+
+class LatencyStats:
+    """Rolling statistics of latencies from mouse event capture to its application.
+
+    Only the latest ``window`` latencies are kept for percentiles calculation,
+    while events and snapping hits are counted for the whole session.
+
+    :var samples: latest latencies in seconds
+    :type samples: :class:`collections.deque`
+    :var events: number of all recorded events
+    :type events: int
+    :var snapping_hits: number of recorded events that ended up in snapping
+    :type snapping_hits: int
+    """
+
+    samples = None
+    events = 0
+    snapping_hits = 0
+
+    def __init__(self, window=1000):
+        """Creates empty samples collection of provided size.
+
+        :param window: number of the latest latencies kept
+        :type window: int
+        """
+        self.samples = deque(maxlen=window)
+
+    def percentile(self, percent):
+        """Returns provided percentile of kept latencies in milliseconds
+
+        calculated by nearest-rank method.
+
+        :param percent: percentile to calculate (0-100)
+        :type percent: int
+        :var ordered: sorted latencies
+        :type ordered: list
+        :returns: float or None
+        """
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        rank = max(0, -(-percent * len(ordered) // 100) - 1)
+        return ordered[rank] * 1000
+
+    def record(self, latency, snapped=False):
+        """Adds provided latency and counts event and eventual snapping hit.
+
+        :param latency: time elapsed from event capture in seconds
+        :type latency: float
+        :param snapped: has event ended up in snapping
+        :type snapped: Boolean
+        """
+        self.samples.append(latency)
+        self.events += 1
+        if snapped:
+            self.snapping_hits += 1
+
+    def summary(self):
+        """Returns dictionary with events counters and latency percentiles.
+
+        :returns: dict
+        """
+        return {
+            "events": self.events,
+            "snapping_hits": self.snapping_hits,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+        }
+
+
+class EventsRecorder:
+    """Records mouse items and pressed keys to trace file in JSON lines format.
+
+    The first line holds format header and every other line is a compact
+    ``[elapsed, kind, value]`` list, where elapsed is number of seconds
+    from the start of recording. Trace is read by :func:`read_trace`.
+
+    :var file: opened trace file
+    :type file: file object
+    :var started: performance counter value at the start of recording
+    :type started: float
+    :var events: number of recorded events
+    :type events: int
+    """
+
+    file = None
+    started = None
+    events = 0
+
+    def __init__(self, filename):
+        """Opens trace file with provided name and writes header in it.
+
+        :param filename: trace file path
+        :type filename: str
+        """
+        self.file = open(filename, "w")
+        self.file.write(json.dumps(TRACE_HEADER) + "\n")
+        self.started = perf_counter()
+
+    def close(self):
+        """Closes trace file if it's opened."""
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def record(self, kind, value):
+        """Writes event of provided kind and value to trace file.
+
+        :param kind: "m" for position, "s" for scroll or "k" for key
+        :type kind: str
+        :param value: position, scroll direction or key symbol
+        :type value: (int, int) or Boolean or str
+        """
+        if self.file is None:
+            return
+        self.file.write(
+            json.dumps(
+                [round(perf_counter() - self.started, 4), kind, value],
+                separators=(",", ":"),
+            )
+            + "\n"
+        )
+        self.events += 1
+
+    def record_item(self, item):
+        """Records provided mouse queue item as position or scroll event.
+
+        Eventual event capture time in position item isn't recorded.
+
+        :param item: scroll direction or position with optional capture time
+        :type item: Boolean or tuple
+        """
+        if isinstance(item, bool):
+            self.record("s", item)
+        else:
+            self.record("m", list(item[:2]))
@@ -19,6 +19,7 @@ from PIL import ImageTk
 from Xlib import X
 
 from arrangeit.base import BaseApp
+from arrangeit.linux.capture import CompositeCapture
 from arrangeit.settings import Settings
 from arrangeit.utils import get_prepared_screenshot
 
@@ -28,7 +29,13 @@ from gi.repository import Gdk, Wnck
 
 
 class App(BaseApp):
-    """Main app class with GNU/Linux specific code."""
+    """Main app class with GNU/Linux specific code.
+
+    :var App.capture: windows contents capture through XComposite
+    :type App.capture: :class:`CompositeCapture`
+    """
+
+    capture = None
 
     ## TASKS
     def activate_root(self, wid):
@@ -101,6 +108,11 @@ class App(BaseApp):
         """
         return self._move_window_to_workspace(wid + 1, number)
 
+    def shutdown_cleanup(self):
+        """Closes XComposite capture's connection to X server if it's created."""
+        if self.capture is not None:
+            self.capture.close()
+
     ## HELPERS
     def _activate_workspace(self, number):
         """Activates workspace identified by provided our custom workspace number.
@@ -159,16 +171,52 @@ class App(BaseApp):
         )
 
     ## COMMANDS
-    def grab_window_screen(self, model, root_wid=None):
-        """Grabs and returns screenshot of the window from provided model.
+    def get_stacked_windows(self, workspace):
+        """Returns windows visible on provided workspace ordered from bottom to top.
+
+        :param workspace: workspace number
+        :type workspace: int
+        :var wnck_workspace: Wnck workspace instance
+        :type wnck_workspace: :class:`Wnck.Workspace`
+        :returns: list of (int, (int, int, int, int))
+        """
+        wnck_workspace = self.collector.get_wnck_workspace_for_custom_number(workspace)
+        if not wnck_workspace:
+            return []
+        return [
+            (win.get_xid(), tuple(win.get_geometry()))
+            for win in Wnck.Screen.get_default().get_windows_stacked()
+            if win.get_window_type() != Wnck.WindowType.DESKTOP
+            and win.is_visible_on_workspace(wnck_workspace)
+        ]
+
+    def grab_monitor_image(self, rect):
+        """Grabs and returns raw image of the desktop area defined by provided rect.
+
+        :param rect: monitor rectangle (x, y, width, height)
+        :type rect: (int, int, int, int)
+        :var pixbuf: X11 pixbuf image
+        :type pixbuf: binary data
+        :returns: :class:`PIL.Image.Image` or None
+        """
+        pixbuf = Gdk.pixbuf_get_from_window(Gdk.get_default_root_window(), *rect)
+        if pixbuf is None:
+            return None
+        return self.collector.get_image_from_pixbuf(pixbuf)
+
+    def grab_window_image(self, model):
+        """Grabs and returns raw screenshot of the window from provided model.
 
         We can't include window decoration in image so offset in pixels
-        for both axes is returned.
+        for both axes is returned together with the image.
+
+        Window contents are read through XComposite if SCREENSHOT_BACKEND setting
+        is "composite", falling back to Gdk if that fails.
 
         :param model: model of the window we want screenshot from
         :type model: :class:`WindowModel`
-        :param root_wid: root window identifier - not needed for GNU/Linux
-        :type root_wid: int
+        :var image: window contents captured through XComposite
+        :type image: :class:`PIL.Image.Image`
         :var window: model window instance
         :type window: :class:`Gdk.Window`
         :var pixbuf: X11 pixbuf image
@@ -177,18 +225,50 @@ class App(BaseApp):
         :type width: int
         :var height: window height in pixels without window manager decoration
         :type height: int
-        :returns: (:class:`PIL.ImageTk.PhotoImage`, (int, int))
+        :returns: (:class:`PIL.Image.Image`, (int, int)) or None
         """
+        if Settings.SCREENSHOT_BACKEND == "composite":
+            if self.capture is None:
+                self.capture = CompositeCapture()
+            image = self.capture.grab(model.wid)
+            if image is not None:
+                return (
+                    image,
+                    (model.changed_w - image.width, model.changed_h - image.height),
+                )
+
         window = self._window_from_wid(model.wid)
-        if window is not None:
-            width, height = window.get_width(), window.get_height()
-            pixbuf = Gdk.pixbuf_get_from_window(window, 0, 0, width, height)
+        if window is None:
+            return None
+
+        width, height = window.get_width(), window.get_height()
+        pixbuf = Gdk.pixbuf_get_from_window(window, 0, 0, width, height)
+        return (
+            self.collector.get_image_from_pixbuf(pixbuf),
+            (model.changed_w - width, model.changed_h - height),
+        )
+
+    def grab_window_screen(self, model, root_wid=None):
+        """Grabs and returns prepared screenshot of the window from provided model.
+
+        :param model: model of the window we want screenshot from
+        :type model: :class:`WindowModel`
+        :param root_wid: root window identifier - not needed for GNU/Linux
+        :type root_wid: int
+        :var grabbed: raw image and offset
+        :type grabbed: (:class:`PIL.Image.Image`, (int, int))
+        :returns: (:class:`PIL.ImageTk.PhotoImage`, (int, int))
+        """
+        grabbed = self.grab_window_image(model)
+        if grabbed is not None:
             return (
                 get_prepared_screenshot(
-                    self.collector.get_image_from_pixbuf(pixbuf),
+                    grabbed[0],
                     blur_size=Settings.SCREENSHOT_BLUR_PIXELS,
                     grayscale=Settings.SCREENSHOT_TO_GRAYSCALE,
+                    downscale=Settings.SCREENSHOT_DOWNSCALE_FACTOR,
+                    size=self.controller.get_screen_size(),
                 ),
-                (model.changed_w - width, model.changed_h - height),
+                grabbed[1],
             )
         return ImageTk.PhotoImage(Settings.BLANK_ICON), (0, 0)
@@ -0,0 +1,116 @@
+# arrangeit - cross-platform desktop utility for easy windows management
+# Copyright (C) 1999-2019 Ivica Paleka
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>
+
+from PIL import Image
+from Xlib import X, error
+from Xlib.display import Display
+from Xlib.ext import composite
+
+ALL_PLANES = 0xFFFFFFFF
+COMPOSITE_EXTENSION = "Composite"
+SUPPORTED_DEPTHS = (24, 32)
+
+
+class CompositeCapture:
+    """Captures windows contents from their off-screen storage through XComposite.
+
+    Window is redirected to off-screen storage only for the time of the grab and
+    its contents are read from the pixmap named for that storage. When compositing
+    manager already keeps windows off-screen, that pixmap holds contents of the
+    window even if it's occluded by other windows.
+
+    :var CompositeCapture.display: connection to X server
+    :type CompositeCapture.display: :class:`Xlib.display.Display`
+    :var CompositeCapture.composite: does X server support Composite extension
+    :type CompositeCapture.composite: Boolean
+    """
+
+    display = None
+    composite = False
+
+    def __init__(self):
+        """Connects to X server and checks for Composite extension."""
+        self.display = Display()
+        self.composite = self.display.has_extension(COMPOSITE_EXTENSION)
+
+    def close(self):
+        """Closes connection to X server."""
+        self.display.close()
+
+    def get_image(self, drawable, width, height, border=0):
+        """Returns PIL image created from contents of provided drawable.
+
+        :param drawable: window or pixmap
+        :type drawable: :class:`Xlib.xobject.drawable.Drawable`
+        :param width: image width in pixels
+        :type width: int
+        :param height: image height in pixels
+        :type height: int
+        :param border: image offset from drawable's top left corner for both axes
+        :type border: int
+        :var reply: X server's GetImage reply
+        :type reply: :class:`Xlib.protocol.rq.DictWrapper`
+        :var rawmode: pixels layout in reply data
+        :type rawmode: str
+        :returns: :class:`PIL.Image.Image` or None
+        """
+        reply = drawable.get_image(border, border, width, height, X.ZPixmap, ALL_PLANES)
+        if reply.depth not in SUPPORTED_DEPTHS:
+            return None
+        rawmode = "BGRX" if self.display.info.image_byte_order == X.LSBFirst else "XRGB"
+        return Image.frombytes("RGB", (width, height), reply.data, "raw", rawmode)
+
+    def grab(self, wid):
+        """Returns image with contents of the window identified by provided ``wid``.
+
+        Named pixmap includes window border, so the image is read from inside of it.
+        Window is unredirected and named pixmap is freed right after the grab.
+        None is returned if X server doesn't support Composite extension, window
+        doesn't exist, isn't viewable or its pixels format isn't supported.
+
+        :param wid: window identifier
+        :type wid: int
+        :var window: window resource
+        :type window: :class:`Xlib.xobject.drawable.Window`
+        :var geometry: window geometry
+        :type geometry: :class:`Xlib.protocol.rq.DictWrapper`
+        :var pixmap: window's off-screen storage
+        :type pixmap: :class:`Xlib.xobject.drawable.Pixmap`
+        :returns: :class:`PIL.Image.Image` or None
+        """
+        if not self.composite:
+            return None
+
+        window = self.display.create_resource_object("window", wid)
+        window.composite_redirect_window(
+            composite.RedirectAutomatic, onerror=error.CatchError()
+        )
+        pixmap = None
+        try:
+            geometry = window.get_geometry()
+            pixmap = window.composite_name_window_pixmap()
+            return self.get_image(
+                pixmap, geometry.width, geometry.height, geometry.border_width
+            )
+        except error.XError:
+            return None
+        finally:
+            if pixmap is not None:
+                pixmap.free(onerror=error.CatchError())
+            window.composite_unredirect_window(
+                composite.RedirectAutomatic, onerror=error.CatchError()
+            )
+            self.display.flush()
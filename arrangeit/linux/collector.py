@@ -151,19 +151,28 @@ class Collector(BaseCollector):
     def get_image_from_pixbuf(self, pixbuf):
         """Returns PIL image converted from provided pixbuf.
 
+        Pixels of RGBA pixbuf are used by returned image without copying if every
+        row, the last one included, is rowstride long. Otherwise, and for RGB pixbuf
+        as PIL stores it with four bytes per pixel, pixels are copied.
+
         https://gist.github.com/mozbugbox/10cd35b2872628246140
 
+        :var mode: PIL image mode
+        :type mode: str
+        :var size: image width and height
+        :type size: (int, int)
+        :var pixels: pixbuf pixels data
+        :type pixels: bytes
         :returns: :class:`PIL.Image` instance
         """
         mode = "RGBA" if pixbuf.props.has_alpha else "RGB"
-        return Image.frombytes(
-            mode,
-            (pixbuf.props.width, pixbuf.props.height),
-            pixbuf.get_pixels(),
-            "raw",
-            mode,
-            pixbuf.props.rowstride,
-        )
+        size = (pixbuf.props.width, pixbuf.props.height)
+        pixels = pixbuf.get_pixels()
+        if mode == "RGBA" and len(pixels) >= pixbuf.props.rowstride * size[1]:
+            return Image.frombuffer(
+                mode, size, pixels, "raw", mode, pixbuf.props.rowstride, 1
+            )
+        return Image.frombytes(mode, size, pixels, "raw", mode, pixbuf.props.rowstride)
 
     def get_workspace_number(self, workspace):
         """Returns integer containing screen and workspace numbers of the workspace.
@@ -0,0 +1,339 @@
+# arrangeit - cross-platform desktop utility for easy windows management
+# Copyright (C) 1999-2019 Ivica Paleka
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from PIL import ImageTk
+
+from arrangeit.utils import get_filtered_screenshot
+
+
+class ScreenshotsPrefetcher:
+    """Prepares screenshots of the upcoming windows in a worker thread.
+
+    Raw images are captured by the caller in main thread, as windowing systems
+    calls aren't thread-safe, and only filtering is done in worker thread.
+    Tkinter image is created when prepared screenshot is taken out, since Tkinter
+    may be called only from its own thread.
+
+    Every screenshot is stored together with a key describing window geometry
+    at the time of capture and screenshot is dropped if the key doesn't match
+    when it's taken out.
+
+    :var executor: single worker thread pool
+    :type executor: :class:`concurrent.futures.ThreadPoolExecutor`
+    :var images: (key, offset, future) tuples by window id
+    :type images: :class:`collections.OrderedDict`
+    """
+
+    executor = None
+    images = None
+
+    def __init__(self):
+        """Creates worker thread pool and empty screenshots collection."""
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.images = OrderedDict()
+
+    def __contains__(self, wid):
+        """Returns True if screenshot for provided window id is stored."""
+        return wid in self.images
+
+    def __len__(self):
+        """Returns number of stored screenshots."""
+        return len(self.images)
+
+    def clear(self):
+        """Cancels pending filtering and removes all the stored screenshots."""
+        for _, _, future in self.images.values():
+            future.cancel()
+        self.images.clear()
+
+    def pop(self, wid, key):
+        """Removes and returns Tkinter screenshot and offset for provided window id.
+
+        Waits for filtering to finish if it's still in progress.
+
+        :param wid: window id
+        :type wid: int
+        :param key: current window geometry
+        :type key: tuple
+        :var stored: stored (key, offset, future) tuple
+        :type stored: tuple
+        :returns: (:class:`PIL.ImageTk.PhotoImage`, (int, int)) or None
+        """
+        stored = self.images.pop(wid, None)
+        if stored is None:
+            return None
+
+        if stored[0] != key:
+            stored[2].cancel()
+            return None
+
+        return ImageTk.PhotoImage(stored[2].result()), stored[1]
+
+    def put(
+        self,
+        wid,
+        key,
+        image,
+        offset,
+        blur_size=2,
+        grayscale=False,
+        downscale=1,
+        size=None,
+        box=None,
+    ):
+        """Stores screenshot for provided window id and starts its filtering.
+
+        :param wid: window id
+        :type wid: int
+        :param key: window geometry at the time of capture
+        :type key: tuple
+        :param image: raw screenshot image
+        :type image: :class:`PIL.Image.Image`
+        :param offset: screenshot placement offset (x, y)
+        :type offset: (int, int)
+        :param blur_size: how many pixels in all directions will be blured
+        :type blur_size: int
+        :param grayscale: should image be converted to grayscale
+        :type grayscale: Boolean
+        :param downscale: image size reduction factor used during blurring
+        :type downscale: int
+        :param size: maximum visible size (width, height)
+        :type size: (int, int)
+        :param box: used image part (left, upper, right, lower), whole image if None
+        :type box: (int, int, int, int)
+        """
+        future = self.executor.submit(
+            get_filtered_screenshot,
+            image,
+            blur_size=blur_size,
+            grayscale=grayscale,
+            downscale=downscale,
+            size=size,
+            box=box,
+        )
+        self.images[wid] = (key, offset, future)
+
+    def retain(self, wids):
+        """Removes stored screenshots for windows not in provided window ids.
+
+        :param wids: ids of windows which screenshots are kept
+        :type wids: list
+        """
+        for wid in [wid for wid in self.images if wid not in wids]:
+            self.images.pop(wid)[2].cancel()
+
+    def shutdown(self):
+        """Removes all the stored screenshots and stops worker thread."""
+        self.clear()
+        self.executor.shutdown(wait=False)
+
+
+class ScreenshotsCache:
+    """Least recently used cache of prepared windows screenshots.
+
+    Screenshots are keyed by window id together with window geometry and
+    preparation settings, and only one screenshot per window is kept, so
+    stored screenshot is invalidated as soon as its window is asked for with
+    different geometry. The least recently used screenshots are evicted when
+    estimated memory taken by cached screenshots exceeds provided limit.
+
+    :var images: cached (key, screenshot, offset, memory) tuples by window id
+    :type images: :class:`collections.OrderedDict`
+    :var memory_limit: maximum memory in bytes taken by cached screenshots
+    :type memory_limit: int
+    :var memory: estimated memory in bytes taken by cached screenshots
+    :type memory: int
+    :var hits: number of screenshots found in cache
+    :type hits: int
+    :var misses: number of screenshots not found in cache
+    :type misses: int
+    """
+
+    images = None
+    memory_limit = 0
+    memory = 0
+    hits = 0
+    misses = 0
+
+    def __init__(self, memory_limit):
+        """Creates empty cache with provided memory limit.
+
+        :param memory_limit: maximum memory in bytes taken by cached screenshots
+        :type memory_limit: int
+        """
+        self.images = OrderedDict()
+        self.memory_limit = memory_limit
+
+    def __len__(self):
+        """Returns number of cached screenshots."""
+        return len(self.images)
+
+    @property
+    def hit_rate(self):
+        """Returns fraction of requests found in cache or None without requests.
+
+        :returns: float
+        """
+        requests = self.hits + self.misses
+        return self.hits / requests if requests else None
+
+    def clear(self):
+        """Removes all the screenshots from cache."""
+        self.images.clear()
+        self.memory = 0
+
+    def evict(self):
+        """Removes the least recently used screenshots until memory limit is satisfied.
+
+        Screenshot bigger than the limit is removed too.
+        """
+        while self.memory > self.memory_limit and self.images:
+            self.memory -= self.images.popitem(last=False)[1][3]
+
+    def get(self, wid, key):
+        """Returns cached screenshot and offset for provided window id and key.
+
+        Screenshot cached for the same window with different key is removed.
+
+        :param wid: window id
+        :type wid: int
+        :param key: window geometry and preparation settings
+        :type key: tuple
+        :var cached: cached (key, screenshot, offset, memory) tuple
+        :type cached: tuple
+        :returns: (:class:`PIL.ImageTk.PhotoImage`, (int, int)) or None
+        """
+        cached = self.images.get(wid)
+        if cached is not None and cached[0] == key:
+            self.images.move_to_end(wid)
+            self.hits += 1
+            return cached[1], cached[2]
+
+        if cached is not None:
+            self.remove(wid)
+        self.misses += 1
+        return None
+
+    def metrics(self):
+        """Returns dictionary with cache usage metrics.
+
+        :returns: dict
+        """
+        return {
+            "size": len(self),
+            "memory": self.memory,
+            "memory_limit": self.memory_limit,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+        }
+
+    def put(self, wid, key, screenshot, offset):
+        """Caches provided screenshot and offset for provided window id and key.
+
+        :param wid: window id
+        :type wid: int
+        :param key: window geometry and preparation settings
+        :type key: tuple
+        :param screenshot: prepared screenshot
+        :type screenshot: :class:`PIL.ImageTk.PhotoImage`
+        :param offset: screenshot placement offset (x, y)
+        :type offset: (int, int)
+        :var memory: estimated memory taken by screenshot
+        :type memory: int
+        """
+        self.remove(wid)
+        memory = screenshot.width() * screenshot.height() * 4
+        self.images[wid] = (key, screenshot, offset, memory)
+        self.memory += memory
+        self.evict()
+
+    def remove(self, wid):
+        """Removes screenshot cached for provided window id if it exists.
+
+        :param wid: window id
+        :type wid: int
+        """
+        cached = self.images.pop(wid, None)
+        if cached is not None:
+            self.memory -= cached[3]
+
+
+class DesktopSnapshot:
+    """Monitors images grabbed at once and shared by the windows shown in them.
+
+    :var DesktopSnapshot.workspace: workspace number the images are grabbed on
+    :type DesktopSnapshot.workspace: int
+    :var DesktopSnapshot.monitors: monitors (rect, image) pairs
+    :type DesktopSnapshot.monitors: list of (tuple, :class:`PIL.Image.Image`)
+    :var DesktopSnapshot.visible: identifiers of windows fully visible in images
+    :type DesktopSnapshot.visible: set
+    """
+
+    workspace = None
+    monitors = None
+    visible = None
+
+    def __init__(self, workspace, monitors, visible):
+        """Sets attributes from provided arguments.
+
+        :param workspace: workspace number the images are grabbed on
+        :type workspace: int
+        :param monitors: monitors (rect, image) pairs
+        :type monitors: list of (tuple, :class:`PIL.Image.Image`)
+        :param visible: identifiers of windows fully visible in images
+        :type visible: set
+        """
+        self.workspace = workspace
+        self.monitors = monitors
+        self.visible = visible
+
+    def get(self, wid, rect):
+        """Returns monitor image holding the window and window box inside it.
+
+        Image isn't cropped here, so the box can be passed to screenshot
+        filtering that reads only that part of shared monitor image. None is
+        returned if window isn't fully visible or it isn't placed inside a single
+        monitor.
+
+        :param wid: window id
+        :type wid: int
+        :param rect: window rectangle (x, y, width, height)
+        :type rect: (int, int, int, int)
+        :var left: window position on x-axis relative to monitor
+        :type left: int
+        :var top: window position on y-axis relative to monitor
+        :type top: int
+        :returns: (:class:`PIL.Image.Image`, (int, int, int, int)) or None
+        """
+        if wid not in self.visible:
+            return None
+
+        x, y, width, height = rect
+        for (mx, my, mwidth, mheight), image in self.monitors:
+            left, top = x - mx, y - my
+            if (
+                left >= 0
+                and top >= 0
+                and left + width <= mwidth
+                and top + height <= mheight
+            ):
+                return image, (left, top, left + width, top + height)
+        return None
@@ -48,6 +48,12 @@ SETTINGS = {
     "MIN_WIDTH": (int, 100),
     "MIN_HEIGHT": (int, 40),
     "MOUSE_CHECK_INTERVAL": (int, 5),
+    "MOUSE_BUFFER_SIZE": (int, 64),  # 0 for unbounded queue
+    "MOUSE_COALESCE_MOVES": (bool, True),
+    "MOUSE_EVENT_DRIVEN": (bool, True),
+    "GEOMETRY_IDLE_BATCHING": (bool, False),
+    "LATENCY_STATS": (bool, False),
+    "TRACE_FILE": (str, ""),  # empty for no events tracing
     "SAVE_ON_EXIT": (bool, False),
     "SHIFT_CURSOR": (int, 6),
     "SNAP_PIXELS": (int, 2),
@@ -57,6 +63,12 @@ SETTINGS = {
     "SCREENSHOT_SHIFT_PIXELS": (int, -1),
     "SCREENSHOT_BLUR_PIXELS": (int, 2),
     "SCREENSHOT_TO_GRAYSCALE": (bool, True),
+    "SCREENSHOT_DOWNSCALE_FACTOR": (int, 2),  # 1 for full resolution blurring
+    "SCREENSHOT_BACKEND": (str, "gdk"),  # gdk or composite, used only on GNU/Linux
+    "SCREENSHOT_DESKTOP_GRAB": (bool, False),  # grab monitors once per workspace
+    "SCREENSHOT_DESKTOP_GRAB_DELAY": (int, 200),  # milliseconds
+    "SCREENSHOT_PREFETCH_COUNT": (int, 2),  # 0 for no screenshots prefetching
+    "SCREENSHOTS_CACHE_BYTES": (int, 67108864),  # 0 for no screenshots caching
     "TRANSPARENCY_IS_ON": (bool, True),
     "ROOT_ALPHA": (float, 0.9),
     "ROOT_SIZE": (int, 3),  # 1-4
@@ -78,6 +90,7 @@ SETTINGS = {
     "TITLE_LABEL_PADX": (int, 12),
     "TITLE_LABEL_PADY": (int, 6),
     "PROPERTY_ICON_SIZE": (int, 16),
+    "ICONS_CACHE_BYTES": (int, 4194304),
     "PROPERTY_ICON_PADX": (int, 4),
     "PROPERTY_ICON_PADY": (int, 4),
     "ICON_LABEL_ANCHOR": (str, "n"),
@@ -218,6 +231,7 @@ class Settings(metaclass=SettingsMetaclass):
     ICON_SIZE = 32
     BLANK_ICON = open_image("blank.png")
     CORNER_RECT_INDEXES = [(0, 3), (0, 1), (2, 1), (2, 3)]
+    WARP_ECHO_TIMEOUT = 0.25
     HELP_PAGE_URL = "https://arrangeit.readthedocs.io/en/latest/userguide.html"
     RELEASES_PAGE_URL = "https://github.com/ipaleka/arrangeit/releases"
 
@@ -0,0 +1,293 @@
+# arrangeit - cross-platform desktop utility for easy windows management
+# Copyright (C) 1999-2019 Ivica Paleka
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+
+from bisect import bisect_left
+from itertools import islice
+
+from arrangeit.utils import _intersects
+
+
+def nearest_intersections(sources, targets):
+    """Returns pairs with the closest edges from sources and targets list of Rectangles.
+
+    Unlike :func:`arrangeit.utils.check_intersections` which returns the first pairs
+    found, this function returns the pairs requiring the smallest offset on
+    related axis. If provided targets isn't :class:`SnappingIndex` instance then
+    the index is created from it.
+
+    :param sources: two-tuple or four-tuple of root window snapping rectangles
+    :type sources: tuple of :class:`Rectangle`
+    :param targets: collection of other windows snapping rectangles
+    :type targets: :class:`SnappingIndex` or list of :class:`Rectangle`
+    :returns: :class:`Rectangle` or (:class:`Rectangle`,:class:`Rectangle`) or False
+    """
+    if not isinstance(targets, SnappingIndex):
+        targets = SnappingIndex(targets)
+    return targets.nearest(sources)
+
+
+class SnappingIndex:
+    """Spatial index of snapping rectangles of all the windows in a workspace.
+
+    Horizontal snapping rectangles (ordinals 0 and 2) are kept sorted by their top
+    edge and vertical rectangles (ordinals 1 and 3) by their left edge, so only
+    the rectangles lying in a narrow band around the source rectangle are checked
+    for intersection instead of all the rectangles in the workspace.
+
+    Every window's rectangles are stored under a key (window id) so they can be
+    updated or removed without rebuilding the whole index. Rectangles stored under
+    ``excluded`` key are ignored by all the queries.
+
+    Index behaves like the list of four-tuples it has been created from.
+
+    :var entries: windows snapping rectangles by key in insertion order
+    :type entries: dict (key: (int, four-tuple of :class:`Rectangle`))
+    :var edges: horizontal and vertical sorted lists of (edge, order, key, rectangle)
+    :type edges: ([tuple], [tuple])
+    :var extents: the biggest height of horizontal and width of vertical rectangles
+    :type extents: [int, int]
+    :var excluded: key of the rectangles ignored in queries
+    :type excluded: int or None
+    :var counter: insertion counter used for ordering and for keyless entries
+    :type counter: int
+    """
+
+    entries = None
+    edges = None
+    extents = None
+    excluded = None
+    counter = 0
+
+    def __init__(self, targets=()):
+        """Initializes empty collections and adds all the provided targets.
+
+        :param targets: collection of windows snapping rectangles
+        :type targets: list of four-tuples of :class:`Rectangle`
+        """
+        self.entries = {}
+        self.edges = ([], [])
+        self.extents = [0, 0]
+        for rects in targets:
+            self.append(rects)
+
+    def __eq__(self, other):
+        """Compares targets with the targets of other index or with other list."""
+        if isinstance(other, SnappingIndex):
+            return self.targets == other.targets
+        return self.targets == other
+
+    def __getitem__(self, index):
+        """Returns snapping rectangles four-tuple at provided position."""
+        return self.targets[index]
+
+    def __iter__(self):
+        """Iterates through snapping rectangles four-tuples."""
+        return iter(self.targets)
+
+    def __len__(self):
+        """Returns number of indexed windows."""
+        return len(self.targets)
+
+    def __repr__(self):
+        return "SnappingIndex({!r})".format(self.targets)
+
+    @property
+    def targets(self):
+        """Returns list of all not excluded snapping rectangles four-tuples.
+
+        :returns: list of four-tuples of :class:`Rectangle`
+        """
+        return [
+            rects for key, (_, rects) in self.entries.items() if key != self.excluded
+        ]
+
+    def _edge_entries(self, key, order, rects):
+        """Yields parity and edges list entry for every rectangle in provided rects.
+
+        :param key: window identifier
+        :type key: int
+        :param order: insertion order of the window
+        :type order: int
+        :param rects: four-tuple of window snapping rectangles
+        :type rects: tuple of :class:`Rectangle`
+        :returns: generator of (int, tuple)
+        """
+        for ordinal, rect in enumerate(rects):
+            parity = ordinal % 2
+            yield parity, (
+                rect.x0 if parity else rect.y0,
+                (order, ordinal),
+                key,
+                rect,
+            )
+
+    def _first_pair(self, sources, parity):
+        """Returns first intersecting pair for sources of provided parity.
+
+        Pairs are checked in the same order as in :func:`check_intersections`:
+        source by source, and for the first source having intersections the target
+        added earliest to the index is returned.
+
+        :param sources: two-tuple or four-tuple of root window snapping rectangles
+        :type sources: tuple of :class:`Rectangle`
+        :param parity: 0 for horizontal and 1 for vertical rectangles
+        :type parity: int
+        :var edges: sorted list of (edge, order, key, rectangle) for given parity
+        :type edges: [tuple]
+        :returns: (:class:`Rectangle`, :class:`Rectangle`) or False
+        """
+        edges = self.edges[parity]
+        for source in islice(sources, parity, None, 2):
+            low, high = (source.x0, source.x1) if parity else (source.y0, source.y1)
+            start = bisect_left(edges, (low - self.extents[parity],))
+            end = bisect_left(edges, (high + 1,))
+            found = min(
+                (
+                    (order, target)
+                    for _, order, key, target in edges[start:end]
+                    if key != self.excluded and _intersects(source, target)
+                ),
+                default=None,
+            )
+            if found is not None:
+                return (source, found[1])
+        return False
+
+    def _nearest_pair(self, sources, parity):
+        """Returns intersecting pair with the closest edges for sources of provided parity.
+
+        Starting from the position of source edge found by bisection, sorted edges
+        are traversed in both directions only while they are not farther than the
+        closest edge found so far. Ties are resolved by sources order and then by
+        the order targets are added to the index, so the result doesn't depend on
+        anything but the geometry and the index.
+
+        :param sources: two-tuple or four-tuple of root window snapping rectangles
+        :type sources: tuple of :class:`Rectangle`
+        :param parity: 0 for horizontal and 1 for vertical rectangles
+        :type parity: int
+        :var edges: sorted list of (edge, order, key, rectangle) for given parity
+        :type edges: [tuple]
+        :var best: distance, source ordinal, order and the closest pair found so far
+        :type best: tuple
+        :returns: (:class:`Rectangle`, :class:`Rectangle`) or False
+        """
+        edges = self.edges[parity]
+        best = None
+        for ordinal, source in enumerate(islice(sources, parity, None, 2)):
+            edge, high = (source.x0, source.x1) if parity else (source.y0, source.y1)
+            low = edge - self.extents[parity]
+            position = bisect_left(edges, (edge,))
+            for indexes in (
+                range(position, len(edges)),
+                range(position - 1, -1, -1),
+            ):
+                for index in indexes:
+                    target_edge, order, key, target = edges[index]
+                    distance = abs(target_edge - edge)
+                    if (
+                        not low <= target_edge <= high
+                        or best is not None
+                        and distance > best[0]
+                    ):
+                        break
+                    if key == self.excluded or not _intersects(source, target):
+                        continue
+                    candidate = (distance, ordinal, order, (source, target))
+                    if best is None or candidate[:3] < best[:3]:
+                        best = candidate
+
+        return best[3] if best is not None else False
+
+    def append(self, rects, key=None):
+        """Adds provided window snapping rectangles to the index.
+
+        Previous rectangles stored under the same key are replaced.
+
+        :param rects: four-tuple of window snapping rectangles
+        :type rects: tuple of :class:`Rectangle`
+        :param key: window identifier
+        :type key: int
+        :var order: position of the window in index
+        :type order: int
+        """
+        order = self.counter
+        self.counter += 1
+        if key is None:
+            key = -self.counter
+        self.remove(key)
+
+        self.entries[key] = (order, rects)
+        for parity, entry in self._edge_entries(key, order, rects):
+            rect = entry[3]
+            self.extents[parity] = max(
+                self.extents[parity], rect.x1 - rect.x0 if parity else rect.y1 - rect.y0
+            )
+            self.edges[parity].insert(bisect_left(self.edges[parity], entry), entry)
+
+    def intersections(self, sources):
+        """Returns the same result as :func:`check_intersections` for indexed targets.
+
+        :param sources: two-tuple or four-tuple of root window snapping rectangles
+        :type sources: tuple of :class:`Rectangle`
+        :var even: horizontal intersection pair or False
+        :type even: (:class:`Rectangle`, :class:`Rectangle`)
+        :var odd: vertical intersection pair or False
+        :type odd: (:class:`Rectangle`, :class:`Rectangle`)
+        :returns: :class:`Rectangle` or (:class:`Rectangle`,:class:`Rectangle`) or False
+        """
+        even = self._first_pair(sources, 0)
+        odd = self._first_pair(sources, 1)
+
+        if not even or not odd:
+            return even or odd
+        return (even, odd)
+
+    def nearest(self, sources):
+        """Returns intersecting pairs with the closest edges for provided sources.
+
+        Result is formatted the same way as the result of :func:`check_intersections`.
+
+        :param sources: two-tuple or four-tuple of root window snapping rectangles
+        :type sources: tuple of :class:`Rectangle`
+        :var even: horizontal intersection pair or False
+        :type even: (:class:`Rectangle`, :class:`Rectangle`)
+        :var odd: vertical intersection pair or False
+        :type odd: (:class:`Rectangle`, :class:`Rectangle`)
+        :returns: :class:`Rectangle` or (:class:`Rectangle`,:class:`Rectangle`) or False
+        """
+        even = self._nearest_pair(sources, 0)
+        odd = self._nearest_pair(sources, 1)
+
+        if not even or not odd:
+            return even or odd
+        return (even, odd)
+
+    def remove(self, key):
+        """Removes snapping rectangles stored under provided key from the index.
+
+        :param key: window identifier
+        :type key: int
+        :returns: Boolean
+        """
+        if key not in self.entries:
+            return True
+
+        order, rects = self.entries.pop(key)
+        for parity, entry in self._edge_entries(key, order, rects):
+            del self.edges[parity][bisect_left(self.edges[parity], entry)]
+        return False
@@ -18,6 +18,7 @@ import logging
 import os
 import sys
 from collections import namedtuple
+from functools import lru_cache
 from importlib import import_module
 from itertools import chain, islice, product
 from platform import system
@@ -26,6 +27,8 @@ from PIL import Image, ImageFilter, ImageOps, ImageTk
 
 Rectangle = namedtuple("Rectangle", "x0 y0 x1 y1")
 
+SNAPPING_CACHE_SIZE = 1024
+
 MESSAGES = {"platform_error": "arrangeit can't run on your platform. :("}
 
 
@@ -100,7 +103,92 @@ def get_cursor_name(corner, with_arrow=False):
     return ("ul_angle", "ur_angle", "lr_angle", "ll_angle")[corner]
 
 
-def get_prepared_screenshot(image, blur_size=2, grayscale=False):
+def get_geometry_string(x=None, y=None, width=None, height=None):
+    """Returns Tkinter geometry string from provided position and size.
+
+    Position is included only if both x and y are provided, the same as size
+    for width and height.
+
+    :param x: position on x-axis
+    :type x: int
+    :param y: position on y-axis
+    :type y: int
+    :param width: width in pixels
+    :type width: int
+    :param height: height in pixels
+    :type height: int
+    :returns: str
+    """
+    geometry = ""
+    if width is not None and height is not None:
+        geometry = "{}x{}".format(width, height)
+    if x is not None and y is not None:
+        geometry += "+{}+{}".format(x, y)
+    return geometry
+
+
+def get_filtered_screenshot(
+    image, blur_size=2, grayscale=False, downscale=1, size=None, box=None
+):
+    """Returns provided image blurred and converted to grayscale if needed.
+
+    Only the part of image inside provided box is used, limited to provided size
+    as the part outside of it is never visible in root window. If ``downscale``
+    is greater than 1 then that part is blurred at that many times reduced size
+    and enlarged back afterward, which is a lot cheaper than blurring at full
+    resolution and barely noticeable in already blurred image. Reduced image is
+    read straight from the source image, so no full size copy is made then.
+
+    It doesn't call Tkinter, so it's safe to call it from other threads.
+
+    :param image: raw screenshot image
+    :type image: :class:`PIL.Image.Image`
+    :param blur_size: how many pixels in all directions will be blured
+    :type blur_size: int
+    :param grayscale: should image be converted to grayscale
+    :type grayscale: Boolean
+    :param downscale: image size reduction factor used during blurring
+    :type downscale: int
+    :param size: maximum visible size (width, height)
+    :type size: (int, int)
+    :param box: used image part (left, upper, right, lower), whole image if None
+    :type box: (int, int, int, int)
+    :var width: used image part width
+    :type width: int
+    :var height: used image part height
+    :type height: int
+    :returns: :class:`PIL.Image.Image`
+    """
+    if box is None:
+        box = (0, 0) + image.size
+    left, top = box[:2]
+    width, height = box[2] - left, box[3] - top
+    if size is not None:
+        width, height = min(width, size[0]), min(height, size[1])
+    box = (left, top, left + width, top + height)
+
+    if downscale > 1 and blur_size:
+        image = image.resize(
+            (max(width // downscale, 1), max(height // downscale, 1)),
+            Image.BOX,
+            box=box,
+        )
+        if grayscale:
+            image = image.convert("L")
+        return image.filter(ImageFilter.BoxBlur(blur_size / downscale)).resize(
+            (width, height), Image.NEAREST
+        )
+
+    if box != (0, 0) + image.size:
+        image = image.crop(box)
+    if grayscale:
+        image = image.convert("L")
+    return image.filter(ImageFilter.BoxBlur(blur_size))
+
+
+def get_prepared_screenshot(
+    image, blur_size=2, grayscale=False, downscale=1, size=None, box=None
+):
     """Filters provided image and converts it to format suitable for Tkinter.
 
     SCREENSHOT_BLUR_PIXELS defines blur depth in pixels.
@@ -111,13 +199,24 @@ def get_prepared_screenshot(image, blur_size=2, grayscale=False):
     :type blur_size: int
     :param grayscale: should image be converted to grayscale
     :type grayscale: Boolean
+    :param downscale: image size reduction factor used during blurring
+    :type downscale: int
+    :param size: maximum visible size (width, height)
+    :type size: (int, int)
+    :param box: used image part (left, upper, right, lower), whole image if None
+    :type box: (int, int, int, int)
     :returns: :class:`PIL.ImageTk.PhotoImage`
     """
-    if grayscale:
-        return ImageTk.PhotoImage(
-            image.convert("L").filter(ImageFilter.BoxBlur(blur_size))
+    return ImageTk.PhotoImage(
+        get_filtered_screenshot(
+            image,
+            blur_size=blur_size,
+            grayscale=grayscale,
+            downscale=downscale,
+            size=size,
+            box=box,
         )
-    return ImageTk.PhotoImage(image.filter(ImageFilter.BoxBlur(blur_size)))
+    )
 
 
 def get_resized_image(filename, size):
@@ -165,6 +264,32 @@ def get_value_if_valid_type(value, typ):
     return value if isinstance(value, typ) else None
 
 
+def get_visible_wids(stacked, occluders=()):
+    """Returns identifiers of windows not overlapped by windows above them or occluders.
+
+    Windows missing from provided stacked list, like minimized ones, aren't visible.
+
+    :param stacked: (wid, (x, y, width, height)) pairs ordered from bottom to top
+    :type stacked: list
+    :param occluders: rectangles (x, y, width, height) placed above all the windows
+    :type occluders: list
+    :var rectangles: windows and occluders rectangles ordered from bottom to top
+    :type rectangles: list of :class:`Rectangle`
+    :returns: set
+    """
+    rectangles = [
+        Rectangle(x, y, x + width - 1, y + height - 1)
+        for x, y, width, height in [rect for _, rect in stacked] + list(occluders)
+    ]
+    return {
+        wid
+        for index, (wid, _) in enumerate(stacked)
+        if not any(
+            _intersects(rectangles[index], above) for above in rectangles[index + 1 :]
+        )
+    }
+
+
 def increased_by_fraction(value, fraction):
     """Helper method for increasing provided value by provided fraction.
 
@@ -235,11 +360,14 @@ def set_icon(widget):
 
 
 ## SNAPPING
+@lru_cache(maxsize=SNAPPING_CACHE_SIZE)
 def _get_snapping_source_by_ordinal(rect, snap, ordinal=0):
     """Returns snapping rectangle by ordinal from 0 as horizontal top
 
     clockwise to vertical left as 3.
 
+    Results are memoized so provided ``rect`` has to be hashable.
+
     :returns: :class:`Rectangle`
     """
     if ordinal == 0:
@@ -266,6 +394,42 @@ def _get_snapping_source_by_ordinal(rect, snap, ordinal=0):
         )
 
 
+@lru_cache(maxsize=SNAPPING_CACHE_SIZE)
+def _get_snapping_sources_for_rect(rect, snap, corner=None):
+    """Returns memoized snapping rectangles for provided hashable rect.
+
+    This function does the real work for :func:`get_snapping_sources_for_rect`.
+
+    :param rect: window defined by (x, y, width, height)
+    :type rect: tuple (int, int, int, int)
+    :param snap: snapping distance in pixels
+    :type snap: int
+    :returns: two or four-tuple of :class:`Rectangle`
+    """
+    if corner == 0:
+        return (
+            _get_snapping_source_by_ordinal(rect, snap, 0),
+            _get_snapping_source_by_ordinal(rect, snap, 3),
+        )
+    if corner == 1:
+        return (
+            _get_snapping_source_by_ordinal(rect, snap, 0),
+            _get_snapping_source_by_ordinal(rect, snap, 1),
+        )
+    if corner == 2:
+        return (
+            _get_snapping_source_by_ordinal(rect, snap, 2),
+            _get_snapping_source_by_ordinal(rect, snap, 1),
+        )
+    if corner == 3:
+        return (
+            _get_snapping_source_by_ordinal(rect, snap, 2),
+            _get_snapping_source_by_ordinal(rect, snap, 3),
+        )
+    if corner is None:
+        return tuple((_get_snapping_source_by_ordinal(rect, snap, i) for i in range(4)))
+
+
 def _intersects(source, target):
     """Checks does provided rectangle source intersect with provided target rectangle.
 
@@ -369,6 +533,16 @@ def check_intersections(sources, targets):
     return (even, odd)
 
 
+def clear_snapping_cache():
+    """Clears memoized snapping rectangles.
+
+    It should be called after snapping distance setting is changed as there's no
+    point in keeping rectangles for the old distance.
+    """
+    _get_snapping_sources_for_rect.cache_clear()
+    _get_snapping_source_by_ordinal.cache_clear()
+
+
 def get_snapping_sources_for_rect(rect, snap, corner=None):
     """Returns snapping rectangles formated as Rectangle(x0,y0,x0,y0) from provided rect.
 
@@ -380,34 +554,17 @@ def get_snapping_sources_for_rect(rect, snap, corner=None):
     corner (horizontal first, vertical second) where ordinal 0 is top-left corner,
     with clockwise ordering to bottom-left corner which is ordinal 3.
 
+    The same rectangle is repeatedly used both for collection windows and for root
+    window, so the result is memoized in bounded LRU cache by calling
+    :func:`_get_snapping_sources_for_rect` with rect converted to tuple.
+
     :param rect: window defined by (x, y, width, height)
     :type rect: (int, int, int, int)
     :param snap: snapping distance in pixels
     :type snap: int
     :returns: two or four-tuple of :class:`Rectangle`
     """
-    if corner == 0:
-        return (
-            _get_snapping_source_by_ordinal(rect, snap, 0),
-            _get_snapping_source_by_ordinal(rect, snap, 3),
-        )
-    if corner == 1:
-        return (
-            _get_snapping_source_by_ordinal(rect, snap, 0),
-            _get_snapping_source_by_ordinal(rect, snap, 1),
-        )
-    if corner == 2:
-        return (
-            _get_snapping_source_by_ordinal(rect, snap, 2),
-            _get_snapping_source_by_ordinal(rect, snap, 1),
-        )
-    if corner == 3:
-        return (
-            _get_snapping_source_by_ordinal(rect, snap, 2),
-            _get_snapping_source_by_ordinal(rect, snap, 3),
-        )
-    if corner is None:
-        return tuple((_get_snapping_source_by_ordinal(rect, snap, i) for i in range(4)))
+    return _get_snapping_sources_for_rect(tuple(rect), snap, corner)
 
 
 def offset_for_intersections(rectangles, snap):
@@ -429,3 +586,14 @@ def offset_for_intersections(rectangles, snap):
         _offset_for_intersecting_pair(rectangles[1], snap)[0],
         _offset_for_intersecting_pair(rectangles[0], snap)[1],
     )
+
+
+def snapping_cache_info():
+    """Returns hits and misses statistics for memoized snapping rectangles.
+
+    :returns: dict
+    """
+    return {
+        "sources": _get_snapping_sources_for_rect.cache_info(),
+        "ordinal": _get_snapping_source_by_ordinal.cache_info(),
+    }
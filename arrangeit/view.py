@@ -15,7 +15,10 @@
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 
 import gettext
+import hashlib
 import tkinter as tk
+from collections import OrderedDict
+from itertools import islice
 from tkinter.font import ITALIC, NORMAL, nametofont
 
 from PIL import Image, ImageTk
@@ -27,6 +30,180 @@ from arrangeit.utils import increased_by_fraction, open_image, set_icon
 _ = gettext.translation("arrangeit", "arrangeit/locale", fallback=True).gettext
 
 
+class PhotoImagesCache:
+    """Least recently used cache of Tkinter images created from PIL images.
+
+    Images are keyed by their content hash and target size, so the same
+    application icon used by many windows is resized and converted only once.
+    The least recently used images are evicted when estimated memory taken by
+    cached images exceeds provided limit. Evicted image is still valid for as
+    long as widget that shows it holds a reference to it.
+
+    :var images: cached (image, memory) tuples by key
+    :type images: :class:`collections.OrderedDict`
+    :var memory_limit: maximum memory in bytes taken by cached images
+    :type memory_limit: int
+    :var memory: estimated memory in bytes taken by cached images
+    :type memory: int
+    :var hits: number of images found in cache
+    :type hits: int
+    :var misses: number of created images
+    :type misses: int
+    """
+
+    images = None
+    memory_limit = 0
+    memory = 0
+    hits = 0
+    misses = 0
+
+    def __init__(self, memory_limit):
+        """Creates empty cache with provided memory limit.
+
+        :param memory_limit: maximum memory in bytes taken by cached images
+        :type memory_limit: int
+        """
+        self.images = OrderedDict()
+        self.memory_limit = memory_limit
+
+    def __len__(self):
+        """Returns number of cached images."""
+        return len(self.images)
+
+    def clear(self):
+        """Removes all the images from cache."""
+        self.images.clear()
+        self.memory = 0
+
+    def evict(self):
+        """Removes the least recently used images until memory limit is satisfied.
+
+        The most recently used image is never removed.
+        """
+        while self.memory > self.memory_limit and len(self.images) > 1:
+            self.memory -= self.images.popitem(last=False)[1][1]
+
+    def get(self, image, size=None):
+        """Returns Tkinter image for provided PIL image resized to provided size.
+
+        :param image: image to convert
+        :type image: :class:`PIL.Image.Image`
+        :param size: target image size (width, height)
+        :type size: (int, int)
+        :var key: image content hash, mode, size and target size
+        :type key: tuple
+        :returns: :class:`PIL.ImageTk.PhotoImage`
+        """
+        key = (
+            hashlib.blake2b(image.tobytes(), digest_size=16).digest(),
+            image.mode,
+            image.size,
+            size,
+        )
+        cached = self.images.get(key)
+        if cached is not None:
+            self.images.move_to_end(key)
+            self.hits += 1
+            return cached[0]
+
+        self.misses += 1
+        if size is not None and tuple(size) != image.size:
+            image = image.resize(size, Image.ANTIALIAS)
+        photo = ImageTk.PhotoImage(image)
+        memory = image.size[0] * image.size[1] * 4
+        self.images[key] = (photo, memory)
+        self.memory += memory
+        self.evict()
+        return photo
+
+    def set_memory_limit(self, memory_limit):
+        """Sets cache memory limit and evicts images exceeding it.
+
+        :param memory_limit: maximum memory in bytes taken by cached images
+        :type memory_limit: int
+        """
+        self.memory_limit = memory_limit
+        self.evict()
+
+
+class FontsRegistry:
+    """Registry of named Tkinter fonts shared by all the widgets using them.
+
+    Font is created from default Tkinter font for font increase setting
+    the first time it's requested and the same font is returned afterward,
+    so Tk resolves it only once no matter how many widgets use it.
+    Changing registered font's size updates all those widgets at once.
+
+    :var settings: object holding font increase settings as attributes
+    :type settings: :class:`arrangeit.settings.Settings`
+    :var fonts: registered fonts by setting name
+    :type fonts: dict
+    """
+
+    settings = None
+    fonts = None
+
+    def __init__(self, settings):
+        """Creates empty registry using provided settings for fonts sizes.
+
+        :param settings: object holding font increase settings as attributes
+        :type settings: :class:`arrangeit.settings.Settings`
+        """
+        self.settings = settings
+        self.fonts = {}
+
+    def __len__(self):
+        """Returns number of registered fonts."""
+        return len(self.fonts)
+
+    def clear(self):
+        """Removes all the fonts from registry."""
+        self.fonts.clear()
+
+    def get(self, name, **options):
+        """Returns font for font increase setting with provided name.
+
+        :param name: font increase setting name
+        :type name: str
+        :param options: font options used when font is created
+        :type options: dict
+        :var font: registered font
+        :type font: :class:`tkinter.font.Font`
+        :returns: :class:`tkinter.font.Font`
+        """
+        font = self.fonts.get(name)
+        if font is None:
+            font = nametofont("TkDefaultFont").copy()
+            font.configure(size=self.get_size(name), **options)
+            self.fonts[name] = font
+        return font
+
+    def get_size(self, name):
+        """Returns default font size increased by setting with provided name.
+
+        :param name: font increase setting name
+        :type name: str
+        :returns: int
+        """
+        return increased_by_fraction(
+            nametofont("TkDefaultFont")["size"], getattr(self.settings, name)
+        )
+
+    def update(self, name):
+        """Configures registered font for setting with provided name to new size.
+
+        :param name: font increase setting name
+        :type name: str
+        """
+        font = self.fonts.get(name)
+        if font is not None:
+            font.configure(size=self.get_size(name))
+
+
+icons_cache = PhotoImagesCache(Settings.ICONS_CACHE_BYTES)
+fonts = FontsRegistry(Settings)
+
+
 def get_tkinter_root():
     """Initializes and returns Tkinter root window.
 
@@ -198,13 +375,7 @@ class ViewApplication(tk.Frame):
         self.title_label = tk.Label(
             self,
             textvariable=self.title,
-            font=(
-                "TkDefaultFont",
-                increased_by_fraction(
-                    nametofont("TkDefaultFont")["size"],
-                    Settings.TITLE_LABEL_FONT_INCREASE,
-                ),
-            ),
+            font=fonts.get("TITLE_LABEL_FONT_INCREASE"),
             height=Settings.TITLE_LABEL_HEIGHT,
             foreground=Settings.TITLE_LABEL_FG,
             background=Settings.TITLE_LABEL_BG,
@@ -278,6 +449,7 @@ class ViewApplication(tk.Frame):
         """Updates widgets with the data from provided WindowModel instance.
 
         Tkinter needs a reference to image so we create ``icon_image`` reference.
+        Icon image is retrieved from icons cache shared with windows list.
 
         :param model: window data
         :type model: :class:`WindowModel` instance
@@ -285,7 +457,7 @@ class ViewApplication(tk.Frame):
         self.title.set(model.title)
         self.resizable.set_value(model.resizable)
         self.restored.set_value(model.restored)
-        self.icon_image = ImageTk.PhotoImage(model.icon)
+        self.icon_image = icons_cache.get(model.icon)
         self.icon.config(image=self.icon_image)
         self.name.set(model.name)
         self.workspaces.select_active(model.workspace)
@@ -564,20 +736,22 @@ class WorkspacesCollection(tk.Frame):
     :type WorkspacesCollection.master: :class:`tk.Frame`
     :var active: currently active workspace number
     :type active: int
-    :var capacity: number of children workspaces
-    :type capacity: int
+    :var WorkspacesCollection.workspaces: workspaces widgets by workspace number
+    :type WorkspacesCollection.workspaces: :class:`collections.OrderedDict`
     """
 
     master = None
     active = 0
+    workspaces = None
 
     def __init__(self, master=None):
         """Sets master attribute from provided argument
 
-        after super __init__ is called.
+        after super __init__ is called. Sets empty workspaces widgets index.
         """
         super().__init__(master)
         self.master = master
+        self.workspaces = OrderedDict()
         self.config(background=Settings.WORKSPACE_NUMBER_LABEL_BG)
 
     def add_workspaces(self, workspaces):
@@ -588,7 +762,8 @@ class WorkspacesCollection(tk.Frame):
         towards bottom and then too the left,
         Actual workspaces are placed from left to right, then down the same orientation.
         Still, as a design decision, we use the same size for every configuration
-        having less than 5 workspaces.
+        having less than 5 workspaces. Every created widget is deemphasized
+        and indexed by its workspace number.
 
         :param workspaces: list of workspaces two-tuples (number, name)
         :type workspaces: [(int, str)]
@@ -609,41 +784,41 @@ class WorkspacesCollection(tk.Frame):
                 relx=(i % 2) * 0.5,
                 rely=(i // 2) * relheight,
             )
+            widget.set_selected(False)
+            self.workspaces[workspace[0]] = widget
         return None
 
+    def get_number(self, position):
+        """Returns number of workspace on provided position in collection.
+
+        :param position: workspace position starting from 0
+        :type position: int
+        :returns: int or None if there's no workspace on provided position
+        """
+        return next(islice(self.workspaces, position, None), None)
+
     def select_active(self, number):
-        """Emphasizes active workspace and deemphasizes all others.
+        """Emphasizes active workspace and deemphasizes previously active one.
 
-        Foreground text coloured by setting SELECTED_COLOR is used
-        to emphasize selection, together with SELECT_CURSOR setting.
+        As all the other workspaces widgets are already deemphasized,
+        only those two widgets are configured.
 
         :param number: number of workspace to select
         :type number: int
-        :var workspace: child widget
+        :var previous: previously active workspace widget
+        :type previous: :class:`Workspace`
+        :var workspace: workspace widget to select
         :type workspace: :class:`Workspace`
-        :var color: Tkinter color name
-        :type color: str
-        :var cursor: Tkinter cursor name
-        :type cursor: str
-         """
-        workspaces = self.winfo_children()
-        if len(workspaces) < 2:
+        """
+        if len(self.workspaces) < 2:
             return True
 
-        for workspace in workspaces:
-            color = (
-                Settings.SELECTED_COLOR
-                if workspace.number == number
-                else Settings.WORKSPACE_NUMBER_LABEL_FG
-            )
-            workspace.number_label.config(foreground=color)
-            workspace.name_label.config(foreground=color)
-            cursor = (
-                Settings.DEFAULT_CURSOR
-                if workspace.number == number
-                else Settings.SELECT_CURSOR
-            )
-            workspace.config(cursor=cursor)
+        previous = self.workspaces.get(self.active)
+        if previous is not None:
+            previous.set_selected(False)
+        workspace = self.workspaces.get(number)
+        if workspace is not None:
+            workspace.set_selected(True)
 
         self.active = number
         return None
@@ -661,35 +836,116 @@ class WorkspacesCollection(tk.Frame):
 class WindowsList(tk.Frame):
     """Tkinter frame holding titles and small icons of the windows in queue.
 
+    Only the first WINDOWS_LIST_COUNT windows are visible, so widgets are created
+    just for them. Those widgets are kept in a pool and bound to other windows
+    when windows list changes instead of being destroyed and recreated.
+
     :var WindowsList.master: master widget
     :type WindowsList.master: :class:`tk.Frame`
+    :var WindowsList.windows: all the windows tuples (wid, title, icon) by wid
+    :type WindowsList.windows: :class:`collections.OrderedDict`
+    :var WindowsList.widgets: visible widgets by wid in the order of placement
+    :type WindowsList.widgets: :class:`collections.OrderedDict`
+    :var WindowsList.pool: hidden widgets not bound to any visible window
+    :type WindowsList.pool: list of :class:`ListedWindow`
     """
 
     master = None
+    windows = None
+    widgets = None
+    pool = None
 
     def __init__(self, master=None):
         """Sets master attribute from provided argument
 
-        after super __init__ is called.
+        after super __init__ is called. Sets empty windows and widgets indexes
+        and empty widgets pool.
         """
         super().__init__(master)
         self.master = master
+        self.windows = OrderedDict()
+        self.widgets = OrderedDict()
+        self.pool = []
         self.config(background=Settings.WINDOWS_LIST_BG)
 
     def add_windows(self, windows):
-        """Creates children widgets from provided windows list.
+        """Sets windows index from provided windows and updates visible widgets.
 
         :param windows: list of windows tuples (number, title, icon)
         :type windows: [(int, str, :class:`PIL.Image.Image`)]
         """
-        for i, window in enumerate(windows):
-            widget = ListedWindow(self, wid=window[0], title=window[1], icon=window[2])
-            self.place_widget_on_position(widget, i)
+        self.windows = OrderedDict((window[0], window) for window in windows)
+        self.update_rows()
 
     def clear_list(self):
-        """Destroys all children widgets."""
-        for widget in self.winfo_children():
-            widget.destroy()
+        """Empties windows index and hides all the widgets."""
+        self.windows = OrderedDict()
+        self.update_rows()
+
+    def get_wid(self, position):
+        """Returns id of window on provided position in list.
+
+        :param position: window position starting from 0
+        :type position: int
+        :returns: int or None if there's no window on provided position
+        """
+        return next(islice(self.windows, position, None), None)
+
+    def remove_window(self, wid):
+        """Removes window with provided wid from windows index.
+
+        Widgets are updated only if removed window is visible.
+
+        :param wid: window id
+        :type wid: int
+        """
+        if self.windows.pop(wid, None) is not None and wid in self.widgets:
+            self.update_rows()
+
+    def update_rows(self):
+        """Places widgets for the first WINDOWS_LIST_COUNT windows in index.
+
+        Widget already bound to a visible window is placed again only if its
+        position has changed, other visible windows are bound to the widgets
+        not visible anymore or to the widgets from the pool and new widgets are
+        created only if there are no free ones. Free widgets left are hidden
+        if they were visible and together with the pool form the new pool.
+
+        :var visible: windows tuples that should be visible
+        :type visible: list
+        :var positions: current positions of visible widgets
+        :type positions: dict
+        :var stale: visible widgets not bound to any visible window
+        :type stale: list
+        :var free: widgets not bound to any visible window
+        :type free: list
+        :var widgets: widgets bound to visible windows by window id
+        :type widgets: :class:`collections.OrderedDict`
+        """
+        visible = list(islice(self.windows.values(), Settings.WINDOWS_LIST_COUNT))
+        wids = {window[0] for window in visible}
+        positions = {widget: pos for pos, widget in enumerate(self.widgets.values())}
+        stale = [widget for wid, widget in self.widgets.items() if wid not in wids]
+        free = stale + self.pool
+        widgets = OrderedDict()
+        for position, window in enumerate(visible):
+            widget = self.widgets.get(window[0])
+            if widget is None and free:
+                widget = free.pop(0)
+                widget.set_window(*window)
+            elif widget is None:
+                widget = ListedWindow(
+                    self, wid=window[0], title=window[1], icon=window[2]
+                )
+            if positions.get(widget) != position:
+                self.place_widget_on_position(widget, position)
+            widgets[window[0]] = widget
+
+        for widget in free:
+            if widget in stale:
+                widget.place_forget()
+        self.widgets = widgets
+        self.pool = free
 
     def place_widget_on_position(self, widget, position):
         """Configures placement and place provided widget at provided vertical position.
@@ -706,14 +962,6 @@ class WindowsList(tk.Frame):
             rely=position * 1.0 / Settings.WINDOWS_LIST_COUNT,
         )
 
-    def place_children(self):
-        """Place children widgets in order.
-
-        Used after the top widget is destroyed.
-        """
-        for i, widget in enumerate(self.winfo_children()):
-            self.place_widget_on_position(widget, i)
-
     def on_window_label_button_down(self, event):
         """Activates window by wid carried with provided event.
 
@@ -762,6 +1010,27 @@ class Workspace(tk.Frame):
         """
         return str(number % 1000 + 1)
 
+    def set_selected(self, selected):
+        """Emphasizes or deemphasizes widget depending on provided argument.
+
+        Foreground text coloured by setting SELECTED_COLOR is used
+        to emphasize selection, together with SELECT_CURSOR setting
+        for not selected workspaces.
+
+        :param selected: is workspace selected
+        :type selected: Boolean
+        :var color: Tkinter color name
+        :type color: str
+        """
+        color = (
+            Settings.SELECTED_COLOR if selected else Settings.WORKSPACE_NUMBER_LABEL_FG
+        )
+        self.number_label.config(foreground=color)
+        self.name_label.config(foreground=color)
+        self.config(
+            cursor=Settings.DEFAULT_CURSOR if selected else Settings.SELECT_CURSOR
+        )
+
     def setup_widgets(self):
         """Creates and places all the frame's variables and widgets.
 
@@ -771,13 +1040,7 @@ class Workspace(tk.Frame):
         self.number_label = tk.Label(
             self,
             text=self.get_humanized_number(self.number),
-            font=(
-                "TkDefaultFont",
-                increased_by_fraction(
-                    nametofont("TkDefaultFont")["size"],
-                    Settings.WORKSPACE_NUMBER_FONT_INCREASE,
-                ),
-            ),
+            font=fonts.get("WORKSPACE_NUMBER_FONT_INCREASE"),
             foreground=Settings.WORKSPACE_NUMBER_LABEL_FG,
             background=Settings.WORKSPACE_NUMBER_LABEL_BG,
             anchor=Settings.WORKSPACE_NUMBER_LABEL_ANCHOR,
@@ -792,13 +1055,7 @@ class Workspace(tk.Frame):
         self.name_label = tk.Label(
             self,
             text=self.name,
-            font=(
-                "TkDefaultFont",
-                increased_by_fraction(
-                    nametofont("TkDefaultFont")["size"],
-                    Settings.WORKSPACE_NAME_FONT_INCREASE,
-                ),
-            ),
+            font=fonts.get("WORKSPACE_NAME_FONT_INCREASE"),
             height=Settings.WORKSPACE_NAME_LABEL_HEIGHT,
             foreground=Settings.WORKSPACE_NAME_LABEL_FG,
             background=Settings.WORKSPACE_NAME_LABEL_BG,
@@ -866,18 +1123,34 @@ class ListedWindow(tk.Frame):
         self.setup_widgets()
         self.setup_bindings()
 
+    def set_window(self, wid, title, icon):
+        """Binds widget to window with provided wid, title and icon.
+
+        :param wid: window id
+        :type wid: int
+        :param title: window title
+        :type title: str
+        :param icon: window's application icon
+        :type icon: :class:`PIL.Image.Image`
+        """
+        self.wid = wid
+        self.title = title
+        self.icon = self.get_icon_image(icon)
+        self.title_label.config(text=title)
+        self.icon_label.config(image=self.icon)
+
     def get_icon_image(self, icon):
         """Returns provided icon resized and converted to format suitable for Tkinter.
 
+        Image is retrieved from icons cache, so windows sharing the same icon
+        share the same image too.
+
         :param icon: window's application icon
         :type icon: :class:`PIL.Image.Image`
         :returns: :class:`PIL.ImageTk.PhotoImage`
         """
-        return ImageTk.PhotoImage(
-            icon.resize(
-                (int(Settings.ICON_SIZE / 2), int(Settings.ICON_SIZE / 2)),
-                Image.ANTIALIAS,
-            )
+        return icons_cache.get(
+            icon, (int(Settings.ICON_SIZE / 2), int(Settings.ICON_SIZE / 2))
         )
 
     def setup_widgets(self):
@@ -885,13 +1158,7 @@ class ListedWindow(tk.Frame):
         self.title_label = tk.Label(
             self,
             text=self.title,
-            font=(
-                "TkDefaultFont",
-                increased_by_fraction(
-                    nametofont("TkDefaultFont")["size"],
-                    Settings.LISTED_WINDOW_NAME_FONT_INCREASE,
-                ),
-            ),
+            font=fonts.get("LISTED_WINDOW_NAME_FONT_INCREASE"),
             foreground=Settings.LISTED_WINDOW_LABEL_FG,
             background=Settings.LISTED_WINDOW_LABEL_BG,
             anchor=Settings.LISTED_WINDOW_LABEL_ANCHOR,
@@ -963,14 +1230,8 @@ class Statusbar(tk.Frame):
         self.message_label = tk.Label(
             self,
             textvariable=self.message,
-            font=(
-                "TkDefaultFont",
-                increased_by_fraction(
-                    nametofont("TkDefaultFont")["size"],
-                    Settings.STATUSBAR_LABEL_FONT_INCREASE,
-                ),
-                NORMAL,
-                ITALIC,
+            font=fonts.get(
+                "STATUSBAR_LABEL_FONT_INCREASE", weight=NORMAL, slant=ITALIC
             ),
             height=Settings.STATUSBAR_LABEL_HEIGHT,
             foreground=Settings.STATUSBAR_FG,
@@ -1005,13 +1266,7 @@ class Toolbar(tk.Frame):
         """Creates and places all the frame's variables and widgets."""
         options_button = tk.Button(
             self,
-            font=(
-                "TkDefaultFont",
-                increased_by_fraction(
-                    nametofont("TkDefaultFont")["size"],
-                    Settings.TOOLBAR_BUTTON_FONT_INCREASE,
-                ),
-            ),
+            font=fonts.get("TOOLBAR_BUTTON_FONT_INCREASE"),
             text=_("Options"),
             activeforeground=Settings.HIGHLIGHTED_COLOR,
             command=self.on_options_click,
@@ -1027,13 +1282,7 @@ class Toolbar(tk.Frame):
 
         quit_button = tk.Button(
             self,
-            font=(
-                "TkDefaultFont",
-                increased_by_fraction(
-                    nametofont("TkDefaultFont")["size"],
-                    Settings.TOOLBAR_BUTTON_FONT_INCREASE,
-                ),
-            ),
+            font=fonts.get("TOOLBAR_BUTTON_FONT_INCREASE"),
             text=_("Quit"),
             activeforeground=Settings.HIGHLIGHTED_COLOR,
             command=self.master.controller.shutdown,
@@ -171,6 +171,7 @@ class App(BaseApp):
                     self._screenshot_with_thumbnails(model, root_wid),
                     blur_size=Settings.SCREENSHOT_BLUR_PIXELS,
                     grayscale=Settings.SCREENSHOT_TO_GRAYSCALE,
+                    downscale=Settings.SCREENSHOT_DOWNSCALE_FACTOR,
                 ),
                 (-1, -1),
             )
@@ -0,0 +1,141 @@
+# arrangeit - cross-platform desktop utility for easy windows management
+# Copyright (C) 1999-2019 Ivica Paleka
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>
+
+"""Windows capture benchmarks for Gdk and XComposite paths on GNU/Linux.
+
+Unlike the other benchmarks, this one needs a running X server, for example Xvfb::
+
+    $ xvfb-run -s "-screen 0 3840x2160x24" python3 -m tests.benchmarks.capture
+
+Windows of 1080p, 1440p and 4K size are created and every one is partially
+occluded by a smaller window placed over it before it's captured.
+"""
+
+import argparse
+import sys
+
+import gi
+
+gi.require_version("Gdk", "3.0")
+gi.require_version("GdkX11", "3.0")
+from gi.repository import Gdk, GdkX11
+
+from tests.benchmarks.helpers import REPORT_HEADER, measure, report
+
+from arrangeit.linux.capture import CompositeCapture
+from arrangeit.linux.collector import Collector
+
+CAPTURES = (("1080p", (1920, 1080)), ("1440p", (2560, 1440)), ("4K", (3840, 2160)))
+
+
+def create_window(display, size, pixel):
+    """Creates, maps and returns X window of provided size and background.
+
+    :param display: connection to X server
+    :type display: :class:`Xlib.display.Display`
+    :param size: window width and height
+    :type size: (int, int)
+    :param pixel: background pixel value
+    :type pixel: int
+    :returns: :class:`Xlib.xobject.drawable.Window`
+    """
+    screen = display.screen()
+    window = screen.root.create_window(
+        0, 0, size[0], size[1], 0, screen.root_depth, background_pixel=pixel
+    )
+    window.map()
+    display.sync()
+    return window
+
+
+def grab_with_gdk(collector, wid):
+    """Returns image of the window with provided id captured through Gdk.
+
+    :param collector: collector converting pixbuf to image
+    :type collector: :class:`arrangeit.linux.collector.Collector`
+    :param wid: window identifier
+    :type wid: int
+    :var window: Gdk foreign window
+    :type window: :class:`GdkX11.X11Window`
+    :returns: :class:`PIL.Image.Image`
+    """
+    window = GdkX11.X11Window.foreign_new_for_display(
+        GdkX11.X11Display.get_default(), wid
+    )
+    pixbuf = Gdk.pixbuf_get_from_window(
+        window, 0, 0, window.get_width(), window.get_height()
+    )
+    return collector.get_image_from_pixbuf(pixbuf)
+
+
+def benchmark_capture(number):
+    """Yields report lines for windows captured through Gdk and XComposite.
+
+    :param number: how many times every window is captured in a single round
+    :type number: int
+    :var capture: XComposite windows capture
+    :type capture: :class:`CompositeCapture`
+    :returns: generator of str
+    """
+    capture = CompositeCapture()
+    collector = Collector()
+    screen = capture.display.screen()
+    try:
+        for name, size in CAPTURES:
+            window = create_window(capture.display, size, screen.white_pixel)
+            occluder = create_window(
+                capture.display, (size[0] // 2, size[1] // 2), screen.black_pixel
+            )
+            try:
+                yield report(
+                    "capture gdk",
+                    name,
+                    measure(lambda: grab_with_gdk(collector, window.id), number),
+                )
+                if capture.composite:
+                    yield report(
+                        "capture composite",
+                        name,
+                        measure(lambda: capture.grab(window.id), number),
+                    )
+            finally:
+                occluder.destroy()
+                window.destroy()
+                capture.display.sync()
+        if not capture.composite:
+            yield "X server doesn't support Composite extension"
+    finally:
+        capture.close()
+
+
+def main(argv=None):
+    """Parses command line arguments and prints benchmark results.
+
+    :param argv: command line arguments
+    :type argv: list
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    print(REPORT_HEADER)
+    for line in benchmark_capture(args.number):
+        print(line)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,252 @@
+# arrangeit - cross-platform desktop utility for easy windows management
+# Copyright (C) 1999-2019 Ivica Paleka
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>
+
+"""Root window geometry benchmarks for mouse events handling.
+
+Root window is emulated by a bare Tcl interpreter, so every ``winfo`` and
+``geometry`` call is a real Tcl round-trip but without X server's part of it.
+Run from the project's root directory with::
+
+    $ python3 -m tests.benchmarks.geometry [--size 100] [--events 200]
+"""
+
+import argparse
+import random
+import sys
+import tkinter
+from types import SimpleNamespace
+
+from tests.benchmarks.helpers import REPORT_HEADER, measure, report
+from tests.benchmarks.snapping import create_app
+
+from arrangeit.base import BaseController
+from arrangeit.settings import Settings
+
+TCL_ROOT = """
+array set root {x 0 y 0 width 640 height 360}
+proc winfo {option} {
+    global root
+    switch -- $option {
+        screenwidth {return 1920}
+        screenheight {return 1080}
+        default {return $root($option)}
+    }
+}
+proc geometry {value} {
+    global root
+    if {[regexp {^(\\d+)x(\\d+)} $value -> width height]} {
+        set root(width) $width
+        set root(height) $height
+    }
+    if {[regexp {\\+(-?\\d+)\\+(-?\\d+)$} $value -> x y]} {
+        set root(x) $x
+        set root(y) $y
+    }
+}
+proc config {args} {}
+"""
+
+
+class TclMaster:
+    """Root window replacement calling Tcl for every geometry related method.
+
+    :var TclMaster.tk: Tcl interpreter
+    :type TclMaster.tk: :class:`tkinter.Tk`
+    :var TclMaster.calls: number of Tcl round-trips
+    :type TclMaster.calls: int
+    """
+
+    tk = None
+    calls = 0
+
+    def __init__(self):
+        """Creates Tcl interpreter and defines root window procedures in it."""
+        self.tk = tkinter.Tcl()
+        self.tk.eval(TCL_ROOT)
+
+    def _call(self, *args):
+        """Increases round-trips counter and returns Tcl call result.
+
+        :returns: str
+        """
+        self.calls += 1
+        return self.tk.call(*args)
+
+    def config(self, **kwargs):
+        """Calls Tcl config procedure with provided options."""
+        self._call("config", *kwargs.items())
+
+    def geometry(self, value):
+        """Calls Tcl geometry procedure with provided geometry string.
+
+        :param value: Tkinter geometry string
+        :type value: str
+        """
+        self._call("geometry", value)
+
+    def winfo_x(self):
+        """Returns root window position on x-axis from Tcl."""
+        return int(self._call("winfo", "x"))
+
+    def winfo_y(self):
+        """Returns root window position on y-axis from Tcl."""
+        return int(self._call("winfo", "y"))
+
+    def winfo_width(self):
+        """Returns root window width from Tcl."""
+        return int(self._call("winfo", "width"))
+
+    def winfo_height(self):
+        """Returns root window height from Tcl."""
+        return int(self._call("winfo", "height"))
+
+    def winfo_screenwidth(self):
+        """Returns screen width from Tcl."""
+        return int(self._call("winfo", "screenwidth"))
+
+    def winfo_screenheight(self):
+        """Returns screen height from Tcl."""
+        return int(self._call("winfo", "screenheight"))
+
+
+class BenchmarkController(BaseController):
+    """Controller using :class:`TclMaster` instead of Tkinter application."""
+
+    def setup(self):
+        """Sets view attribute to view replacement with Tcl root window.
+
+        Mouse is replaced too as cursor can't be moved without display.
+        """
+        self.mouse = SimpleNamespace(move_cursor=lambda x, y: None)
+        self.view = SimpleNamespace(
+            master=TclMaster(),
+            corner=SimpleNamespace(set_corner=lambda corner: None),
+            workspaces=SimpleNamespace(active=None),
+        )
+
+
+def create_controller(size, seed, state):
+    """Creates and returns controller for windows collection of provided size.
+
+    :param size: number of windows
+    :type size: int
+    :param seed: random generator seed
+    :type seed: int
+    :param state: controller's state
+    :type state: int
+    :returns: :class:`BenchmarkController`
+    """
+    app = create_app(size, seed)
+    controller = BenchmarkController(app)
+    controller.model = app.collector.collection.get_model_by_wid(1)
+    controller.model.set_changed(x=960, y=540)
+    controller.state = state
+    controller.snapping_targets = app.create_snapping_sources(controller.model)
+    controller.view.workspaces.active = controller.model.workspace
+    return controller
+
+
+def create_positions(count, seed):
+    """Returns list of random cursor positions in the lower right screen quarter.
+
+    :param count: number of positions
+    :type count: int
+    :param seed: random generator seed
+    :type seed: int
+    :returns: list of (int, int)
+    """
+    generator = random.Random(seed)
+    return [
+        (generator.randrange(1060, 1920), generator.randrange(640, 1080))
+        for _ in range(count)
+    ]
+
+
+def run_events(controller, positions, cached):
+    """Returns function calling :func:`BaseController.mouse_move` for all positions.
+
+    If ``cached`` is False then geometry cache is cleared before every event,
+    that is the same number of Tcl round-trips as without the cache.
+
+    :param controller: benchmark controller
+    :type controller: :class:`BenchmarkController`
+    :param positions: cursor positions
+    :type positions: list of (int, int)
+    :param cached: should geometry cache be used between events
+    :type cached: Boolean
+    :returns: function
+    """
+
+    def run():
+        for x, y in positions:
+            if not cached:
+                controller.root_geometry = None
+                controller.screen_size = None
+            controller.mouse_move(x, y)
+
+    return run
+
+
+def benchmark_geometry(size, events, seed):
+    """Yields report lines for mouse events handling with and without cache.
+
+    :param size: number of windows
+    :type size: int
+    :param events: number of mouse events per round
+    :type events: int
+    :param seed: random generator seed
+    :type seed: int
+    :returns: generator of str
+    """
+    positions = create_positions(events, seed)
+    for state, phase in ((Settings.LOCATE, "LOCATE"), (Settings.RESIZE + 2, "RESIZE")):
+        for cached in (False, True):
+            controller = create_controller(size, seed, state)
+            function = run_events(controller, positions, cached)
+            per_event = measure(function, 1) / events
+            controller.view.master.calls = 0
+            function()
+            yield report(
+                "mouse_move {} {} ({:.1f} Tcl calls)".format(
+                    phase,
+                    "cached" if cached else "winfo",
+                    controller.view.master.calls / events,
+                ),
+                size,
+                per_event,
+            )
+
+
+def main(argv=None):
+    """Parses command line arguments and prints benchmark results.
+
+    :param argv: command line arguments
+    :type argv: list
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=100)
+    parser.add_argument("--events", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    print(REPORT_HEADER)
+    for line in benchmark_geometry(args.size, args.events, args.seed):
+        print(line)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
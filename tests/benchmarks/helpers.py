@@ -0,0 +1,65 @@
+# arrangeit - cross-platform desktop utility for easy windows management
+# Copyright (C) 1999-2019 Ivica Paleka
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>
+
+"""Helpers shared by arrangeit benchmark modules.
+
+Benchmarks are run as modules from the project's root directory, for example::
+
+    $ python3 -m tests.benchmarks.snapping
+
+so they are never collected by pytest together with the unit tests.
+"""
+
+import os
+from timeit import Timer
+
+os.environ.setdefault("PYNPUT_BACKEND", "dummy")
+
+REPORT_HEADER = "{:<40} {:>8} {:>14} {:>14}".format(
+    "benchmark", "size", "usec/call", "calls/sec"
+)
+
+
+def measure(function, number, repeat=3):
+    """Calls provided function ``number`` times in ``repeat`` rounds
+
+    and returns the best per-call time in seconds.
+
+    :param function: callable without arguments to measure
+    :type function: function
+    :param number: how many times function is called in a single round
+    :type number: int
+    :param repeat: how many rounds are measured
+    :type repeat: int
+    :returns: float
+    """
+    return min(Timer(function).repeat(repeat=repeat, number=number)) / number
+
+
+def report(name, size, per_call):
+    """Returns formatted report line for provided benchmark name and results.
+
+    :param name: benchmark name
+    :type name: str
+    :param size: benchmarked data size
+    :type size: int
+    :param per_call: per-call time in seconds
+    :type per_call: float
+    :returns: str
+    """
+    return "{:<40} {:>8} {:>14.2f} {:>14.0f}".format(
+        name, size, per_call * 1e6, 1 / per_call if per_call else float("inf")
+    )
@@ -0,0 +1,289 @@
+# arrangeit - cross-platform desktop utility for easy windows management
+# Copyright (C) 1999-2019 Ivica Paleka
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>
+
+"""Headless replay of recorded mouse and key events through controller.
+
+Trace is recorded during a real session by setting TRACE_FILE setting in
+user settings file. Run from the project's root directory with::
+
+    $ python3 -m tests.benchmarks.replay [--trace trace.jsonl] [--size 100]
+
+Synthetic trace is used if trace file isn't provided.
+"""
+
+import argparse
+import random
+import sys
+import tracemalloc
+from time import perf_counter, process_time
+from types import SimpleNamespace
+
+from tests.benchmarks.geometry import TclMaster
+from tests.benchmarks.snapping import BenchmarkApp
+
+from arrangeit.base import BaseController
+from arrangeit.data import WindowModel
+from arrangeit.events import LatencyStats, read_trace
+
+SKIPPED_KEYS = ("Escape",)
+
+
+class StubWidget:
+    """Widget replacement accepting any method call.
+
+    Every accessed attribute not set before is a new child stub widget,
+    and calling the stub widget returns the widget itself.
+    """
+
+    def __call__(self, *args, **kwargs):
+        """Returns the widget itself."""
+        return self
+
+    def __getattr__(self, name):
+        """Creates, sets and returns child stub widget with provided name."""
+        child = StubWidget()
+        setattr(self, name, child)
+        return child
+
+    def __iter__(self):
+        """Returns empty iterator as stub widget has no children."""
+        return iter(())
+
+    def __len__(self):
+        """Returns zero as stub widget has no children."""
+        return 0
+
+
+class ReplayMaster(TclMaster):
+    """Tcl root window replacement with Tkinter scheduling methods."""
+
+    def after(self, ms, func=None, *args):
+        """Returns timer id without scheduling provided function."""
+        return "after#replay"
+
+    def after_cancel(self, id):
+        """Does nothing as nothing is scheduled."""
+
+    def after_idle(self, func, *args):
+        """Calls provided function immediately as replay is always idle."""
+        func(*args)
+        return "after#idle"
+
+
+class ReplayMouse:
+    """Mouse replacement keeping cursor position instead of moving real cursor.
+
+    :var ReplayMouse.position: current cursor position
+    :type ReplayMouse.position: (int, int)
+    """
+
+    position = (0, 0)
+
+    def cursor_position(self):
+        """Returns current cursor position."""
+        return self.position
+
+    def move_cursor(self, x, y):
+        """Sets current cursor position to provided x and y."""
+        self.position = (x, y)
+
+    def start(self):
+        """Does nothing as there's no listener."""
+
+    def stop(self):
+        """Does nothing as there's no listener."""
+
+
+class ReplayController(BaseController):
+    """Controller with stub view, replay mouse and no screenshots.
+
+    :var ReplayController.finished: has collection been traversed
+    :type ReplayController.finished: Boolean
+    """
+
+    finished = False
+
+    def __init__(self, app):
+        """Sets attributes the same as parent does, but without events recorder
+
+        so trace file isn't overwritten during replay.
+        """
+        self.app = app
+        self.model = WindowModel()
+        self.latency = LatencyStats()
+        self.setup()
+
+    def set_screenshot(self):
+        """Skips screenshots as there are no real windows."""
+        return True
+
+    def setup(self):
+        """Sets stub view with Tcl root window and replay mouse."""
+        self.mouse = ReplayMouse()
+        self.view = StubWidget()
+        self.view.master = ReplayMaster()
+
+    def shutdown(self):
+        """Marks replay as finished instead of exiting."""
+        self.finished = True
+
+
+class ReplayApp(BenchmarkApp):
+    """Synthetic windows app with tasks changing nothing on the desktop."""
+
+    def setup_controller(self):
+        """Returns replay controller class."""
+        return ReplayController
+
+    def activate_root(self, *args):
+        """Does nothing as there's no root window."""
+
+    def move(self, *args):
+        """Does nothing as there are no real windows."""
+
+    def move_and_resize(self, *args):
+        """Does nothing as there are no real windows."""
+
+    def move_to_workspace(self, wid, number):
+        """Sets provided workspace number as the active one in stub view."""
+        self.controller.view.workspaces.active = number
+
+
+def create_trace(events, seed):
+    """Returns synthetic trace with cursor drags, scrolls and key presses.
+
+    :param events: number of events
+    :type events: int
+    :param seed: random generator seed
+    :type seed: int
+    :returns: list of (float, str, object)
+    """
+    generator = random.Random(seed)
+    x, y = 960, 540
+    trace = []
+    for number in range(events):
+        if number % 200 == 199:
+            trace.append((number / 100, "k", generator.choice(("Return", "space"))))
+        elif number % 50 == 49:
+            trace.append((number / 100, "s", generator.random() < 0.5))
+        else:
+            x = min(max(x + generator.randint(-40, 40), 0), 4479)
+            y = min(max(y + generator.randint(-25, 25), 0), 1439)
+            trace.append((number / 100, "m", (x, y)))
+    return trace
+
+
+def create_app(size, seed):
+    """Creates and returns app ready for replay with collection of provided size.
+
+    :param size: number of windows
+    :type size: int
+    :param seed: random generator seed
+    :type seed: int
+    :returns: :class:`ReplayApp`
+    """
+    app = ReplayApp()
+    app.collector.populate(size, random.Random(seed))
+    controller = app.controller
+    controller.generator = app.collector.collection.generator()
+    controller.next(first_time=True)
+    controller.view.workspaces.active = controller.model.workspace
+    return app
+
+
+def replay(controller, trace):
+    """Feeds events from provided trace to provided controller.
+
+    :param controller: replay controller
+    :type controller: :class:`ReplayController`
+    :param trace: collection of (elapsed, kind, value) events
+    :type trace: list
+    :returns: number of replayed events
+    """
+    replayed = 0
+    for _, kind, value in trace:
+        if controller.finished:
+            break
+        if kind == "m":
+            controller.mouse.position = value
+            controller.mouse_move(*value)
+        elif kind == "s":
+            controller.mouse_scroll(value)
+        elif value not in SKIPPED_KEYS:
+            controller.on_key_pressed(SimpleNamespace(keysym=value))
+        replayed += 1
+    return replayed
+
+
+def benchmark_replay(trace, size, seed):
+    """Replays provided trace and returns measured results.
+
+    :param trace: collection of (elapsed, kind, value) events
+    :type trace: list
+    :param size: number of windows
+    :type size: int
+    :param seed: random generator seed
+    :type seed: int
+    :returns: dict
+    """
+    app = create_app(size, seed)
+    tracemalloc.start()
+    started, cpu_started = perf_counter(), process_time()
+    replayed = replay(app.controller, trace)
+    elapsed, cpu = perf_counter() - started, process_time() - cpu_started
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "events": replayed,
+        "wall": elapsed,
+        "cpu": cpu,
+        "current": current,
+        "peak": peak,
+        "tcl_calls": app.controller.view.master.calls,
+    }
+
+
+def main(argv=None):
+    """Parses command line arguments, replays trace and prints results.
+
+    :param argv: command line arguments
+    :type argv: list
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--trace", default=None)
+    parser.add_argument("--events", type=int, default=5000)
+    parser.add_argument("--size", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    trace = (
+        list(read_trace(args.trace))
+        if args.trace
+        else create_trace(args.events, args.seed)
+    )
+    results = benchmark_replay(trace, args.size, args.seed)
+    events = max(results["events"], 1)
+    print("replayed events:       {}".format(results["events"]))
+    print("cpu time/event:        {:.2f} usec".format(results["cpu"] / events * 1e6))
+    print("wall time/event:       {:.2f} usec".format(results["wall"] / events * 1e6))
+    print("Tcl calls/event:       {:.2f}".format(results["tcl_calls"] / events))
+    print("allocated at the end:  {:.1f} KiB".format(results["current"] / 1024))
+    print("peak allocated:        {:.1f} KiB".format(results["peak"] / 1024))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,142 @@
+# arrangeit - cross-platform desktop utility for easy windows management
+# Copyright (C) 1999-2019 Ivica Paleka
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>
+
+"""Screenshot preparation benchmarks for full and reduced resolution blurring.
+
+Synthetic window captures are filtered with every downscale factor and the
+result is compared to full resolution blurring by peak signal-to-noise ratio.
+Run from the project's root directory with::
+
+    $ python3 -m tests.benchmarks.screenshots [--factors 1 2 3] [--blur 2]
+"""
+
+import argparse
+import math
+import random
+import sys
+
+from PIL import Image, ImageChops, ImageDraw, ImageStat
+
+from tests.benchmarks.helpers import REPORT_HEADER, measure, report
+
+from arrangeit.utils import get_filtered_screenshot
+
+CAPTURES = (("1080p", (1920, 1080)), ("1440p", (2560, 1440)), ("4K", (3840, 2160)))
+
+
+def create_capture(size, seed):
+    """Returns synthetic window capture with colored boxes and text lines.
+
+    :param size: capture width and height
+    :type size: (int, int)
+    :param seed: random generator seed
+    :type seed: int
+    :returns: :class:`PIL.Image.Image`
+    """
+    generator = random.Random(seed)
+    width, height = size
+    image = Image.new("RGB", size, "white")
+    draw = ImageDraw.Draw(image)
+    for _ in range(width * height // 4000):
+        x, y = generator.randrange(width), generator.randrange(height)
+        draw.rectangle(
+            (x, y, x + generator.randrange(5, 300), y + generator.randrange(5, 120)),
+            fill=tuple(generator.randrange(256) for _ in range(3)),
+        )
+    for _ in range(width * height // 600):
+        x, y = generator.randrange(width), generator.randrange(height)
+        draw.text((x, y), "arrangeit", fill="black")
+    return image
+
+
+def peak_signal_to_noise(image, reference):
+    """Returns peak signal-to-noise ratio in decibels of image against reference.
+
+    :param image: compared image
+    :type image: :class:`PIL.Image.Image`
+    :param reference: reference image of the same size and mode
+    :type reference: :class:`PIL.Image.Image`
+    :var rms: root mean square difference for every band
+    :type rms: list of float
+    :returns: float
+    """
+    rms = ImageStat.Stat(ImageChops.difference(image, reference)).rms
+    mse = sum(value**2 for value in rms) / len(rms)
+    return 10 * math.log10(255**2 / mse) if mse else float("inf")
+
+
+def benchmark_screenshots(factors, blur_size, seed):
+    """Yields report lines for screenshot filtering with provided downscale factors.
+
+    :param factors: downscale factors
+    :type factors: list of int
+    :param blur_size: how many pixels in all directions will be blured
+    :type blur_size: int
+    :param seed: random generator seed
+    :type seed: int
+    :returns: generator of str
+    """
+    for name, size in CAPTURES:
+        image = create_capture(size, seed)
+        for grayscale in (True, False):
+            reference = get_filtered_screenshot(
+                image, blur_size=blur_size, grayscale=grayscale
+            )
+            for factor in factors:
+                filtered = get_filtered_screenshot(
+                    image, blur_size=blur_size, grayscale=grayscale, downscale=factor
+                )
+                per_call = measure(
+                    lambda: get_filtered_screenshot(
+                        image,
+                        blur_size=blur_size,
+                        grayscale=grayscale,
+                        downscale=factor,
+                        size=size,
+                    ),
+                    3,
+                )
+                yield report(
+                    "filter {} x{} ({:.1f} dB)".format(
+                        "L" if grayscale else "RGB",
+                        factor,
+                        peak_signal_to_noise(filtered, reference),
+                    ),
+                    name,
+                    per_call,
+                )
+
+
+def main(argv=None):
+    """Parses command line arguments and prints benchmark results.
+
+    :param argv: command line arguments
+    :type argv: list
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--factors", type=int, nargs="+", default=[1, 2, 3])
+    parser.add_argument("--blur", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    print(REPORT_HEADER)
+    for line in benchmark_screenshots(args.factors, args.blur, args.seed):
+        print(line)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,252 @@
+# arrangeit - cross-platform desktop utility for easy windows management
+# Copyright (C) 1999-2019 Ivica Paleka
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>
+
+"""Snapping hot path benchmarks on synthetic windows layouts.
+
+Run from the project's root directory with::
+
+    $ python3 -m tests.benchmarks.snapping [--sizes 10 100] [--queries 200]
+"""
+
+import argparse
+import random
+import sys
+
+from tests.benchmarks.helpers import REPORT_HEADER, measure, report
+
+from arrangeit.base import BaseApp, BaseCollector
+from arrangeit.data import WindowModel
+from arrangeit.settings import Settings
+from arrangeit.snapping import nearest_intersections
+from arrangeit.utils import (
+    check_intersections,
+    get_snapping_sources_for_rect,
+    offset_for_intersections,
+)
+
+SIZES = (10, 100, 1000, 10000)
+WORKSPACES = (1001, 1002, 1003, 1004)
+MONITORS = ((0, 0, 1920, 1080), (1920, 0, 2560, 1440))
+
+
+class SyntheticCollector(BaseCollector):
+    """Collector populated with randomly placed windows instead of real ones.
+
+    :var monitors: monitors rectangles
+    :type monitors: tuple
+    """
+
+    monitors = MONITORS
+
+    def get_available_workspaces(self):
+        """Returns synthetic workspaces in the same format as real collectors.
+
+        :returns: list of (int, str)
+        """
+        return [(number, "Workspace {}".format(number)) for number in WORKSPACES]
+
+    def get_monitors_rects(self):
+        """Returns synthetic monitors rectangles.
+
+        :returns: tuple
+        """
+        return self.monitors
+
+    def populate(self, size, generator):
+        """Adds ``size`` randomly placed windows to collection.
+
+        :param size: number of windows to add
+        :type size: int
+        :param generator: random generator instance
+        :type generator: :class:`random.Random`
+        """
+        for wid in range(1, size + 1):
+            monitor = generator.choice(self.monitors)
+            width = generator.randrange(Settings.MIN_WIDTH, monitor[2])
+            height = generator.randrange(Settings.MIN_HEIGHT, monitor[3])
+            self.collection.add(
+                WindowModel(
+                    wid=wid,
+                    rect=(
+                        monitor[0] + generator.randrange(0, monitor[2] - width + 1),
+                        monitor[1] + generator.randrange(0, monitor[3] - height + 1),
+                        width,
+                        height,
+                    ),
+                    resizable=True,
+                    restored=True,
+                    title="Window {}".format(wid),
+                    name="benchmark",
+                    workspace=generator.choice(WORKSPACES),
+                )
+            )
+
+
+class BenchmarkApp(BaseApp):
+    """App using :class:`SyntheticCollector` and no controller."""
+
+    def setup_controller(self):
+        """Returns dummy controller factory."""
+        return lambda app: None
+
+    def setup_collector(self):
+        """Returns synthetic collector class."""
+        return SyntheticCollector
+
+
+def create_app(size, seed):
+    """Creates and returns app with collection of provided size.
+
+    :param size: number of windows
+    :type size: int
+    :param seed: random generator seed
+    :type seed: int
+    :returns: :class:`BenchmarkApp`
+    """
+    app = BenchmarkApp()
+    app.collector.populate(size, random.Random(seed))
+    return app
+
+
+def create_root_rects(count, seed):
+    """Returns list of randomly placed root window rectangles.
+
+    :param count: number of rectangles
+    :type count: int
+    :param seed: random generator seed
+    :type seed: int
+    :returns: list of (int, int, int, int)
+    """
+    generator = random.Random(seed)
+    return [
+        (
+            generator.randrange(0, 4000),
+            generator.randrange(0, 1200),
+            generator.randrange(300, 700),
+            generator.randrange(200, 500),
+        )
+        for _ in range(count)
+    ]
+
+
+def run_queries(function, sources, targets):
+    """Returns function calling provided function with targets for all sources.
+
+    :param function: snapping query function
+    :type function: function
+    :param sources: collection of root snapping rectangles
+    :type sources: list
+    :param targets: workspace snapping targets
+    :type targets: list or :class:`SnappingIndex`
+    :returns: function
+    """
+
+    def run():
+        for rects in sources:
+            function(rects, targets)
+
+    return run
+
+
+def benchmark_size(size, queries, seed):
+    """Yields report lines for all the snapping benchmarks for provided size.
+
+    Per-query benchmarks are reported per single root rectangle, that is the
+    cost of a single mouse event.
+
+    :param size: number of windows
+    :type size: int
+    :param queries: number of root rectangles checked per round
+    :type queries: int
+    :param seed: random generator seed
+    :type seed: int
+    :returns: generator of str
+    """
+    app = create_app(size, seed)
+    model = app.collector.collection.get_model_by_wid(1)
+    workspace = model.workspace
+    snap = Settings.SNAP_PIXELS
+    roots = create_root_rects(queries, seed)
+    sources = [get_snapping_sources_for_rect(rect, snap) for rect in roots]
+
+    def create():
+        app.snapping_sources = None
+        app.create_snapping_sources(model)
+
+    yield report("BaseApp.create_snapping_sources", size, measure(create, 1, repeat=3))
+
+    index = app.create_snapping_sources(model)[workspace]
+    targets = list(index)
+    linear_number = max(1, queries // max(1, size // 100))
+    per_query = [
+        (
+            "get_snapping_sources_for_rect",
+            lambda: [get_snapping_sources_for_rect(rect, snap) for rect in roots],
+            queries,
+        ),
+        (
+            "check_intersections (list)",
+            run_queries(check_intersections, sources[:linear_number], targets),
+            linear_number,
+        ),
+        (
+            "SnappingIndex.intersections",
+            run_queries(
+                lambda rects, index: index.intersections(rects), sources, index
+            ),
+            queries,
+        ),
+        (
+            "nearest_intersections (index)",
+            run_queries(nearest_intersections, sources, index),
+            queries,
+        ),
+    ]
+
+    intersections = [nearest_intersections(rects, index) for rects in sources]
+    per_query.append(
+        (
+            "offset_for_intersections",
+            lambda: [offset_for_intersections(pair, snap) for pair in intersections],
+            queries,
+        )
+    )
+
+    for name, function, count in per_query:
+        yield report(name, size, measure(function, 1) / count)
+
+
+def main(argv=None):
+    """Parses command line arguments and prints benchmark results.
+
+    :param argv: command line arguments
+    :type argv: list
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    print(REPORT_HEADER)
+    for size in args.sizes:
+        for line in benchmark_size(size, args.queries, args.seed):
+            print(line)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -16,6 +16,10 @@
 
 from platform import system
 
+import pytest
+
+from arrangeit.view import fonts, icons_cache
+
 collect_ignore = []
 if system() == "Darwin":
     collect_ignore.append("test_linux.py")
@@ -32,3 +36,19 @@ elif system() == "Linux":
 elif system() == "Windows":
     collect_ignore.append("test_darwin.py")
     collect_ignore.append("test_linux.py")
+
+
+@pytest.fixture(autouse=True)
+def clear_icons_cache():
+    """Clears icons cache so images created in one test aren't used in others."""
+    icons_cache.clear()
+    yield
+    icons_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_fonts():
+    """Clears fonts registry so fonts created in one test aren't used in others."""
+    fonts.clear()
+    yield
+    fonts.clear()
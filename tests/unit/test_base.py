@@ -15,11 +15,12 @@
 # along with this program. If not, see <https://www.gnu.org/licenses/>
 
 import copy
+import os
 from json import JSONDecodeError
 
 import pytest
 
-from arrangeit import base, utils
+from arrangeit import base, snapping, utils
 from arrangeit.data import WindowModel, WindowsCollection
 from arrangeit.settings import Settings
 
@@ -36,7 +37,7 @@ class TestBaseApp:
     """Testing class for BaseApp class."""
 
     ## BaseApp
-    @pytest.mark.parametrize("attr", ["controller", "collector"])
+    @pytest.mark.parametrize("attr", ["controller", "collector", "snapping_sources"])
     def test_BaseApp_inits_attr_as_None(self, attr):
         assert getattr(base.BaseApp, attr) is None
 
@@ -99,6 +100,24 @@ class TestBaseApp:
         mocked.assert_called()
         mocked.assert_called_with("Collector")
 
+    ## BaseApp.get_stacked_windows
+    def test_BaseApp_get_stacked_windows_returns_empty_list(self, mocker):
+        mocker.patch("arrangeit.base.BaseApp.setup_controller")
+        mocker.patch("arrangeit.base.BaseApp.setup_collector")
+        assert base.BaseApp().get_stacked_windows(1001) == []
+
+    ## BaseApp.grab_monitor_image
+    def test_BaseApp_grab_monitor_image_returns_None(self, mocker):
+        mocker.patch("arrangeit.base.BaseApp.setup_controller")
+        mocker.patch("arrangeit.base.BaseApp.setup_collector")
+        assert base.BaseApp().grab_monitor_image((0, 0, 100, 100)) is None
+
+    ## BaseApp.grab_window_image
+    def test_BaseApp_grab_window_image_returns_None(self, mocker):
+        mocker.patch("arrangeit.base.BaseApp.setup_controller")
+        mocker.patch("arrangeit.base.BaseApp.setup_collector")
+        assert base.BaseApp().grab_window_image(mocker.MagicMock()) is None
+
     ## BaseApp.grab_window_screen
     def test_BaseApp_grab_window_screen_raises_NotImplementedError(self, mocker):
         mocker.patch("arrangeit.base.BaseApp.setup_controller")
@@ -236,6 +255,86 @@ class TestBaseApp:
         mocked.assert_called_once()
         mocked.assert_called_with(["ROOT_ALPHA"], 0.95)
 
+    def test_BaseApp_change_setting_resets_snapping_sources_for_SNAP_PIXELS(
+        self, mocker
+    ):
+        mocker.patch("arrangeit.base.BaseApp.setup_controller")
+        mocker.patch("arrangeit.base.BaseApp.setup_collector")
+        mocker.patch("arrangeit.base.BaseApp._save_setting")
+        mocker.patch("arrangeit.base.setattr")
+        app = base.BaseApp()
+        app.snapping_sources = {1001: snapping.SnappingIndex()}
+        app.change_setting("SNAP_PIXELS", 6)
+        assert app.snapping_sources is None
+
+    def test_BaseApp_change_setting_not_resetting_snapping_sources(self, mocker):
+        mocker.patch("arrangeit.base.BaseApp.setup_controller")
+        mocker.patch("arrangeit.base.BaseApp.setup_collector")
+        mocker.patch("arrangeit.base.BaseApp._save_setting")
+        mocker.patch("arrangeit.base.setattr")
+        app = base.BaseApp()
+        SOURCES = {1001: snapping.SnappingIndex()}
+        app.snapping_sources = SOURCES
+        app.change_setting("ROOT_ALPHA", 0.95)
+        assert app.snapping_sources is SOURCES
+
+    def test_BaseApp_change_setting_calls_clear_snapping_cache(self, mocker):
+        mocker.patch("arrangeit.base.BaseApp.setup_controller")
+        mocker.patch("arrangeit.base.BaseApp.setup_collector")
+        mocker.patch("arrangeit.base.BaseApp._save_setting")
+        mocker.patch("arrangeit.base.setattr")
+        mocked = mocker.patch("arrangeit.base.clear_snapping_cache")
+        base.BaseApp().change_setting("SNAP_PIXELS", 6)
+        mocked.assert_called_once()
+        mocked.assert_called_with()
+
+    def test_BaseApp_change_setting_not_calling_clear_snapping_cache(self, mocker):
+        mocker.patch("arrangeit.base.BaseApp.setup_controller")
+        mocker.patch("arrangeit.base.BaseApp.setup_collector")
+        mocker.patch("arrangeit.base.BaseApp._save_setting")
+        mocker.patch("arrangeit.base.setattr")
+        mocked = mocker.patch("arrangeit.base.clear_snapping_cache")
+        base.BaseApp().change_setting("ROOT_ALPHA", 0.95)
+        mocked.assert_not_called()
+
+    def test_BaseApp_change_setting_calls_fonts_update(self, mocker):
+        mocker.patch("arrangeit.base.BaseApp.setup_controller")
+        mocker.patch("arrangeit.base.BaseApp.setup_collector")
+        mocker.patch("arrangeit.base.BaseApp._save_setting")
+        mocker.patch("arrangeit.base.setattr")
+        mocked = mocker.patch("arrangeit.base.fonts")
+        base.BaseApp().change_setting("TITLE_LABEL_FONT_INCREASE", 0.2)
+        mocked.update.assert_called_once()
+        mocked.update.assert_called_with("TITLE_LABEL_FONT_INCREASE")
+
+    def test_BaseApp_change_setting_not_calling_fonts_update(self, mocker):
+        mocker.patch("arrangeit.base.BaseApp.setup_controller")
+        mocker.patch("arrangeit.base.BaseApp.setup_collector")
+        mocker.patch("arrangeit.base.BaseApp._save_setting")
+        mocker.patch("arrangeit.base.setattr")
+        mocked = mocker.patch("arrangeit.base.fonts")
+        base.BaseApp().change_setting("ROOT_ALPHA", 0.95)
+        mocked.update.assert_not_called()
+
+    def test_BaseApp_change_setting_sets_icons_cache_memory_limit(self, mocker):
+        mocker.patch("arrangeit.base.BaseApp.setup_controller")
+        mocker.patch("arrangeit.base.BaseApp.setup_collector")
+        mocker.patch("arrangeit.base.BaseApp._save_setting")
+        mocker.patch("arrangeit.base.setattr")
+        mocked = mocker.patch("arrangeit.base.icons_cache")
+        base.BaseApp().change_setting("ICONS_CACHE_BYTES", 1024)
+        mocked.set_memory_limit.assert_called_once()
+        mocked.set_memory_limit.assert_called_with(1024)
+
+    def test_BaseApp_change_setting_not_setting_icons_cache_memory_limit(self, mocker):
+        mocker.patch("arrangeit.base.BaseApp.setup_controller")
+        mocker.patch("arrangeit.base.BaseApp.setup_collector")
+        mocker.patch("arrangeit.base.BaseApp._save_setting")
+        mocker.patch("arrangeit.base.setattr")
+        mocked = mocker.patch("arrangeit.base.icons_cache")
+        base.BaseApp().change_setting("ROOT_ALPHA", 0.95)
+        mocked.set_memory_limit.assert_not_called()
+
     ## BaseApp.change_settings_color_group
     def test_BaseApp_change_settings_color_group_calls_Settings_color_group(
         self, mocker
@@ -366,6 +465,12 @@ class TestBaseApp:
         mocker.patch("arrangeit.base.BaseApp.setup_collector")
         assert base.BaseApp().screenshot_cleanup() is None
 
+    ## BaseApp.shutdown_cleanup
+    def test_BaseApp_shutdown_cleanup_returns_None(self, mocker):
+        mocker.patch("arrangeit.base.BaseApp.setup_controller")
+        mocker.patch("arrangeit.base.BaseApp.setup_collector")
+        assert base.BaseApp().shutdown_cleanup() is None
+
     ## BaseApp._save_setting
     def test_BaseApp__save_setting_calls_platform_user_data_path(self, mocker):
         mocker.patch("arrangeit.base.BaseApp.setup_controller")
@@ -553,6 +658,43 @@ class TestBaseApp:
         assert sources.get(1) is not None
         assert sources.get(2) is not None
 
+    def test_BaseApp__initialize_snapping_sources_returns_independent_lists(
+        self, mocker
+    ):
+        mocker.patch("arrangeit.base.BaseApp.setup_controller")
+        mocked_collector = mocker.patch("arrangeit.base.BaseApp.setup_collector")
+        collector = mocked_collector.return_value.return_value
+        collector.get_monitors_rects.return_value = [
+            (0, 0, 640, 480),
+            (640, 0, 800, 600),
+        ]
+        collector.get_available_workspaces.return_value = [(0, ""), (1, "")]
+        sources = base.BaseApp()._initialize_snapping_sources()
+        assert sources[0] is not sources[1]
+        sources[0].append("foo")
+        assert len(sources[0]) == 3
+        assert len(sources[1]) == 2
+
+    ## BaseApp._add_snapping_sources
+    def test_BaseApp__add_snapping_sources_appends_to_model_workspace(self, mocker):
+        mocker.patch("arrangeit.base.BaseApp.setup_controller")
+        mocker.patch("arrangeit.base.BaseApp.setup_collector")
+        app = base.BaseApp()
+        app.snapping_sources = {
+            1001: snapping.SnappingIndex(),
+            1002: snapping.SnappingIndex(),
+        }
+        model = WindowModel(rect=(10, 20, 500, 400), workspace=1001, wid=5000)
+        model.set_changed(ws=1002)
+        app._add_snapping_sources(model)
+        assert app.snapping_sources[1001] == []
+        assert app.snapping_sources[1002] == [
+            utils.get_snapping_sources_for_rect(
+                (10, 20, 500, 400), Settings.SNAP_PIXELS
+            )
+        ]
+        assert 5000 in app.snapping_sources[1002].entries
+
     ## BaseApp.create_snapping_sources
     def test_BaseApp_create_snapping_sources_calls__initialize_snapping_sources(
         self, mocker
@@ -597,6 +739,17 @@ class TestBaseApp:
         assert isinstance(rects, dict)
         assert rects == {1001: [], 1002: []}
 
+    def test_BaseApp_create_snapping_sources_returns_SnappingIndex_values(self, mocker):
+        mocker.patch("arrangeit.base.BaseApp.setup_controller")
+        mocker.patch("arrangeit.base.BaseApp.setup_collector")
+        mocker.patch(
+            "arrangeit.base.BaseApp._initialize_snapping_sources",
+            return_value={1001: [], 1002: []},
+        )
+        rects = base.BaseApp().create_snapping_sources(WindowModel())
+        for index in rects.values():
+            assert isinstance(index, snapping.SnappingIndex)
+
     @pytest.mark.parametrize("windows,expected", WIN_COLLECTION_SNAP_CHANGED)
     def test_BaseApp_create_snapping_sources_uses_changed_values_if_available(
         self, mocker, windows, expected
@@ -705,6 +858,120 @@ class TestBaseApp:
         sources = base.BaseApp().create_snapping_sources(model1)
         assert sources[1001] == expected[1001]
 
+    def test_BaseApp_create_snapping_sources_creates_collection_only_once(self, mocker):
+        mocker.patch("arrangeit.base.BaseApp.setup_controller")
+        mocker.patch("arrangeit.base.BaseApp.setup_collector")
+        mocked = mocker.patch(
+            "arrangeit.base.BaseApp._initialize_snapping_sources",
+            return_value={1001: [], 1002: []},
+        )
+        app = base.BaseApp()
+        first = app.create_snapping_sources(WindowModel())
+        second = app.create_snapping_sources(WindowModel())
+        mocked.assert_called_once()
+        assert first is second is app.snapping_sources
+
+    @pytest.mark.parametrize("windows,expected", WIN_COLLECTION_SNAP_SAMPLES_EXCLUDING)
+    def test_BaseApp_create_snapping_sources_changes_excluded_model(
+        self, mocker, windows, expected
+    ):
+        mocker.patch("arrangeit.base.BaseApp.setup_controller")
+        collection = WindowsCollection()
+        model0 = WindowModel(rect=SAMPLE_RECT, workspace=1005, wid=5000)
+        model0.set_changed(ws=windows[0][0], rect=windows[0][1:])
+        collection.add(model0)
+        model1 = WindowModel(rect=SAMPLE_RECT, workspace=1005, wid=9000)
+        model1.set_changed(ws=windows[1][0], rect=windows[1][1:])
+        collection.add(model1)
+        mocked_collector = mocker.patch("arrangeit.base.BaseApp.setup_collector")
+        mocked_collector.return_value.return_value.collection = collection
+        mocker.patch(
+            "arrangeit.base.BaseApp._initialize_snapping_sources",
+            return_value={1001: [], 1002: []},
+        )
+        mocked = mocker.patch("arrangeit.base.Settings")
+        type(mocked).SNAP_PIXELS = mocker.PropertyMock(return_value=10)
+        type(mocked).SNAP_INCLUDE_SELF = mocker.PropertyMock(return_value=False)
+        app = base.BaseApp()
+        assert app.create_snapping_sources(model1)[1001] == expected[1001][:1]
+        assert app.create_snapping_sources(model0)[1001] == expected[1001][1:]
+
+    def test_BaseApp_create_snapping_sources_holds_only_workspace_windows(self, mocker):
+        mocker.patch("arrangeit.base.BaseApp.setup_controller")
+        mocked_collector = mocker.patch("arrangeit.base.BaseApp.setup_collector")
+        collector = mocked_collector.return_value.return_value
+        MONITORS = [(0, 0, 640, 480), (640, 0, 800, 600)]
+        collector.get_monitors_rects.return_value = MONITORS
+        collector.get_available_workspaces.return_value = [(1001, ""), (1002, "")]
+        collection = WindowsCollection()
+        collection.add(WindowModel(rect=(10, 20, 500, 400), workspace=1001, wid=1))
+        collection.add(WindowModel(rect=(80, 200, 300, 200), workspace=1002, wid=2))
+        collection.add(WindowModel(rect=(100, 50, 200, 100), workspace=1002, wid=3))
+        collector.collection = collection
+        mocked = mocker.patch("arrangeit.base.Settings")
+        type(mocked).SNAP_PIXELS = mocker.PropertyMock(return_value=10)
+        type(mocked).SNAP_INCLUDE_SELF = mocker.PropertyMock(return_value=True)
+        sources = base.BaseApp().create_snapping_sources(WindowModel())
+        monitors = [utils.get_snapping_sources_for_rect(rect, 10) for rect in MONITORS]
+        assert sources[1001] is not sources[1002]
+        assert sources[1001] == monitors + [
+            utils.get_snapping_sources_for_rect((10, 20, 500, 400), 10)
+        ]
+        assert sources[1002] == monitors + [
+            utils.get_snapping_sources_for_rect((80, 200, 300, 200), 10),
+            utils.get_snapping_sources_for_rect((100, 50, 200, 100), 10),
+        ]
+        root = utils.get_snapping_sources_for_rect((82, 204, 296, 190), 10)
+        assert utils.check_intersections(root, sources[1001]) is False
+        assert utils.check_intersections(root, sources[1002]) is not False
+
+    ## BaseApp.update_snapping_sources
+    def test_BaseApp_update_snapping_sources_returns_True_for_no_sources(self, mocker):
+        mocker.patch("arrangeit.base.BaseApp.setup_controller")
+        mocker.patch("arrangeit.base.BaseApp.setup_collector")
+        mocked = mocker.patch("arrangeit.base.BaseApp._add_snapping_sources")
+        returned = base.BaseApp().update_snapping_sources(WindowModel(wid=5000))
+        assert returned is True
+        mocked.assert_not_called()
+
+    def test_BaseApp_update_snapping_sources_returns_True_for_model_without_wid(
+        self, mocker
+    ):
+        mocker.patch("arrangeit.base.BaseApp.setup_controller")
+        mocker.patch("arrangeit.base.BaseApp.setup_collector")
+        mocked = mocker.patch("arrangeit.base.BaseApp._add_snapping_sources")
+        app = base.BaseApp()
+        app.snapping_sources = {1001: snapping.SnappingIndex()}
+        returned = app.update_snapping_sources(WindowModel())
+        assert returned is True
+        mocked.assert_not_called()
+
+    def test_BaseApp_update_snapping_sources_functionality(self, mocker):
+        mocker.patch("arrangeit.base.BaseApp.setup_controller")
+        mocker.patch("arrangeit.base.BaseApp.setup_collector")
+        app = base.BaseApp()
+        model = WindowModel(rect=(10, 20, 500, 400), workspace=1001, wid=5000)
+        other = WindowModel(rect=(80, 200, 300, 200), workspace=1001, wid=9000)
+        app.snapping_sources = {
+            1001: snapping.SnappingIndex(),
+            1002: snapping.SnappingIndex(),
+        }
+        app._add_snapping_sources(model)
+        app._add_snapping_sources(other)
+        model.set_changed(rect=(100, 200, 540, 200), ws=1002)
+        returned = app.update_snapping_sources(model)
+        assert returned is False
+        assert app.snapping_sources[1001] == [
+            utils.get_snapping_sources_for_rect(
+                (80, 200, 300, 200), Settings.SNAP_PIXELS
+            )
+        ]
+        assert app.snapping_sources[1002] == [
+            utils.get_snapping_sources_for_rect(
+                (100, 200, 540, 200), Settings.SNAP_PIXELS
+            )
+        ]
+
 
 class TestBaseCollector:
     """Testing class for base Collector class."""
@@ -836,21 +1103,67 @@ class TestBaseMouse:
     """Testing class for Mouse class methods."""
 
     ## BaseMouse
-    @pytest.mark.parametrize("attr", ["queue", "listener", "control"])
+    @pytest.mark.parametrize(
+        "attr",
+        [
+            "queue",
+            "listener",
+            "control",
+            "wakeup_reader",
+            "wakeup_writer",
+            "warps",
+            "warps_lock",
+        ],
+    )
     def test_BaseMouse_inits_attr_as_None(self, attr):
         assert getattr(base.BaseMouse, attr) is None
 
+    def test_BaseMouse_inits_suppressed_as_zero(self):
+        assert base.BaseMouse.suppressed == 0
+
+    @pytest.mark.parametrize("attr", ["signaled", "timestamped"])
+    def test_BaseMouse_inits_attr_as_False(self, attr):
+        assert getattr(base.BaseMouse, attr) is False
+
     ## BaseMouse.__init__
-    def test_BaseMouse_init_instantiates_Queue(self, mocker):
+    def test_BaseMouse_init_instantiates_EventsRingBuffer(self, mocker):
+        mocked_settings = mocker.patch("arrangeit.base.Settings")
+        type(mocked_settings).MOUSE_BUFFER_SIZE = mocker.PropertyMock(return_value=32)
+        mocked = mocker.patch("arrangeit.base.EventsRingBuffer")
+        assert base.BaseMouse().queue == mocked.return_value
+        mocked.assert_called_once()
+        mocked.assert_called_with(32)
+
+    @pytest.mark.parametrize("value", [0, None, "foo"])
+    def test_BaseMouse_init_instantiates_Queue(self, mocker, value):
+        mocked_settings = mocker.patch("arrangeit.base.Settings")
+        type(mocked_settings).MOUSE_BUFFER_SIZE = mocker.PropertyMock(
+            return_value=value
+        )
         mocked = mocker.patch("arrangeit.base.queue.Queue")
         base.BaseMouse()
         mocked.assert_called_once()
         mocked.assert_called_with()
 
     def test_BaseMouse_init_sets_queue_attribute(self, mocker):
+        mocked_settings = mocker.patch("arrangeit.base.Settings")
+        type(mocked_settings).MOUSE_BUFFER_SIZE = mocker.PropertyMock(return_value=0)
         mocked = mocker.patch("arrangeit.base.queue.Queue")
         assert base.BaseMouse().queue == mocked.return_value
 
+    @pytest.mark.parametrize("value,expected", [(True, True), (False, False)])
+    def test_BaseMouse_init_sets_timestamped(self, mocker, value, expected):
+        mocked_settings = mocker.patch("arrangeit.base.Settings")
+        type(mocked_settings).LATENCY_STATS = mocker.PropertyMock(return_value=value)
+        assert base.BaseMouse().timestamped is expected
+
+    def test_BaseMouse_init_sets_warps_attributes(self):
+        mouse = base.BaseMouse()
+        assert len(mouse.warps) == 0
+        assert mouse.warps.maxlen == 16
+        assert mouse.warps_lock.acquire(blocking=False) is True
+        mouse.warps_lock.release()
+
     def test_BaseMouse_init_instantiates_Controller(self, mocker):
         mocked = mocker.patch("pynput.mouse.Controller")
         base.BaseMouse()
@@ -861,6 +1174,54 @@ class TestBaseMouse:
         mocked = mocker.patch("pynput.mouse.Controller")
         assert base.BaseMouse().control == mocked.return_value
 
+    ## BaseMouse.clear_wakeup
+    def test_BaseMouse_clear_wakeup_without_pipe(self):
+        mouse = base.BaseMouse()
+        mouse.signaled = True
+        mouse.clear_wakeup()
+        assert mouse.signaled is False
+
+    def test_BaseMouse_clear_wakeup_empties_pipe(self):
+        mouse = base.BaseMouse()
+        reader = mouse.open_wakeup()
+        os.write(mouse.wakeup_writer, b"abc")
+        mouse.signaled = True
+        mouse.clear_wakeup()
+        assert mouse.signaled is False
+        with pytest.raises(BlockingIOError):
+            os.read(reader, 10)
+        mouse.close_wakeup()
+
+    def test_BaseMouse_clear_wakeup_resets_signal_after_reading_pipe(self, mocker):
+        mouse = base.BaseMouse()
+        mouse.wakeup_reader = 5
+        mouse.signaled = True
+        states = []
+
+        def read(fd, size):
+            states.append(mouse.signaled)
+            raise BlockingIOError
+
+        mocker.patch("arrangeit.base.os.read", side_effect=read)
+        mouse.clear_wakeup()
+        assert states == [True]
+        assert mouse.signaled is False
+
+    ## BaseMouse.close_wakeup
+    def test_BaseMouse_close_wakeup_functionality(self):
+        mouse = base.BaseMouse()
+        reader = mouse.open_wakeup()
+        mouse.close_wakeup()
+        assert mouse.wakeup_reader is None
+        assert mouse.wakeup_writer is None
+        with pytest.raises(OSError):
+            os.read(reader, 1)
+
+    def test_BaseMouse_close_wakeup_without_pipe(self, mocker):
+        mocked = mocker.patch("arrangeit.base.os.close")
+        base.BaseMouse().close_wakeup()
+        mocked.assert_not_called()
+
     ## BaseMouse.cursor_position
     def test_BaseMouse_cursor_position_calls_Controller_position(self, mocker):
         mocked = mocker.patch("pynput.mouse.Controller")
@@ -876,19 +1237,48 @@ class TestBaseMouse:
 
     ## BaseMouse.get_item
     def test_BaseMouse_get_item_calls_queue_get(self, mocker):
-        mocked = mocker.patch("arrangeit.base.queue.Queue.get")
+        mocked = mocker.patch("arrangeit.base.EventsRingBuffer.get")
         base.BaseMouse().get_item()
         mocked.assert_called_once()
         mocked.assert_called_with(block=False)
 
     def test_BaseMouse_get_item_returns_item(self, mocker):
-        mocked = mocker.patch("arrangeit.base.queue.Queue.get")
+        mocked = mocker.patch("arrangeit.base.EventsRingBuffer.get")
         returned = base.BaseMouse().get_item()
         assert returned == mocked.return_value
 
     def test_BaseMouse_get_item_returns_None_for_Empty(self, mocker):
         assert base.BaseMouse().get_item() is None
 
+    def test_BaseMouse_get_item_returns_items_in_order(self):
+        mouse = base.BaseMouse()
+        mouse.on_move(10, 20)
+        mouse.on_scroll(0, 0, 0, 1)
+        mouse.on_move(11, 21)
+        assert mouse.get_item() == (10, 20)
+        assert mouse.get_item() is True
+        assert mouse.get_item() == (11, 21)
+        assert mouse.get_item() is None
+
+    ## BaseMouse.is_warp_echo
+    def test_BaseMouse_is_warp_echo_returns_False_for_no_warps(self):
+        assert base.BaseMouse().is_warp_echo((10, 20)) is False
+
+    def test_BaseMouse_is_warp_echo_removes_found_warp(self, mocker):
+        mocker.patch("arrangeit.base.perf_counter", return_value=100.0)
+        mouse = base.BaseMouse()
+        mouse.warps.extend([((10, 20), 100.1), ((30, 40), 100.2), ((10, 20), 100.3)])
+        assert mouse.is_warp_echo((30, 40)) is True
+        assert list(mouse.warps) == [((10, 20), 100.1), ((10, 20), 100.3)]
+        assert mouse.is_warp_echo((30, 40)) is False
+
+    def test_BaseMouse_is_warp_echo_removes_expired_warps(self, mocker):
+        mocker.patch("arrangeit.base.perf_counter", return_value=100.0)
+        mouse = base.BaseMouse()
+        mouse.warps.extend([((10, 20), 99.5), ((30, 40), 100.5)])
+        assert mouse.is_warp_echo((10, 20)) is False
+        assert list(mouse.warps) == [((30, 40), 100.5)]
+
     ## BaseMouse.move_cursor
     def test_BaseMouse_move_cursor_calls_Controller_position(self, mocker):
         mocked = mocker.patch("pynput.mouse.Controller")
@@ -903,24 +1293,94 @@ class TestBaseMouse:
         base.BaseMouse().move_cursor(*xy)
         assert mocked.return_value.position == xy
 
+    ## BaseMouse.open_wakeup
+    def test_BaseMouse_open_wakeup_returns_non_blocking_reader(self):
+        mouse = base.BaseMouse()
+        returned = mouse.open_wakeup()
+        assert returned == mouse.wakeup_reader
+        assert os.get_blocking(mouse.wakeup_reader) is False
+        assert os.get_blocking(mouse.wakeup_writer) is False
+        mouse.close_wakeup()
+
+    def test_BaseMouse_move_cursor_adds_warp(self, mocker):
+        mocker.patch("pynput.mouse.Controller")
+        mocker.patch("arrangeit.base.perf_counter", return_value=100.0)
+        mouse = base.BaseMouse()
+        mouse.move_cursor(101.0, 202.0)
+        assert list(mouse.warps) == [((101, 202), 100.0 + Settings.WARP_ECHO_TIMEOUT)]
+
     ## BaseMouse.on_move
     def test_BaseMouse_on_move_puts_in_queue(self, mocker):
-        mocked = mocker.patch("arrangeit.base.queue.Queue.put")
+        mocked = mocker.patch("arrangeit.base.EventsRingBuffer.put")
         mouse = base.BaseMouse()
         SAMPLE = (10.0, 20.0)
         mouse.on_move(*SAMPLE)
         mocked.assert_called_once()
         mocked.assert_called_with((int(SAMPLE[0]), int(SAMPLE[1])))
 
+    def test_BaseMouse_on_move_puts_timestamped_position_in_queue(self, mocker):
+        mocked = mocker.patch("arrangeit.base.EventsRingBuffer.put")
+        mocker.patch("arrangeit.base.perf_counter", return_value=12.5)
+        mouse = base.BaseMouse()
+        mouse.timestamped = True
+        mouse.on_move(10.0, 20.0)
+        mocked.assert_called_once()
+        mocked.assert_called_with((10, 20, 12.5))
+
+    def test_BaseMouse_on_move_suppresses_warp_echo(self, mocker):
+        mocker.patch("pynput.mouse.Controller")
+        mocked = mocker.patch("arrangeit.base.BaseMouse.signal")
+        mouse = base.BaseMouse()
+        mouse.move_cursor(101, 202)
+        mouse.on_move(101.0, 202.0)
+        mouse.on_move(101.0, 202.0)
+        assert mouse.suppressed == 1
+        assert mouse.get_item() == (101, 202)
+        assert mouse.get_item() is None
+        mocked.assert_called_once()
+
+    def test_BaseMouse_on_move_calls_signal(self, mocker):
+        mocked = mocker.patch("arrangeit.base.BaseMouse.signal")
+        base.BaseMouse().on_move(10, 20)
+        mocked.assert_called_once()
+        mocked.assert_called_with()
+
     ## BaseMouse.on_scroll
     @pytest.mark.parametrize("dy,expected", [(-1, False), (1, True)])
     def test_BaseMouse_on_scroll_puts_in_queue(self, mocker, dy, expected):
-        mocked = mocker.patch("arrangeit.base.queue.Queue.put")
+        mocked = mocker.patch("arrangeit.base.EventsRingBuffer.put")
         mouse = base.BaseMouse()
         mouse.on_scroll(0, 0, 0, dy)
         mocked.assert_called_once()
         mocked.assert_called_with(expected)
 
+    def test_BaseMouse_on_scroll_calls_signal(self, mocker):
+        mocked = mocker.patch("arrangeit.base.BaseMouse.signal")
+        base.BaseMouse().on_scroll(0, 0, 0, 1)
+        mocked.assert_called_once()
+        mocked.assert_called_with()
+
+    ## BaseMouse.signal
+    def test_BaseMouse_signal_without_pipe(self, mocker):
+        mocked = mocker.patch("arrangeit.base.os.write")
+        mouse = base.BaseMouse()
+        mouse.signal()
+        mocked.assert_not_called()
+        assert mouse.signaled is False
+
+    def test_BaseMouse_signal_writes_single_byte_until_cleared(self):
+        mouse = base.BaseMouse()
+        reader = mouse.open_wakeup()
+        mouse.on_move(10, 20)
+        mouse.on_move(11, 21)
+        mouse.on_scroll(0, 0, 0, 1)
+        assert mouse.signaled is True
+        assert os.read(reader, 10) == b"\0"
+        mouse.clear_wakeup()
+        mouse.on_move(12, 22)
+        assert os.read(reader, 10) == b"\0"
+        mouse.close_wakeup()
+
     ## BaseMouse.start
     def test_BaseMouse_start_instantiates_Listener(self, mocker):
         mocked = mocker.patch("pynput.mouse.Listener")
@@ -16,7 +16,7 @@
 
 import pytest
 
-from arrangeit import base, data, utils
+from arrangeit import base, data, events, screenshots, utils
 from arrangeit.settings import MESSAGES, Settings
 
 from .mock_helpers import (
@@ -46,6 +46,16 @@ class TestBaseController:
             "screenshot",
             "snapping_targets",
             "timer",
+            "latency",
+            "root_geometry",
+            "screen_size",
+            "applied_geometry",
+            "pending_geometry",
+            "geometry_idle",
+            "recorder",
+            "prefetcher",
+            "screenshots",
+            "snapshot",
         ],
     )
     def test_BaseController_inits_attr_as_None(self, attr):
@@ -54,7 +64,97 @@ class TestBaseController:
     def test_BaseController_inits_screenshot_when_exposed_as_False(self):
         assert base.BaseController.screenshot_when_exposed is False
 
+    def test_BaseController_inits_dropped_moves_as_zero(self):
+        assert base.BaseController.dropped_moves == 0
+
     ## BaseController.__init__
+    def test_BaseController_init_sets_latency_attribute(self, mocker):
+        mocker.patch("arrangeit.base.BaseController.setup")
+        mocked = mocker.patch("arrangeit.base.LatencyStats")
+        controller = base.BaseController(mocker.MagicMock())
+        mocked.assert_called_once()
+        mocked.assert_called_with()
+        assert controller.latency == mocked.return_value
+
+    def test_BaseController_init_sets_recorder_for_trace_file(self, mocker):
+        mocker.patch("arrangeit.base.BaseController.setup")
+        mocked_settings = mocker.patch("arrangeit.base.Settings")
+        type(mocked_settings).TRACE_FILE = mocker.PropertyMock(return_value="t.jsonl")
+        mocked = mocker.patch("arrangeit.base.EventsRecorder")
+        controller = base.BaseController(mocker.MagicMock())
+        mocked.assert_called_once()
+        mocked.assert_called_with("t.jsonl")
+        assert controller.recorder == mocked.return_value
+
+    def test_BaseController_init_logs_recorder_error_and_continues(self, mocker):
+        mocker.patch("arrangeit.base.BaseController.setup")
+        mocked_settings = mocker.patch("arrangeit.base.Settings")
+        type(mocked_settings).TRACE_FILE = mocker.PropertyMock(
+            return_value="/missing/t.jsonl"
+        )
+        error = OSError("No such file or directory")
+        mocker.patch("arrangeit.base.EventsRecorder", side_effect=error)
+        mocked_logging = mocker.patch("arrangeit.base.logging")
+        controller = base.BaseController(mocker.MagicMock())
+        mocked_logging.error.assert_called_once()
+        mocked_logging.error.assert_called_with(
+            "Can't record events to %s: %s", "/missing/t.jsonl", error
+        )
+        assert controller.recorder is None
+
+    def test_BaseController_init_not_setting_recorder(self, mocker):
+        mocker.patch("arrangeit.base.BaseController.setup")
+        mocked = mocker.patch("arrangeit.base.EventsRecorder")
+        controller = base.BaseController(mocker.MagicMock())
+        mocked.assert_not_called()
+        assert controller.recorder is None
+
+    def test_BaseController_init_sets_prefetcher(self, mocker):
+        mocker.patch("arrangeit.base.BaseController.setup")
+        mocked_settings = mocker.patch("arrangeit.base.Settings")
+        type(mocked_settings).SCREENSHOT_PREFETCH_COUNT = mocker.PropertyMock(
+            return_value=2
+        )
+        mocked = mocker.patch("arrangeit.base.ScreenshotsPrefetcher")
+        controller = base.BaseController(mocker.MagicMock())
+        mocked.assert_called_once()
+        mocked.assert_called_with()
+        assert controller.prefetcher == mocked.return_value
+
+    def test_BaseController_init_not_setting_prefetcher(self, mocker):
+        mocker.patch("arrangeit.base.BaseController.setup")
+        mocked_settings = mocker.patch("arrangeit.base.Settings")
+        type(mocked_settings).SCREENSHOT_PREFETCH_COUNT = mocker.PropertyMock(
+            return_value=0
+        )
+        mocked = mocker.patch("arrangeit.base.ScreenshotsPrefetcher")
+        controller = base.BaseController(mocker.MagicMock())
+        mocked.assert_not_called()
+        assert controller.prefetcher is None
+
+    def test_BaseController_init_sets_screenshots(self, mocker):
+        mocker.patch("arrangeit.base.BaseController.setup")
+        mocked_settings = mocker.patch("arrangeit.base.Settings")
+        type(mocked_settings).SCREENSHOTS_CACHE_BYTES = mocker.PropertyMock(
+            return_value=4096
+        )
+        mocked = mocker.patch("arrangeit.base.ScreenshotsCache")
+        controller = base.BaseController(mocker.MagicMock())
+        mocked.assert_called_once()
+        mocked.assert_called_with(4096)
+        assert controller.screenshots == mocked.return_value
+
+    def test_BaseController_init_not_setting_screenshots(self, mocker):
+        mocker.patch("arrangeit.base.BaseController.setup")
+        mocked_settings = mocker.patch("arrangeit.base.Settings")
+        type(mocked_settings).SCREENSHOTS_CACHE_BYTES = mocker.PropertyMock(
+            return_value=0
+        )
+        mocked = mocker.patch("arrangeit.base.ScreenshotsCache")
+        controller = base.BaseController(mocker.MagicMock())
+        mocked.assert_not_called()
+        assert controller.screenshots is None
+
     def test_BaseController_init_sets_app_attribute(self, mocker):
         mocker.patch("arrangeit.base.BaseController.setup")
         app = mocker.MagicMock()
@@ -174,6 +274,35 @@ class TestBaseController:
         assert root.geometry.call_count == 1
         root.geometry.assert_called_with("{}x{}".format(w, h))
 
+    def test_BaseController_set_default_geometry_calls_cache_root_geometry(
+        self, mocker
+    ):
+        mocked_setup(mocker)
+        SAMPLE = (244, 145)
+        mocker.patch("arrangeit.base.quarter_by_smaller", return_value=SAMPLE)
+        mocked = mocker.patch("arrangeit.base.BaseController.cache_root_geometry")
+        controller = controller_mocked_app(mocker)
+        controller.set_default_geometry(mocker.MagicMock())
+        mocked.assert_called_once()
+        mocked.assert_called_with(width=SAMPLE[0], height=SAMPLE[1])
+
+    def test_BaseController_set_default_geometry_calls_flush_geometry(self, mocker):
+        mocked_setup(mocker)
+        mocker.patch("arrangeit.base.quarter_by_smaller", return_value=(244, 145))
+        mocked = mocker.patch("arrangeit.base.BaseController.flush_geometry")
+        controller = controller_mocked_app(mocker)
+        controller.set_default_geometry(mocker.MagicMock())
+        mocked.assert_called_once()
+        mocked.assert_called_with()
+
+    def test_BaseController_set_default_geometry_resets_applied_geometry(self, mocker):
+        mocked_setup(mocker)
+        mocker.patch("arrangeit.base.quarter_by_smaller", return_value=(244, 145))
+        controller = controller_mocked_app(mocker)
+        controller.applied_geometry = [10, 20, 300, 200]
+        controller.set_default_geometry(mocker.MagicMock())
+        assert controller.applied_geometry is None
+
     ## BaseController.set_screenshot
     def test_BaseController_set_screenshot_returns_True_for_disabled(self, mocker):
         mocked_setup(mocker)
@@ -202,6 +331,79 @@ class TestBaseController:
             controller.model, root_wid=controller.view.get_root_wid.return_value
         )
 
+    def test_BaseController_set_screenshot_uses_prefetched_screenshot(self, mocker):
+        mocked_setup(mocker)
+        app = mocker.MagicMock()
+        controller = base.BaseController(app)
+        controller.model = base.WindowModel(wid=100, rect=(10, 20, 300, 200))
+        controller.screenshots = None
+        controller.prefetcher = mocker.MagicMock()
+        controller.prefetcher.pop.return_value = ("prefetched", (2, 3))
+        controller.set_screenshot()
+        controller.prefetcher.pop.assert_called_once()
+        controller.prefetcher.pop.assert_called_with(100, (10, 20, 300, 200))
+        app.grab_window_screen.assert_not_called()
+        assert controller.screenshot == "prefetched"
+        controller.screenshot_widget.place.assert_called_with(
+            x=2 + Settings.SCREENSHOT_SHIFT_PIXELS,
+            y=3 + Settings.SCREENSHOT_SHIFT_PIXELS,
+        )
+
+    def test_BaseController_set_screenshot_grabs_not_prefetched(self, mocker):
+        mocked_setup(mocker)
+        app = mocker.MagicMock()
+        app.grab_window_screen.return_value = ("grabbed", (0, 0))
+        controller = base.BaseController(app)
+        controller.model = base.WindowModel(wid=100, rect=(10, 20, 300, 200))
+        controller.screenshots = None
+        controller.prefetcher = mocker.MagicMock()
+        controller.prefetcher.pop.return_value = None
+        controller.set_screenshot()
+        app.grab_window_screen.assert_called_once()
+        assert controller.screenshot == "grabbed"
+
+    def test_BaseController_set_screenshot_uses_cached_screenshot(self, mocker):
+        mocked_setup(mocker)
+        app = mocker.MagicMock()
+        controller = base.BaseController(app)
+        controller.model = base.WindowModel(wid=100, rect=(10, 20, 300, 200))
+        controller.prefetcher = mocker.MagicMock()
+        controller.screenshots = mocker.MagicMock()
+        controller.screenshots.get.return_value = ("cached", (2, 3))
+        controller.set_screenshot()
+        controller.screenshots.get.assert_called_once()
+        controller.screenshots.get.assert_called_with(
+            100,
+            (
+                10,
+                20,
+                300,
+                200,
+                Settings.SCREENSHOT_BLUR_PIXELS,
+                Settings.SCREENSHOT_TO_GRAYSCALE,
+                Settings.SCREENSHOT_DOWNSCALE_FACTOR,
+            ),
+        )
+        controller.prefetcher.pop.assert_not_called()
+        app.grab_window_screen.assert_not_called()
+        assert controller.screenshot == "cached"
+
+    def test_BaseController_set_screenshot_caches_grabbed_screenshot(self, mocker):
+        mocked_setup(mocker)
+        app = mocker.MagicMock()
+        app.grab_window_screen.return_value = ("grabbed", (2, 3))
+        controller = base.BaseController(app)
+        controller.model = base.WindowModel(wid=100, rect=(10, 20, 300, 200))
+        controller.prefetcher = None
+        controller.screenshots = mocker.MagicMock()
+        controller.screenshots.get.return_value = None
+        controller.set_screenshot()
+        app.grab_window_screen.assert_called_once()
+        controller.screenshots.put.assert_called_once()
+        controller.screenshots.put.assert_called_with(
+            100, controller.screenshots.get.call_args[0][1], "grabbed", (2, 3)
+        )
+
     def test_BaseController_set_screenshot_sets_screenshot_reference_variable(
         self, mocker
     ):
@@ -325,6 +527,63 @@ class TestBaseController:
         assert mocked.call_count == 1
         mocked.assert_called_with(master=root.return_value, controller=controller)
 
+    ## BaseController.remove_mouse_wakeup
+    def test_BaseController_remove_mouse_wakeup_without_pipe(self, mocker):
+        view = mocked_setup_view(mocker)
+        mocked = mocker.patch("arrangeit.base.BaseMouse.close_wakeup")
+        controller = base.BaseController(mocker.MagicMock())
+        controller.remove_mouse_wakeup()
+        view.return_value.master.tk.deletefilehandler.assert_not_called()
+        mocked.assert_not_called()
+
+    def test_BaseController_remove_mouse_wakeup_calls_deletefilehandler(self, mocker):
+        view = mocked_setup_view(mocker)
+        mocked = mocker.patch("arrangeit.base.BaseMouse.close_wakeup")
+        controller = base.BaseController(mocker.MagicMock())
+        controller.mouse.wakeup_reader = 7
+        controller.remove_mouse_wakeup()
+        view.return_value.master.tk.deletefilehandler.assert_called_once()
+        view.return_value.master.tk.deletefilehandler.assert_called_with(7)
+        mocked.assert_called_once()
+
+    def test_BaseController_remove_mouse_wakeup_closes_wakeup_on_error(self, mocker):
+        view = mocked_setup_view(mocker)
+        view.return_value.master.tk.deletefilehandler.side_effect = base.tk.TclError()
+        mocked = mocker.patch("arrangeit.base.BaseMouse.close_wakeup")
+        controller = base.BaseController(mocker.MagicMock())
+        controller.mouse.wakeup_reader = 7
+        controller.remove_mouse_wakeup()
+        mocked.assert_called_once()
+
+    ## BaseController.setup_mouse_wakeup
+    def test_BaseController_setup_mouse_wakeup_returns_True_without_handlers(
+        self, mocker
+    ):
+        view = mocked_setup_view(mocker)
+        view.return_value.master.tk = mocker.MagicMock(spec=[])
+        controller = base.BaseController(mocker.MagicMock())
+        assert controller.setup_mouse_wakeup() is True
+
+    def test_BaseController_setup_mouse_wakeup_calls_createfilehandler(self, mocker):
+        view = mocked_setup_view(mocker)
+        mocked = mocker.patch("arrangeit.base.BaseMouse.open_wakeup")
+        controller = base.BaseController(mocker.MagicMock())
+        returned = controller.setup_mouse_wakeup()
+        assert returned is False
+        view.return_value.master.tk.createfilehandler.assert_called_once()
+        view.return_value.master.tk.createfilehandler.assert_called_with(
+            mocked.return_value, base.tk.READABLE, controller.on_mouse_wakeup
+        )
+
+    def test_BaseController_setup_mouse_wakeup_closes_wakeup_on_error(self, mocker):
+        view = mocked_setup_view(mocker)
+        mocker.patch("arrangeit.base.BaseMouse.open_wakeup")
+        view.return_value.master.tk.createfilehandler.side_effect = RuntimeError()
+        mocked = mocker.patch("arrangeit.base.BaseMouse.close_wakeup")
+        controller = base.BaseController(mocker.MagicMock())
+        assert controller.setup_mouse_wakeup() is True
+        mocked.assert_called_once()
+
     ## BaseController.setup_root_window
     def test_BaseController_setup_root_window_calls_wm_attributes(self, mocker):
         mocked_setup(mocker)
@@ -362,7 +621,92 @@ class TestBaseController:
         calls = [mocker.call(background=Settings.MAIN_BG)]
         root.config.assert_has_calls(calls, any_order=True)
 
+    def test_BaseController_setup_root_window_binds_configure_event(self, mocker):
+        mocked_setup(mocker)
+        root = mocker.MagicMock()
+        controller = base.BaseController(None)
+        controller.setup_root_window(root)
+        root.bind.assert_called_once()
+        root.bind.assert_called_with("<Configure>", controller.on_configure)
+
     ## COMMANDS
+    ## BaseController.apply_geometry
+    @pytest.mark.parametrize(
+        "args,expected",
+        [
+            ((10, 20), "+10+20"),
+            ((10, 20, 300, 200), "300x200+10+20"),
+            ((None, None, 300, 200), "300x200"),
+            ((-10, 0, 300, 200), "300x200+-10+0"),
+        ],
+    )
+    def test_BaseController_apply_geometry_calls_master_geometry(
+        self, mocker, args, expected
+    ):
+        view = mocked_setup_view(mocker)
+        controller = controller_mocked_app(mocker)
+        controller.apply_geometry(*args)
+        view.return_value.master.geometry.assert_called_once()
+        view.return_value.master.geometry.assert_called_with(expected)
+
+    def test_BaseController_apply_geometry_calls_cache_root_geometry(self, mocker):
+        mocked_setup(mocker)
+        mocked = mocker.patch("arrangeit.base.BaseController.cache_root_geometry")
+        controller = controller_mocked_app(mocker)
+        controller.apply_geometry(10, 20, 300, 200)
+        mocked.assert_called_once()
+        mocked.assert_called_with(x=10, y=20, width=300, height=200)
+
+    def test_BaseController_apply_geometry_skips_unchanged_geometry(self, mocker):
+        view = mocked_setup_view(mocker)
+        controller = controller_mocked_app(mocker)
+        controller.apply_geometry(10, 20, 300, 200)
+        controller.apply_geometry(10, 20, 300, 200)
+        controller.apply_geometry(10, 20)
+        view.return_value.master.geometry.assert_called_once()
+
+    def test_BaseController_apply_geometry_sets_changed_geometry(self, mocker):
+        view = mocked_setup_view(mocker)
+        controller = controller_mocked_app(mocker)
+        controller.apply_geometry(10, 20, 300, 200)
+        controller.apply_geometry(10, 21)
+        assert view.return_value.master.geometry.call_count == 2
+        view.return_value.master.geometry.assert_called_with("+10+21")
+        assert controller.applied_geometry == [10, 21, 300, 200]
+
+    def test_BaseController_apply_geometry_batching_calls_after_idle_once(self, mocker):
+        view = mocked_setup_view(mocker)
+        mocked_settings = mocker.patch("arrangeit.base.Settings")
+        type(mocked_settings).GEOMETRY_IDLE_BATCHING = mocker.PropertyMock(
+            return_value=True
+        )
+        controller = controller_mocked_app(mocker)
+        controller.apply_geometry(10, 20)
+        controller.apply_geometry(None, None, 300, 200)
+        view.return_value.master.geometry.assert_not_called()
+        view.return_value.master.after_idle.assert_called_once()
+        view.return_value.master.after_idle.assert_called_with(
+            controller.flush_geometry
+        )
+        assert (
+            controller.geometry_idle == view.return_value.master.after_idle.return_value
+        )
+        assert controller.pending_geometry == [10, 20, 300, 200]
+
+    ## BaseController.cache_root_geometry
+    def test_BaseController_cache_root_geometry_initializes_root_geometry(self, mocker):
+        mocked_setup(mocker)
+        controller = controller_mocked_app(mocker)
+        controller.cache_root_geometry(width=300, height=200)
+        assert controller.root_geometry == [None, None, 300, 200]
+
+    def test_BaseController_cache_root_geometry_updates_only_provided(self, mocker):
+        mocked_setup(mocker)
+        controller = controller_mocked_app(mocker)
+        controller.root_geometry = [10, 20, 300, 200]
+        controller.cache_root_geometry(x=50, y=60)
+        assert controller.root_geometry == [50, 60, 300, 200]
+
     ## BaseController.change_position
     def test_BaseController_change_position_calls_check_snapping(self, mocker):
         mocked_setup(mocker)
@@ -700,6 +1044,175 @@ class TestBaseController:
         controller.display_message("barfoo", permanent=True)
         mocked.assert_not_called()
 
+    ## BaseController.flush_geometry
+    def test_BaseController_flush_geometry_calls_after_cancel(self, mocker):
+        view = mocked_setup_view(mocker)
+        controller = controller_mocked_app(mocker)
+        controller.geometry_idle = "after#1"
+        controller.flush_geometry()
+        view.return_value.master.after_cancel.assert_called_once()
+        view.return_value.master.after_cancel.assert_called_with("after#1")
+        assert controller.geometry_idle is None
+
+    def test_BaseController_flush_geometry_sets_pending_geometry(self, mocker):
+        view = mocked_setup_view(mocker)
+        controller = controller_mocked_app(mocker)
+        controller.pending_geometry = [10, 20, 300, 200]
+        controller.flush_geometry()
+        view.return_value.master.geometry.assert_called_once()
+        view.return_value.master.geometry.assert_called_with("300x200+10+20")
+        assert controller.pending_geometry is None
+
+    def test_BaseController_flush_geometry_not_calling_geometry(self, mocker):
+        view = mocked_setup_view(mocker)
+        controller = controller_mocked_app(mocker)
+        controller.flush_geometry()
+        view.return_value.master.after_cancel.assert_not_called()
+        view.return_value.master.geometry.assert_not_called()
+
+    ## BaseController.grab_screenshot
+    def test_BaseController_grab_screenshot_prepares_snapshot_image(self, mocker):
+        mocked_setup(mocker)
+        mocked = mocker.patch("arrangeit.base.get_prepared_screenshot")
+        mocker.patch(
+            "arrangeit.base.BaseController.get_snapshot_image",
+            return_value=("image", (10, 20, 310, 220)),
+        )
+        controller = controller_mocked_app(mocker)
+        controller.screen_size = (1920, 1080)
+        returned = controller.grab_screenshot()
+        mocked.assert_called_once()
+        mocked.assert_called_with(
+            "image",
+            blur_size=Settings.SCREENSHOT_BLUR_PIXELS,
+            grayscale=Settings.SCREENSHOT_TO_GRAYSCALE,
+            downscale=Settings.SCREENSHOT_DOWNSCALE_FACTOR,
+            size=(1920, 1080),
+            box=(10, 20, 310, 220),
+        )
+        controller.app.grab_window_screen.assert_not_called()
+        assert returned == (mocked.return_value, (0, 0))
+
+    def test_BaseController_grab_screenshot_calls_grab_window_screen(self, mocker):
+        mocked_setup(mocker)
+        mocker.patch(
+            "arrangeit.base.BaseController.get_snapshot_image", return_value=None
+        )
+        controller = controller_mocked_app(mocker)
+        returned = controller.grab_screenshot()
+        controller.app.grab_window_screen.assert_called_once()
+        controller.app.grab_window_screen.assert_called_with(
+            controller.model, root_wid=controller.view.get_root_wid.return_value
+        )
+        assert returned == controller.app.grab_window_screen.return_value
+
+    ## BaseController.get_root_geometry
+    def test_BaseController_get_root_geometry_calls_winfo_for_empty_cache(self, mocker):
+        view = mocked_setup_view(mocker)
+        view.return_value.master.winfo_x.return_value = 10
+        view.return_value.master.winfo_y.return_value = 20
+        view.return_value.master.winfo_width.return_value = 300
+        view.return_value.master.winfo_height.return_value = 200
+        controller = controller_mocked_app(mocker)
+        assert controller.get_root_geometry() == (10, 20, 300, 200)
+        assert controller.root_geometry == [10, 20, 300, 200]
+
+    def test_BaseController_get_root_geometry_calls_winfo_only_for_missing(
+        self, mocker
+    ):
+        view = mocked_setup_view(mocker)
+        view.return_value.master.winfo_x.return_value = 10
+        view.return_value.master.winfo_y.return_value = 20
+        controller = controller_mocked_app(mocker)
+        controller.root_geometry = [None, None, 300, 200]
+        assert controller.get_root_geometry() == (10, 20, 300, 200)
+        view.return_value.master.winfo_width.assert_not_called()
+        view.return_value.master.winfo_height.assert_not_called()
+
+    def test_BaseController_get_root_geometry_not_calling_winfo_for_cached(
+        self, mocker
+    ):
+        view = mocked_setup_view(mocker)
+        controller = controller_mocked_app(mocker)
+        controller.root_geometry = [10, 20, 300, 200]
+        assert controller.get_root_geometry() == (10, 20, 300, 200)
+        view.return_value.master.winfo_x.assert_not_called()
+        view.return_value.master.winfo_width.assert_not_called()
+
+    ## BaseController.get_screen_size
+    def test_BaseController_get_screen_size_calls_winfo_once(self, mocker):
+        view = mocked_setup_view(mocker)
+        view.return_value.master.winfo_screenwidth.return_value = 1920
+        view.return_value.master.winfo_screenheight.return_value = 1080
+        controller = controller_mocked_app(mocker)
+        assert controller.get_screen_size() == (1920, 1080)
+        assert controller.get_screen_size() == (1920, 1080)
+        view.return_value.master.winfo_screenwidth.assert_called_once()
+        view.return_value.master.winfo_screenheight.assert_called_once()
+
+    ## BaseController.get_screenshot_key
+    def test_BaseController_get_screenshot_key_functionality(self, mocker):
+        mocked_setup(mocker)
+        controller = controller_mocked_app(mocker)
+        model = base.WindowModel(rect=(10, 20, 300, 200))
+        assert controller.get_screenshot_key(model) == (10, 20, 300, 200)
+        model.set_changed(x=50, w=400)
+        assert controller.get_screenshot_key(model) == (50, 20, 400, 200)
+
+    ## BaseController.get_snapshot_image
+    def test_BaseController_get_snapshot_image_without_snapshot(self, mocker):
+        mocked_setup(mocker)
+        controller = controller_mocked_app(mocker)
+        assert controller.get_snapshot_image(base.WindowModel()) is None
+
+    def test_BaseController_get_snapshot_image_for_other_workspace(self, mocker):
+        mocked_setup(mocker)
+        controller = controller_mocked_app(mocker)
+        controller.snapshot = mocker.MagicMock(workspace=1002)
+        assert controller.get_snapshot_image(base.WindowModel(workspace=1001)) is None
+        controller.snapshot.get.assert_not_called()
+
+    def test_BaseController_get_snapshot_image_functionality(self, mocker):
+        mocked_setup(mocker)
+        controller = controller_mocked_app(mocker)
+        controller.snapshot = mocker.MagicMock(workspace=1001)
+        model = base.WindowModel(wid=100, rect=(10, 20, 300, 200), workspace=1001)
+        returned = controller.get_snapshot_image(model)
+        controller.snapshot.get.assert_called_once()
+        controller.snapshot.get.assert_called_with(100, (10, 20, 300, 200))
+        assert returned == controller.snapshot.get.return_value
+
+    def test_BaseController_get_snapshot_image_for_not_cropped_image(self, mocker):
+        mocked_setup(mocker)
+        controller = controller_mocked_app(mocker)
+        controller.snapshot = mocker.MagicMock(workspace=1001)
+        controller.snapshot.get.return_value = None
+        model = base.WindowModel(wid=100, rect=(10, 20, 300, 200), workspace=1001)
+        assert controller.get_snapshot_image(model) is None
+
+    ## BaseController.get_resized_rect
+    @pytest.mark.parametrize(
+        "state,changed_x,changed_y,expected",
+        [
+            (Settings.RESIZE, 700, 600, (290, 390, 410, 210)),
+            (Settings.RESIZE + 1, 100, 700, (100, 390, 210, 310)),
+            (Settings.RESIZE + 2, 100, 200, (100, 200, 210, 210)),
+            (Settings.RESIZE + 3, 550, 200, (290, 200, 260, 210)),
+        ],
+    )
+    def test_BaseController_get_resized_rect_functionality(
+        self, mocker, state, changed_x, changed_y, expected
+    ):
+        mocked_setup(mocker)
+        mocked_settings = mocker.patch("arrangeit.base.Settings")
+        type(mocked_settings).SHIFT_CURSOR = mocker.PropertyMock(return_value=10)
+        controller = controller_mocked_app(mocker)
+        controller.screen_size = (2000, 2000)
+        controller.state = state
+        controller.model = base.WindowModel(rect=(300, 400, 400, 400))
+        controller.model.set_changed(x=changed_x, y=changed_y)
+        assert controller.get_resized_rect(300, 400) == expected
+
     ## BaseController.get_root_rect
     @pytest.mark.parametrize(
         "state,expected",
@@ -727,23 +1240,22 @@ class TestBaseController:
         assert controller.get_root_rect(x, y) == expected
 
     ## BaseController.listed_window_activated_by_digit
-    def test_BaseController_listed_window_activated_by_digit_calls_winfo_children(
+    def test_BaseController_listed_window_activated_by_digit_calls_get_wid(
         self, mocker
     ):
         view = mocked_setup_view(mocker)
-        view.return_value.windows.winfo_children.return_value = []
+        mocker.patch("arrangeit.base.BaseController.listed_window_activated")
         controller = controller_mocked_app(mocker)
         controller.listed_window_activated_by_digit(2)
-        view.return_value.windows.winfo_children.call_count == 1
+        view.return_value.windows.get_wid.assert_called_once()
+        view.return_value.windows.get_wid.assert_called_with(1)
 
     def test_BaseController_listed_window_activated_by_digit_calls_l_window_activated(
         self, mocker
     ):
         view = mocked_setup_view(mocker)
         mocked = mocker.patch("arrangeit.base.BaseController.listed_window_activated")
-        mocked_children = [mocker.MagicMock(), mocker.MagicMock()]
-        view.return_value.windows.winfo_children.return_value = mocked_children
-        type(mocked_children[1]).wid = mocker.PropertyMock(return_value=70001)
+        view.return_value.windows.get_wid.return_value = 70001
         controller = controller_mocked_app(mocker)
         controller.listed_window_activated_by_digit(2)
         mocked.assert_called_with(70001)
@@ -753,13 +1265,45 @@ class TestBaseController:
     ):
         view = mocked_setup_view(mocker)
         mocked = mocker.patch("arrangeit.base.BaseController.listed_window_activated")
-        mocked_children = [mocker.MagicMock(), mocker.MagicMock()]
-        view.return_value.windows.winfo_children.return_value = mocked_children
-        type(mocked_children[1]).wid = mocker.PropertyMock(return_value=70001)
+        view.return_value.windows.get_wid.return_value = None
         controller = controller_mocked_app(mocker)
         controller.listed_window_activated_by_digit(3)
         mocked.assert_not_called()
 
+    ## BaseController.log_latency_stats
+    def test_BaseController_log_latency_stats_logs_summary(self, mocker):
+        mocked_setup(mocker)
+        mocked = mocker.patch("arrangeit.base.logging.info")
+        controller = controller_mocked_app(mocker)
+        controller.latency.record(0.002, True)
+        controller.latency.record(0.004)
+        controller.dropped_moves = 7
+        controller.log_latency_stats()
+        args = mocked.call_args_list[0][0]
+        assert args[1:] == (2, 1, "2.000", "4.000", "4.000", 7)
+
+    def test_BaseController_log_latency_stats_logs_queue_metrics(self, mocker):
+        mocked_setup(mocker)
+        mocked = mocker.patch("arrangeit.base.logging.info")
+        controller = controller_mocked_app(mocker)
+        controller.mouse.queue = events.EventsRingBuffer(4)
+        controller.screenshots = None
+        controller.log_latency_stats()
+        assert mocked.call_count == 2
+        mocked.assert_called_with("Mouse queue: %s", controller.mouse.queue.metrics())
+
+    def test_BaseController_log_latency_stats_logs_screenshots_cache_metrics(
+        self, mocker
+    ):
+        mocked_setup(mocker)
+        mocked = mocker.patch("arrangeit.base.logging.info")
+        controller = controller_mocked_app(mocker)
+        controller.screenshots = screenshots.ScreenshotsCache(1024)
+        controller.log_latency_stats()
+        mocked.assert_called_with(
+            "Screenshots cache: %s", controller.screenshots.metrics()
+        )
+
     ## BaseController.mouse_move
     def test_BaseController_mouse_move_calls_change_position_for_LOCATE(self, mocker):
         mocked_setup(mocker)
@@ -779,6 +1323,47 @@ class TestBaseController:
         controller.mouse_move(x, y)
         mocked.assert_called_with(x, y)
 
+    def test_BaseController_mouse_move_not_recording_latency(self, mocker):
+        mocked_setup(mocker)
+        mocker.patch("arrangeit.base.BaseController.change_position")
+        mocked = mocker.patch("arrangeit.base.LatencyStats.record")
+        controller = controller_mocked_app(mocker)
+        controller.state = Settings.LOCATE
+        controller.mouse_move(100, 200)
+        mocked.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "method,state,returned,snapped",
+        [
+            ("change_position", Settings.LOCATE, None, False),
+            ("change_position", Settings.LOCATE + 1, True, True),
+            ("change_size", Settings.RESIZE, None, False),
+            ("change_size", Settings.RESIZE + 2, True, True),
+        ],
+    )
+    def test_BaseController_mouse_move_records_latency(
+        self, mocker, method, state, returned, snapped
+    ):
+        mocked_setup(mocker)
+        mocker.patch(
+            "arrangeit.base.BaseController.{}".format(method), return_value=returned
+        )
+        mocker.patch("arrangeit.base.perf_counter", return_value=10.5)
+        mocked = mocker.patch("arrangeit.base.LatencyStats.record")
+        controller = controller_mocked_app(mocker)
+        controller.state = state
+        controller.mouse_move(100, 200, 10.25)
+        mocked.assert_called_once()
+        mocked.assert_called_with(0.25, snapped)
+
+    def test_BaseController_mouse_move_not_recording_latency_for_OTHER(self, mocker):
+        mocked_setup(mocker)
+        mocked = mocker.patch("arrangeit.base.LatencyStats.record")
+        controller = controller_mocked_app(mocker)
+        controller.state = Settings.OTHER
+        controller.mouse_move(100, 200, 10.25)
+        mocked.assert_not_called()
+
     ## BaseController.mouse_scroll
     def test_BaseController_on_mouse_scroll_calls_counter_true_cycle_corners(
         self, mocker
@@ -964,6 +1549,144 @@ class TestBaseController:
         controller.place_on_opposite_corner()
         mocked.assert_called_once()
 
+    def test_BaseController_place_on_opposite_corner_calls_apply_geometry(self, mocker):
+        mocked_setup(mocker)
+        mocker.patch("arrangeit.base.BaseMouse.move_cursor")
+        mocked_rect = mocker.patch(
+            "arrangeit.base.BaseController.get_resized_rect",
+            return_value=(50, 50, 100, 100),
+        )
+        mocked = mocker.patch("arrangeit.base.BaseController.apply_geometry")
+        controller = controller_mocked_app(mocker)
+        controller.screen_size = (2000, 2000)
+        controller.model = base.WindowModel(rect=(50, 50, 100, 100))
+        controller.state = Settings.RESIZE + 2
+        controller.place_on_opposite_corner()
+        mocked_rect.assert_called_once()
+        mocked_rect.assert_called_with(
+            150 - Settings.SHIFT_CURSOR, 150 - Settings.SHIFT_CURSOR
+        )
+        mocked.assert_called_once()
+        mocked.assert_called_with(50, 50, 100, 100)
+
+    def test_BaseController_place_on_opposite_corner_resizes_root_to_window_size(
+        self, mocker
+    ):
+        mocked_setup(mocker)
+        mocker.patch("arrangeit.base.BaseController.next")
+        mocked = mocker.patch("arrangeit.base.BaseMouse.move_cursor")
+        controller = controller_mocked_app(mocker)
+        controller.screen_size = (2560, 1440)
+        controller.model = base.WindowModel(
+            wid=100, rect=(261, 120, 1265, 169), resizable=True
+        )
+        controller.cache_root_geometry(261, 120, 480, 270)
+        controller.state = Settings.LOCATE
+        controller.update(261 + Settings.SHIFT_CURSOR, 120 + Settings.SHIFT_CURSOR)
+        assert controller.get_root_geometry() == (261, 120, 1265, 169)
+        controller.update(*mocked.call_args[0])
+        assert controller.model.changed_w == 1265
+        assert controller.model.changed_h == 169
+        controller.app.run_task.assert_not_called()
+
+    ## BaseController.prefetch_screenshots
+    def get_prefetch_controller(self, mocker, count=2):
+        mocked_setup(mocker)
+        mocked_settings = mocker.patch("arrangeit.base.Settings")
+        type(mocked_settings).SCREENSHOT_PREFETCH_COUNT = mocker.PropertyMock(
+            return_value=count
+        )
+        type(mocked_settings).SCREENSHOT_DISABLED = mocker.PropertyMock(
+            return_value=False
+        )
+        controller = controller_mocked_app(mocker)
+        controller.prefetcher = screenshots.ScreenshotsPrefetcher()
+        controller.prefetcher.executor = mocker.MagicMock()
+        controller.model = base.WindowModel(wid=100, workspace=1001)
+        controller.app.grab_window_image.side_effect = lambda model: (
+            model.wid,
+            (0, 0),
+        )
+        controller.app.collector.collection.get_next_models.return_value = [
+            base.WindowModel(wid=200, workspace=1001, rect=(0, 0, 50, 50)),
+            base.WindowModel(wid=300, workspace=1002, rect=(0, 0, 50, 50)),
+            base.WindowModel(wid=400, workspace=1001, rect=(0, 0, 50, 50)),
+        ]
+        return controller
+
+    def test_BaseController_prefetch_screenshots_calls_get_next_models(self, mocker):
+        controller = self.get_prefetch_controller(mocker, count=3)
+        controller.prefetch_screenshots()
+        method = controller.app.collector.collection.get_next_models
+        method.assert_called_once()
+        method.assert_called_with(100, 3)
+
+    def test_BaseController_prefetch_screenshots_for_zero_count(self, mocker):
+        controller = self.get_prefetch_controller(mocker, count=0)
+        assert controller.prefetch_screenshots() is True
+        controller.app.grab_window_image.assert_not_called()
+
+    def test_BaseController_prefetch_screenshots_grabs_current_workspace_windows(
+        self, mocker
+    ):
+        controller = self.get_prefetch_controller(mocker)
+        controller.prefetch_screenshots()
+        assert controller.app.grab_window_image.call_count == 2
+        assert list(controller.prefetcher.images.keys()) == [200, 400]
+        assert controller.prefetcher.images[200][0] == (0, 0, 50, 50)
+
+    def test_BaseController_prefetch_screenshots_skips_prefetched(self, mocker):
+        controller = self.get_prefetch_controller(mocker)
+        controller.prefetcher.images[200] = ((0, 0, 50, 50), (0, 0), mocker.MagicMock())
+        controller.prefetch_screenshots()
+        controller.app.grab_window_image.assert_called_once()
+        assert controller.app.grab_window_image.call_args[0][0].wid == 400
+
+    def test_BaseController_prefetch_screenshots_drops_not_upcoming(self, mocker):
+        controller = self.get_prefetch_controller(mocker)
+        future = mocker.MagicMock()
+        controller.prefetcher.images[500] = ((0, 0, 50, 50), (0, 0), future)
+        controller.prefetch_screenshots()
+        assert 500 not in controller.prefetcher
+        future.cancel.assert_called_once()
+
+    def test_BaseController_prefetch_screenshots_filters_for_screen_size(self, mocker):
+        controller = self.get_prefetch_controller(mocker)
+        controller.screen_size = (1920, 1080)
+        controller.prefetch_screenshots()
+        submit = controller.prefetcher.executor.submit
+        assert submit.call_args[1]["size"] == (1920, 1080)
+        assert "downscale" in submit.call_args[1]
+
+    def test_BaseController_prefetch_screenshots_uses_snapshot_image(self, mocker):
+        controller = self.get_prefetch_controller(mocker)
+        mocker.patch(
+            "arrangeit.base.BaseController.get_snapshot_image",
+            return_value=("image", (10, 20, 60, 70)),
+        )
+        controller.prefetch_screenshots()
+        controller.app.grab_window_image.assert_not_called()
+        assert len(controller.prefetcher) == 2
+        submit = controller.prefetcher.executor.submit
+        assert submit.call_args[0][1] == "image"
+        assert submit.call_args[1]["box"] == (10, 20, 60, 70)
+        assert controller.prefetcher.images[200][1] == (0, 0)
+
+    def test_BaseController_prefetch_screenshots_grabbed_image_without_box(
+        self, mocker
+    ):
+        controller = self.get_prefetch_controller(mocker)
+        controller.prefetch_screenshots()
+        submit = controller.prefetcher.executor.submit
+        assert submit.call_args[1]["box"] is None
+
+    def test_BaseController_prefetch_screenshots_for_unsupported_platform(self, mocker):
+        controller = self.get_prefetch_controller(mocker)
+        controller.app.grab_window_image.side_effect = None
+        controller.app.grab_window_image.return_value = None
+        controller.prefetch_screenshots()
+        assert len(controller.prefetcher) == 0
+
     ## BaseController.recapture_mouse
     def test_BaseController_recapture_mouse_calls_view_setup_bindings(self, mocker):
         view = mocked_setup_view(mocker)
@@ -1090,34 +1813,12 @@ class TestBaseController:
         mocked.assert_called_with()
 
     ## BaseController.remove_listed_window
-    def test_BaseController_remove_listed_window_calls_widget_destroy(self, mocker):
-        view = mocked_setup_view(mocker)
-        widget = mocker.MagicMock()
-        type(widget).wid = mocker.PropertyMock(return_value=100)
-        view.return_value.windows.winfo_children.return_value = [widget]
-        controller = controller_mocked_app(mocker)
-        controller.remove_listed_window(100)
-        assert widget.destroy.call_count == 1
-
-    def test_BaseController_remove_listed_window_not_calling_destroy_for_wrong_widget(
-        self, mocker
-    ):
+    def test_BaseController_remove_listed_window_calls_remove_window(self, mocker):
         view = mocked_setup_view(mocker)
-        widget = mocker.MagicMock()
-        type(widget).wid = mocker.PropertyMock(return_value=100)
-        view.return_value.windows.winfo_children.return_value = [widget]
-        controller = controller_mocked_app(mocker)
-        controller.remove_listed_window(201)
-        assert widget.destroy.call_count == 0
-
-    def test_BaseController_remove_listed_window_calls_place_children(self, mocker):
-        view = mocked_setup_view(mocker)
-        widget = mocker.MagicMock()
-        type(widget).wid = mocker.PropertyMock(return_value=100)
-        view.return_value.windows.winfo_children.return_value = [widget]
         controller = controller_mocked_app(mocker)
         controller.remove_listed_window(100)
-        assert view.return_value.windows.place_children.call_count == 1
+        view.return_value.windows.remove_window.assert_called_once()
+        view.return_value.windows.remove_window.assert_called_with(100)
 
     ## BaseController.resizing_state_counterpart
     @pytest.mark.parametrize("state,expected", [(0, 12), (1, 13), (2, 10), (3, 11)])
@@ -1147,6 +1848,19 @@ class TestBaseController:
         mocked.assert_called_once()
         mocked.assert_called_with()
 
+    @pytest.mark.parametrize("value,count", [(True, 1), (False, 0)])
+    def test_BaseController_shutdown_calls_log_latency_stats(
+        self, mocker, value, count
+    ):
+        mocked_setup(mocker)
+        mocker.patch("sys.exit")
+        mocker.patch("arrangeit.base.BaseMouse")
+        mocked_settings = mocker.patch("arrangeit.base.Settings")
+        type(mocked_settings).LATENCY_STATS = mocker.PropertyMock(return_value=value)
+        mocked = mocker.patch("arrangeit.base.BaseController.log_latency_stats")
+        controller_mocked_app(mocker).shutdown()
+        assert mocked.call_count == count
+
     def test_BaseController_shutdown_calls_master_destroy(self, mocker):
         view = mocked_setup_view(mocker)
         mocker.patch("sys.exit")
@@ -1164,6 +1878,41 @@ class TestBaseController:
             controller.shutdown()
         assert exception.value.code == 0
 
+    def test_BaseController_shutdown_closes_recorder(self, mocker):
+        mocked_setup(mocker)
+        mocker.patch("sys.exit")
+        mocker.patch("arrangeit.base.BaseMouse")
+        controller = controller_mocked_app(mocker)
+        controller.recorder = mocker.MagicMock()
+        controller.shutdown()
+        controller.recorder.close.assert_called_once()
+
+    def test_BaseController_shutdown_stops_prefetcher(self, mocker):
+        mocked_setup(mocker)
+        mocker.patch("sys.exit")
+        mocker.patch("arrangeit.base.BaseMouse")
+        controller = controller_mocked_app(mocker)
+        controller.prefetcher = mocker.MagicMock()
+        controller.shutdown()
+        controller.prefetcher.shutdown.assert_called_once()
+
+    def test_BaseController_shutdown_calls_remove_mouse_wakeup(self, mocker):
+        mocked_setup(mocker)
+        mocker.patch("sys.exit")
+        mocker.patch("arrangeit.base.BaseMouse")
+        mocked = mocker.patch("arrangeit.base.BaseController.remove_mouse_wakeup")
+        controller_mocked_app(mocker).shutdown()
+        mocked.assert_called_once()
+        mocked.assert_called_with()
+
+    def test_BaseController_shutdown_runs_shutdown_cleanup_task(self, mocker):
+        mocked_setup(mocker)
+        mocker.patch("sys.exit")
+        mocker.patch("arrangeit.base.BaseMouse")
+        controller = controller_mocked_app(mocker)
+        controller.shutdown()
+        controller.app.run_task.assert_called_with("shutdown_cleanup")
+
     ## BaseController.set_minimum_size
     def test_BaseController_set_minimum_size_functionality(self, mocker):
         view = mocked_setup_view(mocker)
@@ -1360,23 +2109,131 @@ class TestBaseController:
         mocked.assert_called_once()
         mocked.assert_called_with(MESSAGES["msg_switch_workspace"])
 
-    ## BaseController.workspace_activated_by_digit
-    def test_BaseController_workspace_activated_by_digit_calls_winfo_children(
+    ## BaseController.take_desktop_snapshot
+    def get_snapshot_controller(self, mocker, enabled=True):
+        mocked_setup(mocker)
+        mocked_settings = mocker.patch("arrangeit.base.Settings")
+        type(mocked_settings).SCREENSHOT_DESKTOP_GRAB = mocker.PropertyMock(
+            return_value=enabled
+        )
+        type(mocked_settings).SCREENSHOT_DISABLED = mocker.PropertyMock(
+            return_value=False
+        )
+        controller = controller_mocked_app(mocker)
+        controller.model = base.WindowModel(wid=100, workspace=1001)
+        controller.app.collector.get_monitors_rects.return_value = [
+            (0, 0, 1920, 1080),
+            (1920, 0, 1920, 1080),
+        ]
+        controller.app.get_stacked_windows.return_value = [
+            (200, (0, 0, 400, 400)),
+            (300, (300, 300, 400, 400)),
+            (400, (2000, 0, 400, 400)),
+        ]
+        return controller
+
+    def test_BaseController_take_desktop_snapshot_not_enabled(self, mocker):
+        controller = self.get_snapshot_controller(mocker, enabled=False)
+        assert controller.take_desktop_snapshot() is True
+        controller.app.grab_monitor_image.assert_not_called()
+        assert controller.snapshot is None
+
+    def test_BaseController_take_desktop_snapshot_for_same_workspace(self, mocker):
+        controller = self.get_snapshot_controller(mocker)
+        snapshot = mocker.MagicMock(workspace=1001)
+        controller.snapshot = snapshot
+        assert controller.take_desktop_snapshot() is True
+        controller.app.grab_monitor_image.assert_not_called()
+        assert controller.snapshot == snapshot
+
+    def test_BaseController_take_desktop_snapshot_sets_empty_snapshot(self, mocker):
+        controller = self.get_snapshot_controller(mocker)
+        controller.snapshot = mocker.MagicMock(workspace=1002)
+        assert controller.take_desktop_snapshot() is None
+        assert controller.snapshot.workspace == 1001
+        assert controller.snapshot.monitors == []
+        assert controller.snapshot.visible == set()
+        controller.app.grab_monitor_image.assert_not_called()
+
+    def test_BaseController_take_desktop_snapshot_defers_grabbing(self, mocker):
+        controller = self.get_snapshot_controller(mocker)
+        type(base.Settings).SCREENSHOT_DESKTOP_GRAB_DELAY = mocker.PropertyMock(
+            return_value=150
+        )
+        controller.take_desktop_snapshot()
+        controller.view.master.update_idletasks.assert_called_once()
+        controller.view.master.after.assert_called_once()
+        controller.view.master.after.assert_called_with(
+            150, controller.grab_desktop_snapshot, controller.snapshot
+        )
+
+    ## BaseController.grab_desktop_snapshot
+    def test_BaseController_grab_desktop_snapshot_for_other_snapshot(self, mocker):
+        controller = self.get_snapshot_controller(mocker)
+        controller.snapshot = base.DesktopSnapshot(1001, [], set())
+        snapshot = base.DesktopSnapshot(1002, [], set())
+        assert controller.grab_desktop_snapshot(snapshot) is True
+        controller.app.grab_monitor_image.assert_not_called()
+        assert snapshot.monitors == []
+
+    def test_BaseController_grab_desktop_snapshot_for_unsupported_platform(
         self, mocker
     ):
+        controller = self.get_snapshot_controller(mocker)
+        controller.snapshot = base.DesktopSnapshot(1001, [], set())
+        controller.app.grab_monitor_image.return_value = None
+        assert controller.grab_desktop_snapshot(controller.snapshot) is True
+        assert controller.snapshot.monitors == []
+        assert controller.snapshot.visible == set()
+
+    def test_BaseController_grab_desktop_snapshot_functionality(self, mocker):
+        controller = self.get_snapshot_controller(mocker)
+        controller.snapshot = base.DesktopSnapshot(1001, [], set())
+        controller.app.grab_monitor_image.side_effect = lambda rect: rect[0]
+        master = controller.view.master
+        master.winfo_rootx.return_value = 500
+        master.winfo_rooty.return_value = 500
+        master.winfo_width.return_value = 100
+        master.winfo_height.return_value = 100
+        assert controller.grab_desktop_snapshot(controller.snapshot) is None
+        controller.app.get_stacked_windows.assert_called_with(1001)
+        assert controller.snapshot.workspace == 1001
+        assert controller.snapshot.monitors == [
+            ((0, 0, 1920, 1080), 0),
+            ((1920, 0, 1920, 1080), 1920),
+        ]
+        assert controller.snapshot.visible == {400}
+
+    def test_BaseController_grab_desktop_snapshot_uses_actual_root_geometry(
+        self, mocker
+    ):
+        controller = self.get_snapshot_controller(mocker)
+        controller.snapshot = base.DesktopSnapshot(1001, [], set())
+        controller.app.grab_monitor_image.side_effect = lambda rect: rect[0]
+        master = controller.view.master
+        master.winfo_rootx.return_value = 2100
+        master.winfo_rooty.return_value = 100
+        master.winfo_width.return_value = 100
+        master.winfo_height.return_value = 100
+        controller.grab_desktop_snapshot(controller.snapshot)
+        assert controller.snapshot.visible == {300}
+
+    ## BaseController.workspace_activated_by_digit
+    def test_BaseController_workspace_activated_by_digit_calls_get_number(self, mocker):
         view = mocked_setup_view(mocker)
+        mocker.patch("arrangeit.base.BaseController.workspace_activated")
         controller = controller_mocked_app(mocker)
         controller.workspace_activated_by_digit(1)
-        view.return_value.workspaces.winfo_children.call_count == 1
+        view.return_value.workspaces.get_number.assert_called_once()
+        view.return_value.workspaces.get_number.assert_called_with(0)
+        view.return_value.workspaces.winfo_children.assert_not_called()
 
     def test_BaseController_workspace_activated_by_digit_calls_workspace_activated(
         self, mocker
     ):
         view = mocked_setup_view(mocker)
-        mocked_children = [mocker.MagicMock(), mocker.MagicMock()]
-        view.return_value.workspaces.winfo_children.return_value = mocked_children
         number = 1052
-        type(mocked_children[1]).number = mocker.PropertyMock(return_value=number)
+        view.return_value.workspaces.get_number.return_value = number
         mocked = mocker.patch("arrangeit.base.BaseController.workspace_activated")
         controller = controller_mocked_app(mocker)
         controller.workspace_activated_by_digit(2)
@@ -1386,8 +2243,7 @@ class TestBaseController:
         self, mocker
     ):
         view = mocked_setup_view(mocker)
-        mocked_children = [mocker.MagicMock(), mocker.MagicMock()]
-        view.return_value.workspaces.winfo_children.return_value = mocked_children
+        view.return_value.workspaces.get_number.return_value = None
         mocked = mocker.patch("arrangeit.base.BaseController.workspace_activated")
         controller = controller_mocked_app(mocker)
         controller.workspace_activated_by_digit(3)
@@ -1409,6 +2265,23 @@ class TestBaseController:
         )
         assert returned == "break"
 
+    ## BaseController.on_configure
+    def test_BaseController_on_configure_sets_root_geometry(self, mocker):
+        view = mocked_setup_view(mocker)
+        controller = controller_mocked_app(mocker)
+        event = mocker.MagicMock(
+            widget=view.return_value.master, x=10, y=20, width=300, height=200
+        )
+        controller.on_configure(event)
+        assert controller.root_geometry == [10, 20, 300, 200]
+
+    def test_BaseController_on_configure_skips_children_events(self, mocker):
+        mocked_setup(mocker)
+        controller = controller_mocked_app(mocker)
+        controller.root_geometry = [10, 20, 300, 200]
+        controller.on_configure(mocker.MagicMock(x=0, y=0, width=50, height=50))
+        assert controller.root_geometry == [10, 20, 300, 200]
+
     ## BaseController.on_focus
     def test_BaseController_on_focus_calls_focus_get(self, mocker):
         view = mocked_setup_view(mocker)
@@ -1447,6 +2320,15 @@ class TestBaseController:
         assert returned == None
 
     ## BaseController.on_key_pressed
+    def test_BaseController_on_key_pressed_records_key(self, mocker):
+        mocked_setup(mocker)
+        mocker.patch("arrangeit.base.BaseController.cycle_corners")
+        controller = base.BaseController(mocker.MagicMock())
+        controller.recorder = mocker.MagicMock()
+        controller.on_key_pressed(mocker.MagicMock(keysym="Control_L"))
+        controller.recorder.record.assert_called_once()
+        controller.recorder.record.assert_called_with("k", "Control_L")
+
     def test_BaseController_on_key_pressed_for_Escape_calls_shutdown(self, mocker):
         mocked_setup(mocker)
         mocked = mocker.patch("arrangeit.base.BaseController.shutdown")
@@ -1485,6 +2367,13 @@ class TestBaseController:
         controller_mocked_key_press(mocker, key)
         assert mocked.call_count == 1
 
+    @pytest.mark.parametrize("key", ["S", "s"])
+    def test_BaseController_on_key_pressed_calls_log_latency_stats(self, mocker, key):
+        mocked_setup(mocker)
+        mocked = mocker.patch("arrangeit.base.BaseController.log_latency_stats")
+        controller_mocked_key_press(mocker, key)
+        assert mocked.call_count == 1
+
     @pytest.mark.parametrize("key", ["Alt_L", "Alt_R", "Shift_L", "Shift_R"])
     def test_BaseController_on_key_pressed_calls_release_mouse(self, mocker, key):
         mocked_setup(mocker)
@@ -1678,6 +2567,79 @@ class TestBaseController:
             controller.mouse_move, *VALUE
         )
 
+    def test_BaseController_check_mouse_records_all_items(self, mocker):
+        mocked_setup(mocker)
+        mocker.patch(
+            "arrangeit.base.BaseMouse.get_item",
+            side_effect=[(10, 10), True, (13, 14), None],
+        )
+        controller = base.BaseController(mocker.MagicMock())
+        controller.recorder = mocker.MagicMock()
+        controller.check_mouse()
+        calls = [mocker.call((10, 10)), mocker.call(True), mocker.call((13, 14))]
+        controller.recorder.record_item.assert_has_calls(calls, any_order=False)
+        assert controller.recorder.record_item.call_count == 3
+
+    def test_BaseController_check_mouse_coalesces_mouse_moves(self, mocker):
+        view = mocked_setup_view(mocker)
+        mocked_settings = mocker.patch("arrangeit.base.Settings")
+        type(mocked_settings).MOUSE_COALESCE_MOVES = mocker.PropertyMock(
+            return_value=True
+        )
+        mocker.patch(
+            "arrangeit.base.BaseMouse.get_item",
+            side_effect=[(10, 10), (11, 12), (13, 14), None],
+        )
+        controller = base.BaseController(mocker.MagicMock())
+        controller.check_mouse()
+        view.return_value.master.after_idle.assert_called_once()
+        view.return_value.master.after_idle.assert_called_with(
+            controller.mouse_move, 13, 14
+        )
+        assert controller.dropped_moves == 2
+
+    def test_BaseController_check_mouse_coalescing_keeps_scrolls_order(self, mocker):
+        view = mocked_setup_view(mocker)
+        mocked_settings = mocker.patch("arrangeit.base.Settings")
+        type(mocked_settings).MOUSE_COALESCE_MOVES = mocker.PropertyMock(
+            return_value=True
+        )
+        mocker.patch(
+            "arrangeit.base.BaseMouse.get_item",
+            side_effect=[(10, 10), (11, 12), True, False, (13, 14), (15, 16), None],
+        )
+        controller = base.BaseController(mocker.MagicMock())
+        controller.check_mouse()
+        calls = [
+            mocker.call(controller.mouse_move, 11, 12),
+            mocker.call(controller.mouse_scroll, True),
+            mocker.call(controller.mouse_scroll, False),
+            mocker.call(controller.mouse_move, 15, 16),
+        ]
+        view.return_value.master.after_idle.assert_has_calls(calls, any_order=False)
+        assert view.return_value.master.after_idle.call_count == 4
+        assert controller.dropped_moves == 2
+
+    def test_BaseController_check_mouse_without_coalescing(self, mocker):
+        view = mocked_setup_view(mocker)
+        mocked_settings = mocker.patch("arrangeit.base.Settings")
+        type(mocked_settings).MOUSE_COALESCE_MOVES = mocker.PropertyMock(
+            return_value=False
+        )
+        mocker.patch(
+            "arrangeit.base.BaseMouse.get_item",
+            side_effect=[(10, 10), (11, 12), (13, 14), None],
+        )
+        controller = base.BaseController(mocker.MagicMock())
+        controller.check_mouse()
+        calls = [
+            mocker.call(controller.mouse_move, 10, 10),
+            mocker.call(controller.mouse_move, 11, 12),
+            mocker.call(controller.mouse_move, 13, 14),
+        ]
+        view.return_value.master.after_idle.assert_has_calls(calls, any_order=False)
+        assert controller.dropped_moves == 0
+
     def test_BaseController_check_mouse_calls_after_with_itself(self, mocker):
         view = mocked_setup_view(mocker)
         mocker.patch("arrangeit.base.BaseMouse.get_item", return_value=None)
@@ -1689,17 +2651,75 @@ class TestBaseController:
             Settings.MOUSE_CHECK_INTERVAL, controller.check_mouse
         )
 
+    def test_BaseController_check_mouse_calls_dispatch_mouse_events(self, mocker):
+        mocked_setup_view(mocker)
+        mocked = mocker.patch("arrangeit.base.BaseController.dispatch_mouse_events")
+        controller = base.BaseController(mocker.MagicMock())
+        controller.check_mouse()
+        mocked.assert_called_once()
+        mocked.assert_called_with()
+
     ## BaseController.mainloop
     def test_BaseController_mainloop_calls_after_for_check_mouse(self, mocker):
         view = mocked_setup_view(mocker)
+        mocked_settings = mocker.patch("arrangeit.base.Settings")
+        type(mocked_settings).MOUSE_EVENT_DRIVEN = mocker.PropertyMock(
+            return_value=False
+        )
         controller = base.BaseController(mocker.MagicMock())
         controller.mainloop()
         view.return_value.master.after.assert_called_once()
         view.return_value.master.after.assert_called_with(
-            Settings.MOUSE_CHECK_INTERVAL, controller.check_mouse
+            mocked_settings.MOUSE_CHECK_INTERVAL, controller.check_mouse
+        )
+
+    def test_BaseController_mainloop_calls_setup_mouse_wakeup(self, mocker):
+        view = mocked_setup_view(mocker)
+        mocked_settings = mocker.patch("arrangeit.base.Settings")
+        type(mocked_settings).MOUSE_EVENT_DRIVEN = mocker.PropertyMock(
+            return_value=True
+        )
+        mocked = mocker.patch(
+            "arrangeit.base.BaseController.setup_mouse_wakeup", return_value=False
+        )
+        base.BaseController(mocker.MagicMock()).mainloop()
+        mocked.assert_called_once()
+        mocked.assert_called_with()
+        view.return_value.master.after.assert_not_called()
+
+    def test_BaseController_mainloop_falls_back_to_polling(self, mocker):
+        view = mocked_setup_view(mocker)
+        mocked_settings = mocker.patch("arrangeit.base.Settings")
+        type(mocked_settings).MOUSE_EVENT_DRIVEN = mocker.PropertyMock(
+            return_value=True
+        )
+        mocker.patch(
+            "arrangeit.base.BaseController.setup_mouse_wakeup", return_value=True
+        )
+        controller = base.BaseController(mocker.MagicMock())
+        controller.mainloop()
+        view.return_value.master.after.assert_called_once()
+        view.return_value.master.after.assert_called_with(
+            mocked_settings.MOUSE_CHECK_INTERVAL, controller.check_mouse
         )
 
     def test_BaseController_mainloop_calls_Tkinter_mainloop(self, mocker):
         view = mocked_setup_view(mocker)
         base.BaseController(mocker.MagicMock()).mainloop()
         assert view.return_value.mainloop.call_count == 1
+
+    ## BaseController.on_mouse_wakeup
+    def test_BaseController_on_mouse_wakeup_calls_clear_wakeup(self, mocker):
+        mocked_setup_view(mocker)
+        mocker.patch("arrangeit.base.BaseController.dispatch_mouse_events")
+        mocked = mocker.patch("arrangeit.base.BaseMouse.clear_wakeup")
+        base.BaseController(mocker.MagicMock()).on_mouse_wakeup(5, 2)
+        mocked.assert_called_once()
+        mocked.assert_called_with()
+
+    def test_BaseController_on_mouse_wakeup_calls_dispatch_mouse_events(self, mocker):
+        mocked_setup_view(mocker)
+        mocked = mocker.patch("arrangeit.base.BaseController.dispatch_mouse_events")
+        base.BaseController(mocker.MagicMock()).on_mouse_wakeup(5, 2)
+        mocked.assert_called_once()
+        mocked.assert_called_with()
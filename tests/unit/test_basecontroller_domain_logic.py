@@ -18,7 +18,8 @@ import pytest
 
 from arrangeit import base
 from arrangeit.settings import MESSAGES, Settings
-from arrangeit.utils import Rectangle
+from arrangeit.snapping import SnappingIndex
+from arrangeit.utils import Rectangle, get_snapping_sources_for_rect
 
 from .fixtures import ROOT_SNAPPING_RECTANGLES_SOURCES
 from .mock_helpers import (
@@ -40,6 +41,8 @@ class TestBaseControllerDomainLogic:
         mocked_check = mocker.patch(
             "arrangeit.base.BaseController.check_snapping_state"
         )
+        mocker.patch("arrangeit.base.BaseController.get_resized_rect")
+        mocker.patch("arrangeit.base.BaseController.apply_geometry")
         mocked = mocker.patch("arrangeit.base.BaseMouse.move_cursor")
         controller = controller_mocked_app(mocker)
         controller.state = Settings.RESIZE
@@ -49,6 +52,81 @@ class TestBaseControllerDomainLogic:
         mocked.assert_called_with(NEW_X, NEW_Y)
         mocked_check.assert_not_called()
 
+    def test_BaseController_apply_snapping_calls_apply_geometry_for_RESIZE(
+        self, mocker
+    ):
+        mocked_setup(mocker)
+        mocker.patch("arrangeit.base.BaseMouse.move_cursor")
+        mocked_rect = mocker.patch(
+            "arrangeit.base.BaseController.get_resized_rect",
+            return_value=(10, 20, 300, 400),
+        )
+        mocked = mocker.patch("arrangeit.base.BaseController.apply_geometry")
+        controller = controller_mocked_app(mocker)
+        controller.state = Settings.RESIZE
+        controller.apply_snapping(101, 202, [], [])
+        mocked_rect.assert_called_once()
+        mocked_rect.assert_called_with(101, 202)
+        mocked.assert_called_once()
+        mocked.assert_called_with(10, 20, 300, 400)
+
+    def test_BaseController_apply_snapping_calls_apply_geometry_for_LOCATE(
+        self, mocker
+    ):
+        mocked_setup(mocker)
+        mocker.patch(
+            "arrangeit.base.BaseController.check_snapping_state", return_value=None
+        )
+        mocker.patch("arrangeit.base.BaseMouse.move_cursor")
+        mocked_rect = mocker.patch(
+            "arrangeit.base.BaseController.get_root_rect",
+            return_value=(10, 20, 300, 400),
+        )
+        mocked = mocker.patch("arrangeit.base.BaseController.apply_geometry")
+        controller = controller_mocked_app(mocker)
+        controller.state = Settings.LOCATE
+        controller.apply_snapping(101, 202, [], [])
+        mocked_rect.assert_called_once()
+        mocked_rect.assert_called_with(101, 202)
+        mocked.assert_called_once()
+        mocked.assert_called_with(10, 20)
+
+    @pytest.mark.parametrize(
+        "state,x,y,geometry,changed",
+        [
+            (Settings.LOCATE, 408, 206, (400, 200, 200, 150), (400, 200, 200, 150)),
+            (Settings.RESIZE, 407, 306, (400, 300, 300, 300), (400, 300, 300, 300)),
+        ],
+    )
+    def test_BaseController_apply_snapping_places_root_and_saves_snapped_geometry(
+        self, mocker, state, x, y, geometry, changed
+    ):
+        mocked_setup(mocker)
+        mocker.patch("arrangeit.base.BaseController.next")
+        mocked = mocker.patch("arrangeit.base.BaseMouse.move_cursor")
+        controller = controller_mocked_app(mocker)
+        controller.screen_size = (1920, 1080)
+        controller.snapping_targets = {
+            controller.view.workspaces.active: SnappingIndex(
+                [
+                    get_snapping_sources_for_rect(
+                        (100, 100, 300, 300), Settings.SNAP_PIXELS
+                    )
+                ]
+            )
+        }
+        controller.model = base.WindowModel(wid=100, rect=(10, 10, 200, 150))
+        if state == Settings.RESIZE:
+            controller.model.set_changed(x=700, y=600)
+            controller.cache_root_geometry(410, 300, 290, 300)
+        else:
+            controller.cache_root_geometry(10, 10, 200, 150)
+        controller.state = state
+        controller.mouse_move(x, y)
+        assert controller.get_root_geometry() == geometry
+        controller.update(*mocked.call_args[0])
+        assert controller.model.changed == changed
+
     def test_BaseController_apply_snapping_calls_check_snapping_state(self, mocker):
         mocked_setup(mocker)
         mocker.patch("arrangeit.base.BaseMouse.move_cursor")
@@ -175,14 +253,17 @@ class TestBaseControllerDomainLogic:
     def test_BaseController_check_snapping_calls_get_root_rect(self, mocker):
         view = mocked_setup_view(mocker)
         mocker.patch("arrangeit.base.BaseMouse")
-        mocker.patch("arrangeit.base.check_intersections")
+        mocker.patch("arrangeit.base.nearest_intersections")
         mocked_settings = mocker.patch("arrangeit.base.Settings")
         type(mocked_settings).SNAPPING_IS_ON = mocker.PropertyMock(return_value=True)
         type(mocked_settings).LOCATE = mocker.PropertyMock(return_value=0)
         type(mocked_settings).RESIZE = mocker.PropertyMock(return_value=10)
         type(mocked_settings).SNAP_PIXELS = mocker.PropertyMock(return_value=10)
         mocker.patch("arrangeit.base.BaseController.apply_snapping")
-        mocked = mocker.patch("arrangeit.base.BaseController.get_root_rect")
+        mocked = mocker.patch(
+            "arrangeit.base.BaseController.get_root_rect",
+            return_value=(100, 200, 300, 400),
+        )
         x, y = 100, 200
         controller = controller_mocked_app(mocker)
         view.return_value.workspaces.active = 1001
@@ -197,7 +278,7 @@ class TestBaseControllerDomainLogic:
     ):
         view = mocked_setup_view(mocker)
         mocker.patch("arrangeit.base.BaseMouse")
-        mocker.patch("arrangeit.base.check_intersections")
+        mocker.patch("arrangeit.base.nearest_intersections")
         mocked_settings = mocker.patch("arrangeit.base.Settings")
         type(mocked_settings).SNAPPING_IS_ON = mocker.PropertyMock(return_value=True)
         type(mocked_settings).LOCATE = mocker.PropertyMock(return_value=0)
@@ -221,7 +302,7 @@ class TestBaseControllerDomainLogic:
     ):
         view = mocked_setup_view(mocker)
         mocker.patch("arrangeit.base.BaseMouse")
-        mocker.patch("arrangeit.base.check_intersections")
+        mocker.patch("arrangeit.base.nearest_intersections")
         mocked_settings = mocker.patch("arrangeit.base.Settings")
         type(mocked_settings).SNAPPING_IS_ON = mocker.PropertyMock(return_value=True)
         type(mocked_settings).LOCATE = mocker.PropertyMock(return_value=0)
@@ -242,7 +323,7 @@ class TestBaseControllerDomainLogic:
             mocked_rect.return_value, SNAP, corner=controller.state % 10
         )
 
-    def test_BaseController_check_snapping_calls_check_intersection(self, mocker):
+    def test_BaseController_check_snapping_calls_nearest_intersections(self, mocker):
         view = mocked_setup_view(mocker)
         mocker.patch("arrangeit.base.BaseMouse")
         mocked_settings = mocker.patch("arrangeit.base.Settings")
@@ -253,7 +334,7 @@ class TestBaseControllerDomainLogic:
         type(mocked_settings).SNAP_PIXELS = mocker.PropertyMock(return_value=SNAP)
         mocker.patch("arrangeit.base.BaseController.apply_snapping")
         root_rects = mocker.patch("arrangeit.base.get_snapping_sources_for_rect")
-        mocked = mocker.patch("arrangeit.base.check_intersections")
+        mocked = mocker.patch("arrangeit.base.nearest_intersections")
         view.return_value.workspaces.active = 1001
         controller = controller_mocked_app(mocker)
         SAMPLE = ["foo"]
@@ -273,7 +354,7 @@ class TestBaseControllerDomainLogic:
         SNAP = 4
         type(mocked_settings).SNAP_PIXELS = mocker.PropertyMock(return_value=SNAP)
         mocker.patch("arrangeit.base.BaseController.apply_snapping")
-        mocked_check = mocker.patch("arrangeit.base.check_intersections")
+        mocked_check = mocker.patch("arrangeit.base.nearest_intersections")
         mocked = mocker.patch("arrangeit.base.offset_for_intersections")
         view.return_value.workspaces.active = 1001
         controller = controller_mocked_app(mocker)
@@ -293,7 +374,7 @@ class TestBaseControllerDomainLogic:
         SNAP = 4
         type(mocked_settings).SNAP_PIXELS = mocker.PropertyMock(return_value=SNAP)
         mocked_sources = mocker.patch("arrangeit.base.get_snapping_sources_for_rect")
-        mocked_intersections = mocker.patch("arrangeit.base.check_intersections")
+        mocked_intersections = mocker.patch("arrangeit.base.nearest_intersections")
         offset = (10, 12)
         mocker.patch("arrangeit.base.offset_for_intersections", return_value=offset)
         mocker.patch("arrangeit.base.BaseMouse.move_cursor")
@@ -322,7 +403,7 @@ class TestBaseControllerDomainLogic:
         type(mocked_settings).RESIZE = mocker.PropertyMock(return_value=10)
         SNAP = 4
         type(mocked_settings).SNAP_PIXELS = mocker.PropertyMock(return_value=SNAP)
-        mocker.patch("arrangeit.base.check_intersections")
+        mocker.patch("arrangeit.base.nearest_intersections")
         offset = (0, 0)
         mocker.patch("arrangeit.base.offset_for_intersections", return_value=offset)
         mocked = mocker.patch("arrangeit.base.BaseMouse.move_cursor")
@@ -338,6 +419,29 @@ class TestBaseControllerDomainLogic:
         mocked_check.assert_not_called()
         assert returned is False
 
+    def test_BaseController_check_snapping_switches_corner_for_other_side(self, mocker):
+        mocked_setup(mocker)
+        mocked_corner = mocker.patch("arrangeit.base.BaseController.setup_corner")
+        mocked = mocker.patch("arrangeit.base.BaseMouse.move_cursor")
+        controller = controller_mocked_app(mocker)
+        controller.snapping_targets = {
+            controller.view.workspaces.active: SnappingIndex(
+                [
+                    get_snapping_sources_for_rect(
+                        (500, 100, 300, 300), Settings.SNAP_PIXELS
+                    )
+                ]
+            )
+        }
+        controller.cache_root_geometry(10, 10, 200, 150)
+        controller.state = Settings.LOCATE
+        returned = controller.check_snapping(304, 56)
+        assert returned is True
+        assert controller.state == Settings.LOCATE + 1
+        mocked_corner.assert_called_once()
+        mocked.assert_called_with(494, 56)
+        assert controller.get_root_geometry() == (300, 50, 200, 150)
+
     ## BaseController.check_snapping_state
     def test_BaseController_check_snapping_state_returns_state_for_single_axis_snapping(
         self, mocker
@@ -355,6 +459,21 @@ class TestBaseControllerDomainLogic:
         )
         assert returned is not None
 
+    def test_BaseController_check_snapping_state_returns_new_state_for_single_axis(
+        self, mocker
+    ):
+        mocked_setup(mocker)
+        controller = controller_mocked_app(mocker)
+        controller.state = Settings.LOCATE
+        INTERSECTIONS = (
+            ROOT_SNAPPING_RECTANGLES_SOURCES[1],
+            Rectangle(1278, 25, 1282, 1082),
+        )
+        returned = controller.check_snapping_state(
+            ROOT_SNAPPING_RECTANGLES_SOURCES, INTERSECTIONS
+        )
+        assert returned == 1
+
     def test_BaseController_check_snapping_state_returns_None_for_single_axis_snapping(
         self, mocker
     ):
@@ -387,6 +506,21 @@ class TestBaseControllerDomainLogic:
         )
         assert returned is not None
 
+    def test_BaseController_check_snapping_state_returns_new_state_for_both_axes(
+        self, mocker
+    ):
+        mocked_setup(mocker)
+        controller = controller_mocked_app(mocker)
+        controller.state = Settings.LOCATE
+        INTERSECTIONS = (
+            (ROOT_SNAPPING_RECTANGLES_SOURCES[2], Rectangle(420, 295, 1050, 299)),
+            (ROOT_SNAPPING_RECTANGLES_SOURCES[1], Rectangle(1278, 25, 1282, 1082)),
+        )
+        returned = controller.check_snapping_state(
+            ROOT_SNAPPING_RECTANGLES_SOURCES, INTERSECTIONS
+        )
+        assert returned == 2
+
     def test_BaseController_check_snapping_state_returns_None_for_both_axes_snapping(
         self, mocker
     ):
@@ -415,13 +549,13 @@ class TestBaseControllerDomainLogic:
             "rerun_from_window", SAMPLE1, SAMPLE2
         )
 
-    def test_BaseController_listed_window_activated_calls_windows_clear_list(
+    def test_BaseController_listed_window_activated_not_calling_windows_clear_list(
         self, mocker
     ):
         mocker.patch("arrangeit.base.BaseController.display_message")
         controller = controller_mocked_next(mocker)
         controller.listed_window_activated(90192)
-        assert controller.view.windows.clear_list.call_count == 1
+        controller.view.windows.clear_list.assert_not_called()
 
     def test_BaseController_listed_window_activated_calls_windowslist_add_windows(
         self, mocker
@@ -550,7 +684,9 @@ class TestBaseControllerDomainLogic:
     def test_BaseController_next_calls_remove_listed_window(self, mocker):
         controller = controller_mocked_for_next(mocker)
         SAMPLE = 4800
-        controller.generator.__next__.return_value = base.WindowModel(wid=SAMPLE)
+        controller.generator.__next__.return_value = base.WindowModel(
+            wid=SAMPLE, rect=(0, 0, 100, 100)
+        )
         mocked = mocker.patch("arrangeit.base.BaseController.remove_listed_window")
         mocker.patch("arrangeit.base.BaseController.switch_workspace")
         controller.next()
@@ -591,7 +727,9 @@ class TestBaseControllerDomainLogic:
         controller = controller_mocked_for_next(mocker)
         mocked_lw = mocker.patch("arrangeit.base.BaseController.remove_listed_window")
         mocked_ws = mocker.patch("arrangeit.base.BaseController.switch_workspace")
-        controller.generator.__next__.return_value = base.WindowModel(workspace=1)
+        controller.generator.__next__.return_value = base.WindowModel(
+            rect=(0, 0, 100, 100), workspace=1
+        )
         controller.next()
         mocked_lw.assert_called()
         mocked_ws.assert_not_called()
@@ -622,6 +760,13 @@ class TestBaseControllerDomainLogic:
         controller.next(True)
         mocked.assert_not_called()
 
+    def test_BaseController_next_calls_update_snapping_sources(self, mocker):
+        controller = controller_mocked_for_next(mocker)
+        model = controller.model
+        controller.next()
+        controller.app.update_snapping_sources.assert_called_once()
+        controller.app.update_snapping_sources.assert_called_with(model)
+
     def test_BaseController_next_calls_create_snapping_sources(self, mocker):
         controller = controller_mocked_for_next(mocker)
         controller.next(True)
@@ -680,18 +825,49 @@ class TestBaseControllerDomainLogic:
         controller.view.master.geometry.assert_called_once()
         controller.view.master.geometry.assert_called_with("+{}+{}".format(x, y))
 
-    def test_BaseController_next_not_calling_root_geometry_for_first_time_False(
-        self, mocker
-    ):
+    def test_BaseController_next_calls_root_geometry_for_first_time_False(self, mocker):
         controller = controller_mocked_for_next(mocker)
+        x, y = 220, 230
         controller.generator.__next__.return_value = base.WindowModel(
             rect=(0, 0, 100, 100)
         )
         mocker.patch(
-            "arrangeit.base.BaseController.get_root_rect", return_value=(0, 0, 100, 100)
+            "arrangeit.base.BaseController.get_root_rect", return_value=(x, y, 100, 100)
+        )
+        controller.next(False)
+        controller.view.master.geometry.assert_called_once()
+        controller.view.master.geometry.assert_called_with("+{}+{}".format(x, y))
+
+    def test_BaseController_next_places_root_on_model_window_position(self, mocker):
+        controller = controller_mocked_for_next(mocker)
+        controller.cache_root_geometry(261, 120, 480, 270)
+        controller.generator.__next__.return_value = base.WindowModel(
+            rect=(2304, 22, 400, 300)
         )
         controller.next(False)
-        controller.view.master.geometry.assert_not_called()
+        assert controller.get_root_geometry() == (2304, 22, 480, 270)
+
+    def test_BaseController_next_calls_take_desktop_snapshot(self, mocker):
+        controller = controller_mocked_for_next(mocker)
+        mocked = mocker.patch("arrangeit.base.BaseController.take_desktop_snapshot")
+        controller.next(True)
+        mocked.assert_called_once()
+        mocked.assert_called_with()
+
+    def test_BaseController_next_schedules_prefetch_screenshots(self, mocker):
+        controller = controller_mocked_for_next(mocker)
+        controller.prefetcher = mocker.MagicMock()
+        controller.next(True)
+        controller.view.master.after_idle.assert_called_once()
+        controller.view.master.after_idle.assert_called_with(
+            controller.prefetch_screenshots
+        )
+
+    def test_BaseController_next_not_scheduling_prefetch_screenshots(self, mocker):
+        controller = controller_mocked_for_next(mocker)
+        controller.prefetcher = None
+        controller.next(True)
+        controller.view.master.after_idle.assert_not_called()
 
     def test_BaseController_next_returns_False(self, mocker):
         controller = controller_mocked_for_next(mocker)
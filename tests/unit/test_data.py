@@ -441,6 +441,27 @@ class TestWindowsCollection:
         returned = collection.get_model_by_wid(300)
         assert returned is None
 
+    ## WindowsCollection.get_next_models
+    @pytest.mark.parametrize(
+        "wid,count,expected",
+        [
+            (100, 2, [200, 300]),
+            (200, 2, [300, 400]),
+            (300, 5, [400]),
+            (400, 2, []),
+            (500, 2, []),
+            (100, 0, []),
+        ],
+    )
+    def test_WindowsCollection_get_next_models_functionality(
+        self, wid, count, expected
+    ):
+        collection = WindowsCollection()
+        for elem in (100, 200, 300, 400):
+            collection.add(WindowModel(wid=elem))
+        returned = collection.get_next_models(wid, count)
+        assert [model.wid for model in returned] == expected
+
     ## WindowModel.repopulate_for_wid
     @pytest.mark.parametrize(
         "elements,wid,remove_before,expected", REPOPULATE_FOR_WID_SAMPLE
@@ -0,0 +1,241 @@
+# arrangeit - cross-platform desktop utility for easy windows management
+# Copyright (C) 1999-2019 Ivica Paleka
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+
+import random
+from queue import Empty
+
+import pytest
+
+from arrangeit import events
+
+
+class TestEventsFunctions:
+    """Testing class for :mod:`arrangeit.events` module functions."""
+
+    ## read_trace
+    def test_events_read_trace_functionality(self, tmp_path):
+        filename = str(tmp_path / "trace.jsonl")
+        recorder = events.EventsRecorder(filename)
+        recorder.record_item((100, 200, 0.5))
+        recorder.record_item(True)
+        recorder.record("k", "Return")
+        recorder.close()
+        assert [event[1:] for event in events.read_trace(filename)] == [
+            ("m", (100, 200)),
+            ("s", True),
+            ("k", "Return"),
+        ]
+
+    def test_events_read_trace_raises_ValueError_for_invalid_header(self, tmp_path):
+        filename = tmp_path / "trace.jsonl"
+        filename.write_text('{"format": "other"}\n')
+        with pytest.raises(ValueError):
+            list(events.read_trace(str(filename)))
+
+
+class TestEventsRingBuffer:
+    """Testing class for :class:`arrangeit.events.EventsRingBuffer` class."""
+
+    ## EventsRingBuffer
+    @pytest.mark.parametrize("attr", ["moves", "scrolls", "sequence"])
+    def test_EventsRingBuffer_inits_attr_as_None(self, attr):
+        assert getattr(events.EventsRingBuffer, attr) is None
+
+    @pytest.mark.parametrize("attr", ["overwritten", "high_water"])
+    def test_EventsRingBuffer_inits_counter_as_zero(self, attr):
+        assert getattr(events.EventsRingBuffer, attr) == 0
+
+    ## EventsRingBuffer.__init__
+    def test_EventsRingBuffer_init_sets_empty_collections(self):
+        buffer = events.EventsRingBuffer(8)
+        assert len(buffer.moves) == 0
+        assert len(buffer.scrolls) == 0
+        assert buffer.capacity == 8
+        assert next(buffer.sequence) == 0
+
+    ## EventsRingBuffer.__len__
+    def test_EventsRingBuffer_len_counts_all_items(self):
+        buffer = events.EventsRingBuffer(8)
+        buffer.put((1, 1))
+        buffer.put(True)
+        buffer.put((2, 2))
+        assert len(buffer) == 3
+
+    ## EventsRingBuffer.get
+    def test_EventsRingBuffer_get_raises_Empty(self):
+        with pytest.raises(Empty):
+            events.EventsRingBuffer(8).get(block=False)
+
+    def test_EventsRingBuffer_get_returns_items_in_put_order(self):
+        buffer = events.EventsRingBuffer(8)
+        items = [(1, 1), True, (2, 2), (3, 3), False, True, (4, 4)]
+        for item in items:
+            buffer.put(item)
+        assert [buffer.get(block=False) for _ in items] == items
+        assert len(buffer) == 0
+
+    ## EventsRingBuffer.metrics
+    def test_EventsRingBuffer_metrics_functionality(self):
+        buffer = events.EventsRingBuffer(2)
+        for item in [(1, 1), (2, 2), True, (3, 3)]:
+            buffer.put(item)
+        buffer.get()
+        assert buffer.metrics() == {
+            "capacity": 2,
+            "size": 2,
+            "high_water": 2,
+            "overwritten": 1,
+        }
+
+    ## EventsRingBuffer.put
+    def test_EventsRingBuffer_put_overwrites_the_oldest_moves(self):
+        buffer = events.EventsRingBuffer(3)
+        for i in range(10):
+            buffer.put((i, i))
+        assert buffer.overwritten == 7
+        assert [buffer.get() for _ in range(3)] == [(7, 7), (8, 8), (9, 9)]
+
+    def test_EventsRingBuffer_put_never_drops_scrolls(self):
+        buffer = events.EventsRingBuffer(2)
+        directions = [bool(i % 2) for i in range(10)]
+        for i, direction in enumerate(directions):
+            buffer.put((i, i))
+            buffer.put(direction)
+        returned = [buffer.get() for _ in range(len(buffer))]
+        assert [item for item in returned if isinstance(item, bool)] == directions
+        assert [item for item in returned if not isinstance(item, bool)] == [
+            (8, 8),
+            (9, 9),
+        ]
+
+
+class TestLatencyStats:
+    """Testing class for :class:`arrangeit.events.LatencyStats` class."""
+
+    ## LatencyStats
+    def test_LatencyStats_inits_samples_as_None(self):
+        assert events.LatencyStats.samples is None
+
+    @pytest.mark.parametrize("attr", ["events", "snapping_hits"])
+    def test_LatencyStats_inits_counter_as_zero(self, attr):
+        assert getattr(events.LatencyStats, attr) == 0
+
+    ## LatencyStats.__init__
+    def test_LatencyStats_init_sets_samples_window(self):
+        assert events.LatencyStats().samples.maxlen == 1000
+        assert events.LatencyStats(window=10).samples.maxlen == 10
+
+    ## LatencyStats.percentile
+    def test_LatencyStats_percentile_returns_None_for_no_samples(self):
+        assert events.LatencyStats().percentile(50) is None
+
+    @pytest.mark.parametrize(
+        "percent,expected", [(0, 1.0), (50, 50.0), (95, 95.0), (99, 99.0), (100, 100.0)]
+    )
+    def test_LatencyStats_percentile_functionality(self, percent, expected):
+        stats = events.LatencyStats()
+        for value in random.Random(1).sample(range(1, 101), 100):
+            stats.record(value / 1000)
+        assert stats.percentile(percent) == pytest.approx(expected)
+
+    def test_LatencyStats_percentile_uses_only_latest_samples(self):
+        stats = events.LatencyStats(window=2)
+        for value in (0.5, 0.001, 0.002):
+            stats.record(value)
+        assert stats.percentile(100) == pytest.approx(2.0)
+        assert stats.events == 3
+
+    ## LatencyStats.record
+    def test_LatencyStats_record_counts_events_and_snapping_hits(self):
+        stats = events.LatencyStats()
+        stats.record(0.001, True)
+        stats.record(0.002)
+        stats.record(0.003, snapped=True)
+        assert list(stats.samples) == [0.001, 0.002, 0.003]
+        assert stats.events == 3
+        assert stats.snapping_hits == 2
+
+    ## LatencyStats.summary
+    def test_LatencyStats_summary_functionality(self):
+        stats = events.LatencyStats()
+        stats.record(0.004, True)
+        returned = stats.summary()
+        assert returned == {
+            "events": 1,
+            "snapping_hits": 1,
+            "p50": pytest.approx(4.0),
+            "p95": pytest.approx(4.0),
+            "p99": pytest.approx(4.0),
+        }
+
+
+class TestEventsRecorder:
+    """Testing class for :class:`arrangeit.events.EventsRecorder` class."""
+
+    ## EventsRecorder
+    @pytest.mark.parametrize("attr", ["file", "started"])
+    def test_EventsRecorder_inits_attr_as_None(self, attr):
+        assert getattr(events.EventsRecorder, attr) is None
+
+    def test_EventsRecorder_inits_events_as_zero(self):
+        assert events.EventsRecorder.events == 0
+
+    ## EventsRecorder.__init__
+    def test_EventsRecorder_init_writes_header(self, tmp_path):
+        filename = tmp_path / "trace.jsonl"
+        events.EventsRecorder(str(filename)).close()
+        assert filename.read_text() == '{"format": "arrangeit-trace", "version": 1}\n'
+
+    ## EventsRecorder.close
+    def test_EventsRecorder_close_sets_file_to_None(self, tmp_path):
+        recorder = events.EventsRecorder(str(tmp_path / "trace.jsonl"))
+        recorder.close()
+        assert recorder.file is None
+        recorder.close()
+
+    ## EventsRecorder.record
+    def test_EventsRecorder_record_writes_compact_line(self, mocker, tmp_path):
+        mocker.patch("arrangeit.events.perf_counter", side_effect=[10.0, 10.25])
+        filename = tmp_path / "trace.jsonl"
+        recorder = events.EventsRecorder(str(filename))
+        recorder.record("m", [100, 200])
+        recorder.close()
+        assert filename.read_text().splitlines()[1] == '[0.25,"m",[100,200]]'
+        assert recorder.events == 1
+
+    def test_EventsRecorder_record_skips_closed_file(self, tmp_path):
+        recorder = events.EventsRecorder(str(tmp_path / "trace.jsonl"))
+        recorder.close()
+        recorder.record("k", "Return")
+        assert recorder.events == 0
+
+    ## EventsRecorder.record_item
+    @pytest.mark.parametrize(
+        "item,expected",
+        [
+            (True, ("s", True)),
+            (False, ("s", False)),
+            ((100, 200), ("m", [100, 200])),
+            ((100, 200, 0.5), ("m", [100, 200])),
+        ],
+    )
+    def test_EventsRecorder_record_item_calls_record(self, mocker, item, expected):
+        mocked = mocker.patch("arrangeit.events.EventsRecorder.record")
+        recorder = events.EventsRecorder.__new__(events.EventsRecorder)
+        recorder.record_item(item)
+        mocked.assert_called_once()
+        mocked.assert_called_with(*expected)
@@ -374,6 +374,20 @@ class TestLinuxApp:
         mocked.assert_called()
         mocked.assert_called_with(WID + 1, 1001)
 
+    ## LinuxApp.shutdown_cleanup
+    def test_LinuxApp_shutdown_cleanup_closes_capture(self, mocker):
+        mocker.patch("arrangeit.base.BaseApp.setup_controller")
+        app = App()
+        app.capture = mocker.MagicMock()
+        app.shutdown_cleanup()
+        app.capture.close.assert_called_once()
+
+    def test_LinuxApp_shutdown_cleanup_without_capture(self, mocker):
+        mocker.patch("arrangeit.base.BaseApp.setup_controller")
+        mocked = mocker.patch("arrangeit.linux.app.CompositeCapture")
+        App().shutdown_cleanup()
+        mocked.assert_not_called()
+
     ## LinuxApp._activate_workspace
     def test_LinuxApp__activate_workspace_calls_get_wnck_workspace_for_custom_number(
         self, mocker
@@ -511,7 +525,145 @@ class TestLinuxApp:
         returned = App()._window_from_wid(4490)
         assert returned is None
 
+    ## LinuxApp.get_stacked_windows
+    def test_LinuxApp_get_stacked_windows_for_unknown_workspace(self, mocker):
+        mocker.patch("arrangeit.base.BaseApp.setup_controller")
+        mocker.patch(
+            "arrangeit.linux.collector.Collector.get_wnck_workspace_for_custom_number",
+            return_value=False,
+        )
+        mocked = mocker.patch("arrangeit.linux.app.Wnck.Screen.get_default")
+        assert App().get_stacked_windows(1001) == []
+        mocked.assert_not_called()
+
+    def test_LinuxApp_get_stacked_windows_functionality(self, mocker):
+        mocker.patch("arrangeit.base.BaseApp.setup_controller")
+        mocked_workspace = mocker.patch(
+            "arrangeit.linux.collector.Collector.get_wnck_workspace_for_custom_number"
+        )
+        mocked = mocker.patch("arrangeit.linux.app.Wnck.Screen.get_default")
+        windows = [mocker.MagicMock() for _ in range(3)]
+        for index, win in enumerate(windows):
+            win.get_xid.return_value = index
+            win.get_geometry.return_value = [index, 0, 100, 100]
+            win.get_window_type.return_value = Wnck.WindowType.NORMAL
+        windows[0].get_window_type.return_value = Wnck.WindowType.DESKTOP
+        windows[1].is_visible_on_workspace.return_value = False
+        mocked.return_value.get_windows_stacked.return_value = windows
+        assert App().get_stacked_windows(1001) == [(2, (2, 0, 100, 100))]
+        mocked_workspace.assert_called_with(1001)
+        windows[2].is_visible_on_workspace.assert_called_with(
+            mocked_workspace.return_value
+        )
+
+    ## LinuxApp.grab_monitor_image
+    def test_LinuxApp_grab_monitor_image_functionality(self, mocker):
+        mocker.patch("arrangeit.base.BaseApp.setup_controller")
+        mocked_root = mocker.patch("arrangeit.linux.app.Gdk.get_default_root_window")
+        mocked_pixbuf = mocker.patch("arrangeit.linux.app.Gdk.pixbuf_get_from_window")
+        mocked = mocker.patch(
+            "arrangeit.linux.collector.Collector.get_image_from_pixbuf"
+        )
+        returned = App().grab_monitor_image((10, 20, 300, 200))
+        mocked_pixbuf.assert_called_with(mocked_root.return_value, 10, 20, 300, 200)
+        mocked.assert_called_with(mocked_pixbuf.return_value)
+        assert returned == mocked.return_value
+
+    def test_LinuxApp_grab_monitor_image_for_no_pixbuf_returns_None(self, mocker):
+        mocker.patch("arrangeit.base.BaseApp.setup_controller")
+        mocker.patch("arrangeit.linux.app.Gdk.get_default_root_window")
+        mocker.patch(
+            "arrangeit.linux.app.Gdk.pixbuf_get_from_window", return_value=None
+        )
+        mocked = mocker.patch(
+            "arrangeit.linux.collector.Collector.get_image_from_pixbuf"
+        )
+        assert App().grab_monitor_image((10, 20, 300, 200)) is None
+        mocked.assert_not_called()
+
+    ## LinuxApp.grab_window_image
+    def test_LinuxApp_grab_window_image_for_no_window_returns_None(self, mocker):
+        mocker.patch("arrangeit.base.BaseApp.setup_controller")
+        mocker.patch("arrangeit.linux.app.App._window_from_wid", return_value=None)
+        mocked = mocker.patch("arrangeit.linux.app.Gdk.pixbuf_get_from_window")
+        returned = App().grab_window_image(mocker.MagicMock())
+        assert returned is None
+        mocked.assert_not_called()
+
+    def test_LinuxApp_grab_window_image_returns_raw_image_and_offset(self, mocker):
+        mocker.patch("arrangeit.base.BaseApp.setup_controller")
+        mocked_image = mocker.patch(
+            "arrangeit.linux.collector.Collector.get_image_from_pixbuf"
+        )
+        mocked_prepared = mocker.patch("arrangeit.linux.app.get_prepared_screenshot")
+        mocked_window = mocker.MagicMock()
+        mocker.patch(
+            "arrangeit.linux.app.App._window_from_wid", return_value=mocked_window
+        )
+        mocked_model = mocker.MagicMock()
+        mocked_model.changed_w = 500
+        mocked_model.changed_h = 400
+        mocked_window.get_width.return_value = 450
+        mocked_window.get_height.return_value = 340
+        mocker.patch("arrangeit.linux.app.Gdk.pixbuf_get_from_window")
+        returned = App().grab_window_image(mocked_model)
+        assert returned == (mocked_image.return_value, (50, 60))
+        mocked_prepared.assert_not_called()
+
+    def test_LinuxApp_grab_window_image_uses_composite_capture(self, mocker):
+        mocker.patch("arrangeit.base.BaseApp.setup_controller")
+        mocked_settings = mocker.patch("arrangeit.linux.app.Settings")
+        type(mocked_settings).SCREENSHOT_BACKEND = mocker.PropertyMock(
+            return_value="composite"
+        )
+        mocked = mocker.patch("arrangeit.linux.app.CompositeCapture")
+        mocked.return_value.grab.return_value = Image.new("RGB", (450, 340))
+        mocked_window = mocker.patch("arrangeit.linux.app.App._window_from_wid")
+        mocked_model = mocker.MagicMock()
+        mocked_model.wid, mocked_model.changed_w, mocked_model.changed_h = 10, 500, 400
+        app = App()
+        returned = app.grab_window_image(mocked_model)
+        mocked.return_value.grab.assert_called_once()
+        mocked.return_value.grab.assert_called_with(10)
+        assert returned == (mocked.return_value.grab.return_value, (50, 60))
+        assert app.capture == mocked.return_value
+        mocked_window.assert_not_called()
+
+    def test_LinuxApp_grab_window_image_falls_back_from_composite_capture(
+        self, mocker
+    ):
+        mocker.patch("arrangeit.base.BaseApp.setup_controller")
+        mocked_settings = mocker.patch("arrangeit.linux.app.Settings")
+        type(mocked_settings).SCREENSHOT_BACKEND = mocker.PropertyMock(
+            return_value="composite"
+        )
+        mocked = mocker.patch("arrangeit.linux.app.CompositeCapture")
+        mocked.return_value.grab.return_value = None
+        mocked_window = mocker.patch(
+            "arrangeit.linux.app.App._window_from_wid", return_value=None
+        )
+        assert App().grab_window_image(mocker.MagicMock()) is None
+        mocked_window.assert_called_once()
+
+    def test_LinuxApp_grab_window_image_not_using_composite_by_default(self, mocker):
+        mocker.patch("arrangeit.base.BaseApp.setup_controller")
+        mocked = mocker.patch("arrangeit.linux.app.CompositeCapture")
+        mocker.patch("arrangeit.linux.app.App._window_from_wid", return_value=None)
+        app = App()
+        app.grab_window_image(mocker.MagicMock())
+        mocked.assert_not_called()
+        assert app.capture is None
+
     ## LinuxApp.grab_window_screen
+    def test_LinuxApp_grab_window_screen_calls_grab_window_image(self, mocker):
+        mocker.patch("arrangeit.base.BaseApp.setup_controller")
+        mocker.patch("arrangeit.linux.app.get_prepared_screenshot")
+        mocked = mocker.patch("arrangeit.linux.app.App.grab_window_image")
+        MODEL = mocker.MagicMock()
+        App().grab_window_screen(MODEL)
+        mocked.assert_called_once()
+        mocked.assert_called_with(MODEL)
+
     def test_LinuxApp_grab_window_screen_calls__window_from_wid(self, mocker):
         mocker.patch("arrangeit.base.BaseApp.setup_controller")
         mocker.patch("arrangeit.linux.app.ImageTk")
@@ -535,7 +687,7 @@ class TestLinuxApp:
     def test_LinuxApp_grab_window_screen_calls_pixbuf_get_from_window(self, mocker):
         mocker.patch("arrangeit.base.BaseApp.setup_controller")
         mocker.patch("arrangeit.linux.collector.Collector.get_image_from_pixbuf")
-        mocker.patch("arrangeit.linux.app.ImageTk.PhotoImage")
+        mocker.patch("arrangeit.linux.app.get_prepared_screenshot")
         mocked_win = mocker.MagicMock()
         mocker.patch(
             "arrangeit.linux.app.App._window_from_wid", return_value=mocked_win
@@ -562,12 +714,15 @@ class TestLinuxApp:
             "arrangeit.linux.app.App._window_from_wid", return_value=mocked_window
         )
         mocker.patch("arrangeit.linux.app.Gdk.pixbuf_get_from_window")
-        App().grab_window_screen(mocker.MagicMock())
+        app = App()
+        app.grab_window_screen(mocker.MagicMock())
         mocked.assert_called_once()
         mocked.assert_called_with(
             mocked_pixbuf.return_value,
             blur_size=arrangeit.settings.Settings.SCREENSHOT_BLUR_PIXELS,
             grayscale=arrangeit.settings.Settings.SCREENSHOT_TO_GRAYSCALE,
+            downscale=arrangeit.settings.Settings.SCREENSHOT_DOWNSCALE_FACTOR,
+            size=app.controller.get_screen_size.return_value,
         )
 
     def test_LinuxApp_grab_window_screen_returns_get_prepared_screenshot_image(
@@ -858,6 +1013,41 @@ class TestLinuxCollector:
         )
         assert isinstance(collector.get_image_from_pixbuf(image), Image.Image)
 
+    def test_LinuxCollector_get_image_from_pixbuf_shares_rgba_pixels(self, mocker):
+        mocked = mocker.patch("arrangeit.linux.collector.Image")
+        pixbuf = mocker.MagicMock()
+        pixbuf.props.has_alpha = True
+        pixbuf.props.width, pixbuf.props.height, pixbuf.props.rowstride = 2, 2, 8
+        pixbuf.get_pixels.return_value = bytes(16)
+        returned = Collector().get_image_from_pixbuf(pixbuf)
+        mocked.frombuffer.assert_called_once()
+        mocked.frombuffer.assert_called_with(
+            "RGBA", (2, 2), bytes(16), "raw", "RGBA", 8, 1
+        )
+        mocked.frombytes.assert_not_called()
+        assert returned == mocked.frombuffer.return_value
+
+    @pytest.mark.parametrize(
+        "has_alpha,mode,rowstride,length",
+        [(False, "RGB", 8, 16), (True, "RGBA", 12, 20)],
+    )
+    def test_LinuxCollector_get_image_from_pixbuf_copies_pixels(
+        self, mocker, has_alpha, mode, rowstride, length
+    ):
+        mocked = mocker.patch("arrangeit.linux.collector.Image")
+        pixbuf = mocker.MagicMock()
+        pixbuf.props.has_alpha = has_alpha
+        pixbuf.props.width, pixbuf.props.height = 2, 2
+        pixbuf.props.rowstride = rowstride
+        pixbuf.get_pixels.return_value = bytes(length)
+        returned = Collector().get_image_from_pixbuf(pixbuf)
+        mocked.frombytes.assert_called_once()
+        mocked.frombytes.assert_called_with(
+            mode, (2, 2), bytes(length), "raw", mode, rowstride
+        )
+        mocked.frombuffer.assert_not_called()
+        assert returned == mocked.frombytes.return_value
+
     ## LinuxCollector.get_workspace_number_for_window
     def test_LinuxCollector_get_workspace_number_for_window_calls_W_get_workspace(
         self, mocker
@@ -0,0 +1,168 @@
+# arrangeit - cross-platform desktop utility for easy windows management
+# Copyright (C) 1999-2019 Ivica Paleka
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>
+
+import os
+
+import pytest
+from PIL import Image
+from Xlib import X, error
+from Xlib.ext import composite
+
+from arrangeit.linux.capture import ALL_PLANES, CompositeCapture
+
+
+class TestLinuxCompositeCapture:
+    """Testing class for :class:`arrangeit.linux.capture.CompositeCapture` class."""
+
+    def get_window(self, mocker, composite=True, width=300, height=200, border=0):
+        mocked = mocker.patch("arrangeit.linux.capture.Display")
+        mocked.return_value.has_extension.return_value = composite
+        window = mocked.return_value.create_resource_object.return_value
+        window.get_geometry.return_value.width = width
+        window.get_geometry.return_value.height = height
+        window.get_geometry.return_value.border_width = border
+        return mocked, window
+
+    ## CompositeCapture
+    def test_CompositeCapture_inits_display_as_None(self):
+        assert CompositeCapture.display is None
+
+    def test_CompositeCapture_inits_composite_as_False(self):
+        assert CompositeCapture.composite is False
+
+    ## CompositeCapture.__init__
+    def test_CompositeCapture_init_sets_attributes(self, mocker):
+        mocked = mocker.patch("arrangeit.linux.capture.Display")
+        capture = CompositeCapture()
+        mocked.assert_called_once()
+        mocked.return_value.has_extension.assert_called_with("Composite")
+        assert capture.display == mocked.return_value
+        assert capture.composite == mocked.return_value.has_extension.return_value
+
+    ## CompositeCapture.close
+    def test_CompositeCapture_close_closes_display(self, mocker):
+        mocked = mocker.patch("arrangeit.linux.capture.Display")
+        CompositeCapture().close()
+        mocked.return_value.close.assert_called_once()
+
+    ## CompositeCapture.get_image
+    @pytest.mark.parametrize(
+        "order,data,pixel",
+        [
+            (X.LSBFirst, b"\x01\x02\x03\x00", (3, 2, 1)),
+            (X.MSBFirst, b"\x00\x01\x02\x03", (1, 2, 3)),
+        ],
+    )
+    def test_CompositeCapture_get_image_functionality(self, mocker, order, data, pixel):
+        mocked = mocker.patch("arrangeit.linux.capture.Display")
+        mocked.return_value.info.image_byte_order = order
+        drawable = mocker.MagicMock()
+        drawable.get_image.return_value.depth = 24
+        drawable.get_image.return_value.data = data * 6
+        image = CompositeCapture().get_image(drawable, 3, 2)
+        drawable.get_image.assert_called_once()
+        drawable.get_image.assert_called_with(0, 0, 3, 2, X.ZPixmap, ALL_PLANES)
+        assert isinstance(image, Image.Image)
+        assert image.size == (3, 2)
+        assert image.getpixel((2, 1)) == pixel
+
+    def test_CompositeCapture_get_image_reads_inside_border(self, mocker):
+        mocker.patch("arrangeit.linux.capture.Display")
+        drawable = mocker.MagicMock()
+        drawable.get_image.return_value.depth = 24
+        drawable.get_image.return_value.data = bytes(24)
+        CompositeCapture().get_image(drawable, 3, 2, border=2)
+        drawable.get_image.assert_called_with(2, 2, 3, 2, X.ZPixmap, ALL_PLANES)
+
+    def test_CompositeCapture_get_image_for_unsupported_depth_returns_None(
+        self, mocker
+    ):
+        mocker.patch("arrangeit.linux.capture.Display")
+        drawable = mocker.MagicMock()
+        drawable.get_image.return_value.depth = 16
+        assert CompositeCapture().get_image(drawable, 3, 2) is None
+
+    ## CompositeCapture.grab
+    def test_CompositeCapture_grab_without_composite_returns_None(self, mocker):
+        mocked, window = self.get_window(mocker, composite=False)
+        assert CompositeCapture().grab(100) is None
+        mocked.return_value.create_resource_object.assert_not_called()
+
+    def test_CompositeCapture_grab_reads_named_pixmap(self, mocker):
+        mocked, window = self.get_window(mocker, border=1)
+        mocked_image = mocker.patch(
+            "arrangeit.linux.capture.CompositeCapture.get_image"
+        )
+        returned = CompositeCapture().grab(100)
+        mocked.return_value.create_resource_object.assert_called_with("window", 100)
+        window.composite_redirect_window.assert_called_once()
+        assert window.composite_redirect_window.call_args[0][0] == (
+            composite.RedirectAutomatic
+        )
+        mocked_image.assert_called_once()
+        mocked_image.assert_called_with(
+            window.composite_name_window_pixmap.return_value, 300, 200, 1
+        )
+        assert returned == mocked_image.return_value
+
+    def test_CompositeCapture_grab_frees_pixmap_and_unredirects_window(self, mocker):
+        mocked, window = self.get_window(mocker)
+        mocker.patch("arrangeit.linux.capture.CompositeCapture.get_image")
+        CompositeCapture().grab(100)
+        window.composite_name_window_pixmap.return_value.free.assert_called_once()
+        window.composite_unredirect_window.assert_called_once()
+        assert window.composite_unredirect_window.call_args[0][0] == (
+            composite.RedirectAutomatic
+        )
+        mocked.return_value.flush.assert_called_once()
+
+    def test_CompositeCapture_grab_for_X_error_returns_None(self, mocker):
+        mocked, window = self.get_window(mocker)
+        window.get_geometry.side_effect = error.BadWindow(
+            mocked.return_value, b"\x00" * 32
+        )
+        assert CompositeCapture().grab(100) is None
+        window.composite_name_window_pixmap.assert_not_called()
+        window.composite_unredirect_window.assert_called_once()
+
+
+@pytest.mark.skipif(not os.environ.get("DISPLAY"), reason="requires X server")
+class TestLinuxCompositeCaptureXServer:
+    """Testing class for :class:`CompositeCapture` against running X server, like Xvfb."""
+
+    def test_CompositeCapture_grab_returns_window_image(self):
+        capture = CompositeCapture()
+        if not capture.composite:
+            pytest.skip("X server doesn't support Composite extension")
+        screen = capture.display.screen()
+        window = screen.root.create_window(
+            0, 0, 64, 48, 0, screen.root_depth, background_pixel=screen.white_pixel
+        )
+        window.map()
+        capture.display.sync()
+        try:
+            image = capture.grab(window.id)
+        finally:
+            window.destroy()
+            capture.close()
+        assert image.size == (64, 48)
+
+    def test_CompositeCapture_grab_for_invalid_window_returns_None(self):
+        capture = CompositeCapture()
+        try:
+            assert capture.grab(1) is None
+        finally:
+            capture.close()
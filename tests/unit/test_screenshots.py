@@ -0,0 +1,299 @@
+# arrangeit - cross-platform desktop utility for easy windows management
+# Copyright (C) 1999-2019 Ivica Paleka
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+
+import pytest
+from PIL import Image
+
+from arrangeit import screenshots, utils
+
+
+class TestScreenshotsPrefetcher:
+    """Testing class for :class:`arrangeit.screenshots.ScreenshotsPrefetcher` class."""
+
+    ## ScreenshotsPrefetcher
+    @pytest.mark.parametrize("attr", ["executor", "images"])
+    def test_ScreenshotsPrefetcher_inits_attr_as_None(self, attr):
+        assert getattr(screenshots.ScreenshotsPrefetcher, attr) is None
+
+    ## ScreenshotsPrefetcher.__init__
+    def test_ScreenshotsPrefetcher_init_sets_attributes(self, mocker):
+        mocked = mocker.patch("arrangeit.screenshots.ThreadPoolExecutor")
+        prefetcher = screenshots.ScreenshotsPrefetcher()
+        mocked.assert_called_once()
+        mocked.assert_called_with(max_workers=1)
+        assert prefetcher.executor == mocked.return_value
+        assert len(prefetcher) == 0
+
+    ## ScreenshotsPrefetcher.clear
+    def test_ScreenshotsPrefetcher_clear_cancels_futures(self, mocker):
+        mocker.patch("arrangeit.screenshots.ThreadPoolExecutor")
+        prefetcher = screenshots.ScreenshotsPrefetcher()
+        future = mocker.MagicMock()
+        prefetcher.images[100] = ((0, 0, 10, 10), (0, 0), future)
+        prefetcher.clear()
+        future.cancel.assert_called_once()
+        assert len(prefetcher) == 0
+
+    ## ScreenshotsPrefetcher.pop
+    def test_ScreenshotsPrefetcher_pop_returns_prepared_screenshot(self, mocker):
+        mocked = mocker.patch("arrangeit.screenshots.ImageTk.PhotoImage")
+        prefetcher = screenshots.ScreenshotsPrefetcher()
+        image = Image.new("RGB", (16, 8), "red")
+        prefetcher.put(100, (0, 0, 16, 8), image, (5, 6), blur_size=1, grayscale=True)
+        returned = prefetcher.pop(100, (0, 0, 16, 8))
+        prefetcher.shutdown()
+        mocked.assert_called_once()
+        assert mocked.call_args[0][0].mode == "L"
+        assert returned == (mocked.return_value, (5, 6))
+        assert 100 not in prefetcher
+
+    def test_ScreenshotsPrefetcher_pop_drops_stale_screenshot(self, mocker):
+        mocker.patch("arrangeit.screenshots.ThreadPoolExecutor")
+        mocked = mocker.patch("arrangeit.screenshots.ImageTk.PhotoImage")
+        prefetcher = screenshots.ScreenshotsPrefetcher()
+        future = mocker.MagicMock()
+        prefetcher.images[100] = ((0, 0, 16, 8), (0, 0), future)
+        assert prefetcher.pop(100, (10, 0, 16, 8)) is None
+        future.cancel.assert_called_once()
+        mocked.assert_not_called()
+        assert 100 not in prefetcher
+
+    def test_ScreenshotsPrefetcher_pop_for_unknown_wid_returns_None(self, mocker):
+        mocker.patch("arrangeit.screenshots.ThreadPoolExecutor")
+        assert screenshots.ScreenshotsPrefetcher().pop(100, (0, 0, 16, 8)) is None
+
+    ## ScreenshotsPrefetcher.put
+    def test_ScreenshotsPrefetcher_put_submits_filtering(self, mocker):
+        mocked = mocker.patch("arrangeit.screenshots.ThreadPoolExecutor")
+        prefetcher = screenshots.ScreenshotsPrefetcher()
+        image = mocker.MagicMock()
+        prefetcher.put(
+            100,
+            (0, 0, 16, 8),
+            image,
+            (1, 2),
+            blur_size=3,
+            grayscale=True,
+            downscale=2,
+            size=(1920, 1080),
+            box=(5, 5, 21, 13),
+        )
+        mocked.return_value.submit.assert_called_once()
+        mocked.return_value.submit.assert_called_with(
+            utils.get_filtered_screenshot,
+            image,
+            blur_size=3,
+            grayscale=True,
+            downscale=2,
+            size=(1920, 1080),
+            box=(5, 5, 21, 13),
+        )
+        assert prefetcher.images[100] == (
+            (0, 0, 16, 8),
+            (1, 2),
+            mocked.return_value.submit.return_value,
+        )
+
+    ## ScreenshotsPrefetcher.retain
+    def test_ScreenshotsPrefetcher_retain_functionality(self, mocker):
+        mocker.patch("arrangeit.screenshots.ThreadPoolExecutor")
+        prefetcher = screenshots.ScreenshotsPrefetcher()
+        futures = [mocker.MagicMock() for _ in range(3)]
+        for wid, future in zip((100, 200, 300), futures):
+            prefetcher.images[wid] = ((0, 0, 16, 8), (0, 0), future)
+        prefetcher.retain([200, 400])
+        assert list(prefetcher.images.keys()) == [200]
+        futures[0].cancel.assert_called_once()
+        futures[1].cancel.assert_not_called()
+        futures[2].cancel.assert_called_once()
+
+    ## ScreenshotsPrefetcher.shutdown
+    def test_ScreenshotsPrefetcher_shutdown_functionality(self, mocker):
+        mocked = mocker.patch("arrangeit.screenshots.ThreadPoolExecutor")
+        prefetcher = screenshots.ScreenshotsPrefetcher()
+        prefetcher.images[100] = ((0, 0, 16, 8), (0, 0), mocker.MagicMock())
+        prefetcher.shutdown()
+        assert len(prefetcher) == 0
+        mocked.return_value.shutdown.assert_called_once()
+        mocked.return_value.shutdown.assert_called_with(wait=False)
+
+
+class TestScreenshotsCache:
+    """Testing class for :class:`arrangeit.screenshots.ScreenshotsCache` class."""
+
+    def get_screenshot(self, mocker, width=10, height=10):
+        screenshot = mocker.MagicMock()
+        screenshot.width.return_value = width
+        screenshot.height.return_value = height
+        return screenshot
+
+    ## ScreenshotsCache
+    def test_ScreenshotsCache_inits_attr_as_None(self):
+        assert screenshots.ScreenshotsCache.images is None
+
+    @pytest.mark.parametrize("attr", ["memory_limit", "memory", "hits", "misses"])
+    def test_ScreenshotsCache_inits_attr_as_zero(self, attr):
+        assert getattr(screenshots.ScreenshotsCache, attr) == 0
+
+    ## ScreenshotsCache.__init__
+    def test_ScreenshotsCache_init_sets_attributes(self):
+        cache = screenshots.ScreenshotsCache(1024)
+        assert cache.memory_limit == 1024
+        assert len(cache) == 0
+
+    ## ScreenshotsCache.hit_rate
+    def test_ScreenshotsCache_hit_rate_returns_None_without_requests(self):
+        assert screenshots.ScreenshotsCache(1024).hit_rate is None
+
+    def test_ScreenshotsCache_hit_rate_returns_fraction_of_hits(self):
+        cache = screenshots.ScreenshotsCache(1024)
+        cache.hits, cache.misses = 3, 1
+        assert cache.hit_rate == 0.75
+
+    ## ScreenshotsCache.clear
+    def test_ScreenshotsCache_clear_removes_screenshots(self, mocker):
+        cache = screenshots.ScreenshotsCache(1024)
+        cache.put(100, (0, 0, 10, 10), self.get_screenshot(mocker), (0, 0))
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.memory == 0
+
+    ## ScreenshotsCache.get
+    def test_ScreenshotsCache_get_returns_cached_screenshot(self, mocker):
+        cache = screenshots.ScreenshotsCache(1024)
+        screenshot = self.get_screenshot(mocker)
+        cache.put(100, (0, 0, 10, 10), screenshot, (2, 3))
+        assert cache.get(100, (0, 0, 10, 10)) == (screenshot, (2, 3))
+        assert cache.hits == 1
+        assert cache.misses == 0
+
+    def test_ScreenshotsCache_get_counts_miss_for_unknown_window(self):
+        cache = screenshots.ScreenshotsCache(1024)
+        assert cache.get(100, (0, 0, 10, 10)) is None
+        assert cache.misses == 1
+
+    def test_ScreenshotsCache_get_invalidates_screenshot_for_changed_key(self, mocker):
+        cache = screenshots.ScreenshotsCache(1024)
+        cache.put(100, (0, 0, 10, 10), self.get_screenshot(mocker), (0, 0))
+        assert cache.get(100, (5, 0, 10, 10)) is None
+        assert len(cache) == 0
+        assert cache.memory == 0
+        assert cache.misses == 1
+
+    def test_ScreenshotsCache_get_marks_screenshot_as_recently_used(self, mocker):
+        cache = screenshots.ScreenshotsCache(800)
+        cache.put(100, (0, 0, 10, 10), self.get_screenshot(mocker), (0, 0))
+        cache.put(200, (0, 0, 10, 10), self.get_screenshot(mocker), (0, 0))
+        cache.get(100, (0, 0, 10, 10))
+        cache.put(300, (0, 0, 10, 10), self.get_screenshot(mocker), (0, 0))
+        assert list(cache.images.keys()) == [100, 300]
+
+    ## ScreenshotsCache.metrics
+    def test_ScreenshotsCache_metrics_returns_usage(self, mocker):
+        cache = screenshots.ScreenshotsCache(1024)
+        cache.put(100, (0, 0, 10, 10), self.get_screenshot(mocker), (0, 0))
+        cache.get(100, (0, 0, 10, 10))
+        assert cache.metrics() == {
+            "size": 1,
+            "memory": 400,
+            "memory_limit": 1024,
+            "hits": 1,
+            "misses": 0,
+            "hit_rate": 1.0,
+        }
+
+    ## ScreenshotsCache.put
+    def test_ScreenshotsCache_put_replaces_window_screenshot(self, mocker):
+        cache = screenshots.ScreenshotsCache(1024)
+        cache.put(100, (0, 0, 10, 10), self.get_screenshot(mocker), (0, 0))
+        screenshot = self.get_screenshot(mocker, 5, 5)
+        cache.put(100, (0, 0, 5, 5), screenshot, (1, 1))
+        assert len(cache) == 1
+        assert cache.memory == 100
+        assert cache.images[100] == ((0, 0, 5, 5), screenshot, (1, 1), 100)
+
+    def test_ScreenshotsCache_put_evicts_least_recently_used(self, mocker):
+        cache = screenshots.ScreenshotsCache(800)
+        for wid in (100, 200, 300):
+            cache.put(wid, (0, 0, 10, 10), self.get_screenshot(mocker), (0, 0))
+        assert list(cache.images.keys()) == [200, 300]
+        assert cache.memory == 800
+
+    def test_ScreenshotsCache_put_evicts_screenshot_bigger_than_limit(self, mocker):
+        cache = screenshots.ScreenshotsCache(100)
+        cache.put(100, (0, 0, 10, 10), self.get_screenshot(mocker), (0, 0))
+        assert len(cache) == 0
+        assert cache.memory == 0
+
+    ## ScreenshotsCache.remove
+    def test_ScreenshotsCache_remove_ignores_unknown_window(self):
+        cache = screenshots.ScreenshotsCache(1024)
+        cache.remove(100)
+        assert cache.memory == 0
+
+
+class TestDesktopSnapshot:
+    """Testing class for :class:`arrangeit.screenshots.DesktopSnapshot` class."""
+
+    def get_snapshot(self, visible=(100,)):
+        return screenshots.DesktopSnapshot(
+            1001,
+            [
+                ((0, 0, 40, 30), Image.new("RGB", (40, 30), "red")),
+                ((40, 0, 20, 30), Image.new("RGB", (20, 30), "blue")),
+            ],
+            set(visible),
+        )
+
+    ## DesktopSnapshot
+    @pytest.mark.parametrize("attr", ["workspace", "monitors", "visible"])
+    def test_DesktopSnapshot_inits_attr_as_None(self, attr):
+        assert getattr(screenshots.DesktopSnapshot, attr) is None
+
+    ## DesktopSnapshot.__init__
+    def test_DesktopSnapshot_init_sets_attributes(self):
+        snapshot = self.get_snapshot(visible=(100, 200))
+        assert snapshot.workspace == 1001
+        assert len(snapshot.monitors) == 2
+        assert snapshot.visible == {100, 200}
+
+    ## DesktopSnapshot.get
+    def test_DesktopSnapshot_get_returns_monitor_image_and_box(self):
+        snapshot = self.get_snapshot()
+        image, box = snapshot.get(100, (45, 5, 10, 20))
+        assert image is snapshot.monitors[1][1]
+        assert box == (5, 5, 15, 25)
+
+    def test_DesktopSnapshot_get_not_cropping_image(self, mocker):
+        mocked = mocker.patch("PIL.Image.Image.crop")
+        self.get_snapshot().get(100, (5, 5, 30, 20))
+        mocked.assert_not_called()
+
+    def test_DesktopSnapshot_get_for_not_visible_window_returns_None(self):
+        assert self.get_snapshot(visible=(200,)).get(100, (5, 5, 10, 10)) is None
+
+    def test_DesktopSnapshot_get_for_not_stacked_window_returns_None(self):
+        snapshot = screenshots.DesktopSnapshot(
+            1001,
+            [((0, 0, 40, 30), Image.new("RGB", (40, 30), "red"))],
+            utils.get_visible_wids([(100, (0, 0, 10, 10))]),
+        )
+        assert snapshot.get(100, (0, 0, 10, 10)) is not None
+        assert snapshot.get(200, (20, 5, 10, 10)) is None
+
+    def test_DesktopSnapshot_get_for_window_across_monitors_returns_None(self):
+        assert self.get_snapshot().get(100, (30, 5, 20, 10)) is None
@@ -0,0 +1,282 @@
+# arrangeit - cross-platform desktop utility for easy windows management
+# Copyright (C) 1999-2019 Ivica Paleka
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+
+import random
+from itertools import product
+
+import pytest
+
+from arrangeit import snapping, utils
+
+from .fixtures import SAMPLE_CHECK_INTERSECTIONS
+
+
+class TestSnappingFunctions:
+    """Testing class for :mod:`arrangeit.snapping` module functions."""
+
+    ## nearest_intersections
+    def test_snapping_nearest_intersections_calls_SnappingIndex_nearest(self, mocker):
+        mocked = mocker.patch("arrangeit.snapping.SnappingIndex.nearest")
+        index = snapping.SnappingIndex()
+        returned = snapping.nearest_intersections(("foo", "bar"), index)
+        mocked.assert_called_once()
+        mocked.assert_called_with(("foo", "bar"))
+        assert returned == mocked.return_value
+
+    @pytest.mark.parametrize("sources,targets,expected", SAMPLE_CHECK_INTERSECTIONS)
+    def test_snapping_nearest_intersections_for_list(self, sources, targets, expected):
+        returned = snapping.nearest_intersections(sources, targets)
+        assert returned == snapping.SnappingIndex(targets).nearest(sources)
+
+    def test_snapping_nearest_intersections_returns_closest_pair(self):
+        sources = utils.get_snapping_sources_for_rect((100, 100, 300, 200), 10)
+        farther = utils.get_snapping_sources_for_rect((100, 115, 300, 200), 10)
+        closer = utils.get_snapping_sources_for_rect((100, 95, 300, 200), 10)
+        targets = [farther, closer]
+        first = utils.check_intersections(sources, targets)
+        nearest = snapping.nearest_intersections(sources, targets)
+        assert first[0] == (sources[0], farther[0])
+        assert nearest[0] == (sources[0], closer[0])
+        assert utils.offset_for_intersections(nearest, 10)[1] == -5
+
+
+class TestSnappingIndex:
+    """Testing class for :class:`arrangeit.snapping.SnappingIndex` class."""
+
+    ## SnappingIndex
+    @pytest.mark.parametrize("attr", ["entries", "edges", "extents", "excluded"])
+    def test_SnappingIndex_inits_attr_as_None(self, attr):
+        assert getattr(snapping.SnappingIndex, attr) is None
+
+    def test_SnappingIndex_inits_counter_as_zero(self):
+        assert snapping.SnappingIndex.counter == 0
+
+    ## SnappingIndex.__init__
+    def test_SnappingIndex_init_sets_empty_collections(self):
+        index = snapping.SnappingIndex()
+        assert index.entries == {}
+        assert index.targets == []
+        assert index.edges == ([], [])
+        assert index.extents == [0, 0]
+
+    def test_SnappingIndex_init_calls_append(self, mocker):
+        mocked = mocker.patch("arrangeit.snapping.SnappingIndex.append")
+        snapping.SnappingIndex(["foo", "bar"])
+        calls = [mocker.call("foo"), mocker.call("bar")]
+        mocked.assert_has_calls(calls, any_order=False)
+
+    ## SnappingIndex.__eq__
+    @pytest.mark.parametrize("sources,targets,expected", SAMPLE_CHECK_INTERSECTIONS)
+    def test_SnappingIndex_equals_targets_list(self, sources, targets, expected):
+        assert snapping.SnappingIndex(targets) == targets
+        assert snapping.SnappingIndex(targets) == snapping.SnappingIndex(targets)
+        assert snapping.SnappingIndex(targets) != targets[:1]
+
+    ## SnappingIndex sequence behaviour
+    @pytest.mark.parametrize("sources,targets,expected", SAMPLE_CHECK_INTERSECTIONS)
+    def test_SnappingIndex_behaves_like_targets_list(self, sources, targets, expected):
+        index = snapping.SnappingIndex(targets)
+        assert len(index) == len(targets)
+        assert list(index) == targets
+        assert index[0] == targets[0]
+
+    ## SnappingIndex.append
+    def test_SnappingIndex_append_keeps_edges_sorted(self):
+        index = snapping.SnappingIndex()
+        for rect in ((500, 400, 100, 100), (10, 20, 300, 50), (200, 100, 40, 40)):
+            index.append(utils.get_snapping_sources_for_rect(rect, 10))
+        for edges in index.edges:
+            assert len(edges) == 6
+            assert [entry[0] for entry in edges] == sorted(entry[0] for entry in edges)
+
+    def test_SnappingIndex_append_replaces_rectangles_for_the_same_key(self):
+        index = snapping.SnappingIndex()
+        first = utils.get_snapping_sources_for_rect((10, 20, 300, 50), 10)
+        second = utils.get_snapping_sources_for_rect((500, 400, 100, 100), 10)
+        index.append(first, key=5000)
+        index.append(second, key=5000)
+        assert index.targets == [second]
+        assert len(index.edges[0]) == 2
+        assert len(index.edges[1]) == 2
+
+    def test_SnappingIndex_append_without_key_adds_new_entry(self):
+        index = snapping.SnappingIndex()
+        rects = utils.get_snapping_sources_for_rect((10, 20, 300, 50), 10)
+        index.append(rects)
+        index.append(rects)
+        assert index.targets == [rects, rects]
+
+    def test_SnappingIndex_append_sets_extents(self):
+        index = snapping.SnappingIndex()
+        index.append(utils.get_snapping_sources_for_rect((10, 20, 300, 50), 10))
+        assert index.extents == [20, 20]
+
+    ## SnappingIndex.intersections
+
+    @pytest.mark.parametrize("sources,targets,expected", SAMPLE_CHECK_INTERSECTIONS)
+    def test_SnappingIndex_intersections_functionality(
+        self, sources, targets, expected
+    ):
+        index = snapping.SnappingIndex(targets)
+        assert index.intersections(sources) == expected[0]
+        assert index.intersections((sources[0], sources[3])) == expected[1]
+        assert index.intersections((sources[0], sources[1])) == expected[2]
+        assert index.intersections((sources[2], sources[1])) == expected[3]
+        assert index.intersections((sources[2], sources[3])) == expected[4]
+
+    def test_SnappingIndex_intersections_returns_False_for_empty_index(self):
+        sources = utils.get_snapping_sources_for_rect((50, 20, 200, 20), 10)
+        index = snapping.SnappingIndex()
+        assert index.intersections(sources) is False
+
+    @pytest.mark.parametrize("seed", [1, 2, 3, 4, 5])
+    def test_SnappingIndex_intersections_same_as_linear_scan(self, seed):
+        generator = random.Random(seed)
+        targets = [
+            utils.get_snapping_sources_for_rect(
+                (
+                    generator.randrange(0, 1800),
+                    generator.randrange(0, 1000),
+                    generator.randrange(50, 900),
+                    generator.randrange(30, 700),
+                ),
+                generator.choice((2, 5, 10)),
+            )
+            for _ in range(60)
+        ]
+        index = snapping.SnappingIndex(targets)
+        for _ in range(200):
+            rect = (
+                generator.randrange(0, 1800),
+                generator.randrange(0, 1000),
+                generator.randrange(50, 900),
+                generator.randrange(30, 700),
+            )
+            for corner in (None, 0, 1, 2, 3):
+                sources = utils.get_snapping_sources_for_rect(rect, 10, corner)
+                assert index.intersections(sources) == utils.check_intersections(
+                    sources, targets
+                )
+
+    def test_SnappingIndex_intersections_skips_excluded_key(self):
+        index = snapping.SnappingIndex()
+        rect = (100, 100, 300, 200)
+        index.append(utils.get_snapping_sources_for_rect(rect, 10), key=5000)
+        sources = utils.get_snapping_sources_for_rect(rect, 10)
+        assert index.intersections(sources) is not False
+        index.excluded = 5000
+        assert index.intersections(sources) is False
+
+    ## SnappingIndex.nearest
+    def test_SnappingIndex_nearest_returns_False_for_empty_index(self):
+        sources = utils.get_snapping_sources_for_rect((50, 20, 200, 20), 10)
+        index = snapping.SnappingIndex()
+        assert index.nearest(sources) is False
+
+    def test_SnappingIndex_nearest_skips_excluded_key(self):
+        index = snapping.SnappingIndex()
+        rect = (100, 100, 300, 200)
+        index.append(utils.get_snapping_sources_for_rect(rect, 10), key=5000)
+        sources = utils.get_snapping_sources_for_rect(rect, 10)
+        assert index.nearest(sources) is not False
+        index.excluded = 5000
+        assert index.nearest(sources) is False
+
+    def test_SnappingIndex_nearest_resolves_ties_by_insertion_order(self):
+        index = snapping.SnappingIndex()
+        sources = utils.get_snapping_sources_for_rect((100, 100, 300, 200), 10)
+        first = utils.get_snapping_sources_for_rect((50, 105, 300, 200), 10)
+        second = utils.get_snapping_sources_for_rect((60, 95, 300, 200), 10)
+        index.append(second, key=2)
+        index.append(first, key=1)
+        assert index.nearest(sources) == (sources[0], second[0])
+
+    @pytest.mark.parametrize("seed", [1, 2, 3, 4, 5])
+    def test_SnappingIndex_nearest_returns_minimal_offsets(self, seed):
+        generator = random.Random(seed)
+        targets = [
+            utils.get_snapping_sources_for_rect(
+                (
+                    generator.randrange(0, 1800),
+                    generator.randrange(0, 1000),
+                    generator.randrange(50, 900),
+                    generator.randrange(30, 700),
+                ),
+                10,
+            )
+            for _ in range(60)
+        ]
+        index = snapping.SnappingIndex(targets)
+        for _ in range(200):
+            rect = (
+                generator.randrange(0, 1800),
+                generator.randrange(0, 1000),
+                generator.randrange(50, 900),
+                generator.randrange(30, 700),
+            )
+            sources = utils.get_snapping_sources_for_rect(rect, 10)
+            nearest = index.nearest(sources)
+            if nearest is False:
+                pairs = {}
+            elif isinstance(nearest[0], utils.Rectangle):
+                pairs = {sources.index(nearest[0]) % 2: nearest}
+            else:
+                pairs = {0: nearest[0], 1: nearest[1]}
+            for parity in (0, 1):
+                distances = [
+                    abs(target[1 - parity] - source[1 - parity])
+                    for source, target in product(
+                        sources[parity::2],
+                        [rects[i] for rects in targets for i in (parity, parity + 2)],
+                    )
+                    if utils._intersects(source, target)
+                ]
+                if distances:
+                    source, target = pairs[parity]
+                    assert abs(target[1 - parity] - source[1 - parity]) == min(
+                        distances
+                    )
+                else:
+                    assert parity not in pairs
+
+    ## SnappingIndex.remove
+    def test_SnappingIndex_remove_returns_True_for_unknown_key(self):
+        assert snapping.SnappingIndex().remove(5000) is True
+
+    def test_SnappingIndex_remove_functionality(self):
+        index = snapping.SnappingIndex()
+        first = utils.get_snapping_sources_for_rect((10, 20, 300, 50), 10)
+        second = utils.get_snapping_sources_for_rect((500, 400, 100, 100), 10)
+        index.append(first, key=5000)
+        index.append(second, key=9000)
+        returned = index.remove(5000)
+        assert returned is False
+        assert index.targets == [second]
+        for edges in index.edges:
+            assert [entry[2] for entry in edges] == [9000, 9000]
+        assert index.intersections(first) is False
+
+    ## SnappingIndex.targets
+    def test_SnappingIndex_targets_excludes_excluded_key(self):
+        index = snapping.SnappingIndex()
+        first = utils.get_snapping_sources_for_rect((10, 20, 300, 50), 10)
+        second = utils.get_snapping_sources_for_rect((500, 400, 100, 100), 10)
+        index.append(first, key=5000)
+        index.append(second, key=9000)
+        index.excluded = 9000
+        assert index.targets == [first]
+        assert index == [first]
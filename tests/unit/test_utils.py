@@ -106,6 +106,121 @@ class TestUtils:
     def test_utils_get_cursor_name_functionality(self, corner, with_arrow, expected):
         assert utils.get_cursor_name(corner, with_arrow) == expected
 
+    ## get_geometry_string
+    @pytest.mark.parametrize(
+        "args,expected",
+        [
+            ((10, 20), "+10+20"),
+            ((10, 20, 300, 200), "300x200+10+20"),
+            ((None, None, 300, 200), "300x200"),
+            ((-10, 0, 300, 200), "300x200+-10+0"),
+            ((10, None, 300, None), ""),
+        ],
+    )
+    def test_utils_get_geometry_string_functionality(self, args, expected):
+        assert utils.get_geometry_string(*args) == expected
+
+    ## get_filtered_screenshot
+    @pytest.mark.parametrize("grayscale,mode", [(True, "L"), (False, "RGB")])
+    def test_utils_get_filtered_screenshot_functionality(self, grayscale, mode):
+        image = Image.new("RGB", (16, 8), "red")
+        returned = utils.get_filtered_screenshot(
+            image, blur_size=3, grayscale=grayscale
+        )
+        assert isinstance(returned, Image.Image)
+        assert returned.mode == mode
+        assert returned.size == (16, 8)
+
+    def test_utils_get_filtered_screenshot_calls_filter_with_blur_size(self, mocker):
+        mocker.patch("PIL.ImageFilter.BoxBlur")
+        mocked = mocker.patch("PIL.Image.Image.filter")
+        returned = utils.get_filtered_screenshot(Settings.BLANK_ICON, blur_size=4)
+        mocked.assert_called_once()
+        mocked.assert_called_with(ImageFilter.BoxBlur(4))
+        assert returned == mocked.return_value
+
+    def test_utils_get_filtered_screenshot_crops_to_size(self):
+        image = Image.new("RGB", (16, 8), "red")
+        returned = utils.get_filtered_screenshot(image, blur_size=1, size=(10, 20))
+        assert returned.size == (10, 8)
+
+    def test_utils_get_filtered_screenshot_not_cropping_smaller_image(self, mocker):
+        mocked = mocker.patch("PIL.Image.Image.crop")
+        image = Image.new("RGB", (16, 8), "red")
+        returned = utils.get_filtered_screenshot(image, blur_size=1, size=(16, 8))
+        mocked.assert_not_called()
+        assert returned.size == (16, 8)
+
+    @pytest.mark.parametrize("grayscale,mode", [(True, "L"), (False, "RGB")])
+    def test_utils_get_filtered_screenshot_downscale_functionality(
+        self, grayscale, mode
+    ):
+        image = Image.new("RGB", (17, 9), "red")
+        returned = utils.get_filtered_screenshot(
+            image, blur_size=2, grayscale=grayscale, downscale=2
+        )
+        assert returned.mode == mode
+        assert returned.size == (17, 9)
+        assert returned.getpixel((16, 8)) == image.convert(mode).getpixel((16, 8))
+
+    def test_utils_get_filtered_screenshot_downscale_blurs_reduced_image(self, mocker):
+        mocker.patch("PIL.ImageFilter.BoxBlur")
+        mocked = mocker.patch("PIL.Image.Image.resize")
+        image = Image.new("RGB", (16, 8), "red")
+        utils.get_filtered_screenshot(image, blur_size=4, downscale=2)
+        mocked.assert_called_once()
+        mocked.assert_called_with((8, 4), Image.BOX, box=(0, 0, 16, 8))
+        mocked.return_value.filter.assert_called_once()
+        mocked.return_value.filter.assert_called_with(ImageFilter.BoxBlur(2))
+        mocked.return_value.filter.return_value.resize.assert_called_with(
+            (16, 8), Image.NEAREST
+        )
+
+    def test_utils_get_filtered_screenshot_crops_to_box(self):
+        image = Image.new("RGB", (16, 8), "red")
+        image.paste("blue", (10, 0, 16, 8))
+        returned = utils.get_filtered_screenshot(image, blur_size=1, box=(10, 2, 16, 7))
+        assert returned.size == (6, 5)
+        assert returned.getpixel((0, 0)) == (0, 0, 255)
+
+    def test_utils_get_filtered_screenshot_crops_box_to_size(self):
+        image = Image.new("RGB", (16, 8), "red")
+        returned = utils.get_filtered_screenshot(
+            image, blur_size=1, size=(4, 20), box=(2, 2, 12, 8)
+        )
+        assert returned.size == (4, 6)
+
+    @pytest.mark.parametrize("grayscale,mode", [(True, "L"), (False, "RGB")])
+    def test_utils_get_filtered_screenshot_downscale_box_functionality(
+        self, grayscale, mode
+    ):
+        image = Image.new("RGB", (16, 8), "red")
+        image.paste("blue", (10, 0, 16, 8))
+        returned = utils.get_filtered_screenshot(
+            image, blur_size=2, grayscale=grayscale, downscale=2, box=(10, 1, 15, 8)
+        )
+        assert returned.mode == mode
+        assert returned.size == (5, 7)
+        assert returned.getpixel((4, 6)) == image.convert(mode).getpixel((14, 7))
+
+    def test_utils_get_filtered_screenshot_downscale_reads_box(self, mocker):
+        mocker.patch("PIL.ImageFilter.BoxBlur")
+        mocked_crop = mocker.patch("PIL.Image.Image.crop")
+        mocked = mocker.patch("PIL.Image.Image.resize")
+        image = Image.new("RGB", (16, 8), "red")
+        utils.get_filtered_screenshot(
+            image, blur_size=4, downscale=2, size=(6, 20), box=(2, 1, 12, 7)
+        )
+        mocked_crop.assert_not_called()
+        mocked.assert_called_once()
+        mocked.assert_called_with((3, 3), Image.BOX, box=(2, 1, 8, 7))
+
+    def test_utils_get_filtered_screenshot_not_downscaling_without_blur(self, mocker):
+        mocked = mocker.patch("PIL.Image.Image.resize")
+        image = Image.new("RGB", (16, 8), "red")
+        utils.get_filtered_screenshot(image, blur_size=0, downscale=2)
+        mocked.assert_not_called()
+
     ## get_prepared_screenshot
     def test_utils_get_prepared_screenshot_calls_filter(self, mocker):
         image = Settings.BLANK_ICON
@@ -147,6 +262,27 @@ class TestUtils:
         utils.get_prepared_screenshot(image, grayscale=False)
         mocked.assert_not_called()
 
+    def test_utils_get_prepared_screenshot_calls_get_filtered_screenshot(self, mocker):
+        mocker.patch("PIL.ImageTk.PhotoImage")
+        mocked = mocker.patch("arrangeit.utils.get_filtered_screenshot")
+        utils.get_prepared_screenshot(
+            Settings.BLANK_ICON,
+            blur_size=3,
+            grayscale=True,
+            downscale=2,
+            size=(8, 8),
+            box=(1, 1, 9, 9),
+        )
+        mocked.assert_called_once()
+        mocked.assert_called_with(
+            Settings.BLANK_ICON,
+            blur_size=3,
+            grayscale=True,
+            downscale=2,
+            size=(8, 8),
+            box=(1, 1, 9, 9),
+        )
+
     def test_utils_get_prepared_screenshot_returns_ImageTk_PhotoImage(self, mocker):
         mocker.patch("PIL.ImageFilter.BoxBlur")
         mocker.patch("PIL.Image.Image.filter")
@@ -289,6 +425,26 @@ class TestUtils:
     ):
         assert utils.get_value_if_valid_type(value, typ) is ()
 
+    ## get_visible_wids
+    def test_utils_get_visible_wids_functionality(self):
+        stacked = [
+            (100, (0, 0, 200, 200)),
+            (200, (150, 150, 200, 200)),
+            (300, (500, 0, 100, 100)),
+        ]
+        assert utils.get_visible_wids(stacked) == {200, 300}
+
+    def test_utils_get_visible_wids_for_adjacent_windows(self):
+        stacked = [(100, (0, 0, 200, 200)), (200, (200, 0, 200, 200))]
+        assert utils.get_visible_wids(stacked) == {100, 200}
+
+    def test_utils_get_visible_wids_for_occluders(self):
+        stacked = [(100, (0, 0, 200, 200)), (200, (300, 0, 200, 200))]
+        assert utils.get_visible_wids(stacked, occluders=[(350, 50, 10, 10)]) == {100}
+
+    def test_utils_get_visible_wids_for_empty_stack(self):
+        assert utils.get_visible_wids([], occluders=[(350, 50, 10, 10)]) == set()
+
     ## increased_by_fraction
     @pytest.mark.parametrize(
         "value,fraction,expected",
@@ -427,6 +583,20 @@ class TestUtils:
                 utils.Rectangle,
             )
 
+    def test_utils__get_snapping_source_by_ordinal_is_memoized(self):
+        utils.clear_snapping_cache()
+        first = utils._get_snapping_source_by_ordinal((200, 300, 400, 500), 10, 1)
+        second = utils._get_snapping_source_by_ordinal((200, 300, 400, 500), 10, 1)
+        assert first is second
+        info = utils.snapping_cache_info()["ordinal"]
+        assert (info.hits, info.misses) == (1, 1)
+        assert info.maxsize == utils.SNAPPING_CACHE_SIZE
+
+    ## _get_snapping_sources_for_rect
+    @pytest.mark.parametrize("rect,expected", SAMPLE_SNAPPING_SOURCES_FOR_RECT)
+    def test_utils__get_snapping_sources_for_rect_functionality(self, rect, expected):
+        assert utils._get_snapping_sources_for_rect(tuple(rect), 10) == expected
+
     ## _intersects
     @pytest.mark.parametrize("source,target,expected", INTERSECTS_SAMPLES)
     def test_utils_intersects_functionality(self, source, target, expected):
@@ -528,7 +698,30 @@ class TestUtils:
             utils.check_intersections((sources[2], sources[3]), targets) == expected[4]
         )
 
+    ## clear_snapping_cache
+    def test_utils_clear_snapping_cache_clears_caches(self):
+        utils.get_snapping_sources_for_rect((200, 300, 400, 500), 10)
+        utils.clear_snapping_cache()
+        info = utils.snapping_cache_info()
+        assert info["sources"].currsize == 0
+        assert info["ordinal"].currsize == 0
+
     ## get_snapping_sources_for_rect
+    def test_utils_get_snapping_sources_for_rect_calls_cached_function(self, mocker):
+        mocked = mocker.patch("arrangeit.utils._get_snapping_sources_for_rect")
+        returned = utils.get_snapping_sources_for_rect([200, 300, 400, 500], 10, 2)
+        mocked.assert_called_once()
+        mocked.assert_called_with((200, 300, 400, 500), 10, 2)
+        assert returned == mocked.return_value
+
+    def test_utils_get_snapping_sources_for_rect_counts_hits_and_misses(self):
+        utils.clear_snapping_cache()
+        utils.get_snapping_sources_for_rect((200, 300, 400, 500), 10)
+        utils.get_snapping_sources_for_rect([200, 300, 400, 500], 10)
+        utils.get_snapping_sources_for_rect((200, 300, 400, 500), 12)
+        info = utils.snapping_cache_info()["sources"]
+        assert (info.hits, info.misses) == (1, 2)
+
     @pytest.mark.parametrize("rect,expected", SAMPLE_SNAPPING_SOURCES_FOR_RECT)
     def test_utils_get_snapping_sources_for_rect_corner_None(self, rect, expected):
         assert utils.get_snapping_sources_for_rect(rect, 10) == expected
@@ -618,3 +811,11 @@ class TestUtils:
         SNAP = 10
         returned = utils.offset_for_intersections(RECTS, SNAP)
         assert returned == (SAMPLE[0], SAMPLE[1])
+
+    ## snapping_cache_info
+    def test_utils_snapping_cache_info_returns_dict_of_cache_infos(self):
+        returned = utils.snapping_cache_info()
+        assert sorted(returned.keys()) == ["ordinal", "sources"]
+        for info in returned.values():
+            assert hasattr(info, "hits")
+            assert hasattr(info, "misses")
@@ -15,16 +15,19 @@
 # along with this program. If not, see <https://www.gnu.org/licenses/>
 
 import tkinter as tk
+from collections import OrderedDict
 from gettext import gettext as _
-from tkinter.font import ITALIC, nametofont, NORMAL
+from tkinter.font import ITALIC, NORMAL
 
 import pytest
+from PIL import Image
 
 from arrangeit.settings import Settings
-from arrangeit.utils import increased_by_fraction
 from arrangeit.view import (
     CornerWidget,
+    FontsRegistry,
     ListedWindow,
+    PhotoImagesCache,
     PropertyIcon,
     Resizable,
     Restored,
@@ -35,6 +38,7 @@ from arrangeit.view import (
     WorkspacesCollection,
     get_screenshot_widget,
     get_tkinter_root,
+    icons_cache,
 )
 
 
@@ -96,6 +100,165 @@ class TestViewFunctions:
         assert get_screenshot_widget(mocker.MagicMock()) == mocked.return_value
 
 
+class TestFontsRegistry:
+    """Unit testing class for :class:`FontsRegistry` class."""
+
+    ## FontsRegistry
+    @pytest.mark.parametrize("attr", ["settings", "fonts"])
+    def test_view_FontsRegistry_inits_attr_as_None(self, attr):
+        assert getattr(FontsRegistry, attr) is None
+
+    ## FontsRegistry.__init__
+    def test_view_FontsRegistry_init_sets_attributes(self):
+        registry = FontsRegistry(Settings)
+        assert registry.settings is Settings
+        assert len(registry) == 0
+
+    ## FontsRegistry.clear
+    def test_view_FontsRegistry_clear_functionality(self, mocker):
+        mocker.patch("arrangeit.view.nametofont")
+        registry = FontsRegistry(Settings)
+        registry.get("TITLE_LABEL_FONT_INCREASE")
+        registry.clear()
+        assert len(registry) == 0
+
+    ## FontsRegistry.get
+    def test_view_FontsRegistry_get_creates_font_from_default_font(self, mocker):
+        mocked = mocker.patch("arrangeit.view.nametofont")
+        mocker.patch("arrangeit.view.FontsRegistry.get_size", return_value=12)
+        registry = FontsRegistry(Settings)
+        returned = registry.get("STATUSBAR_LABEL_FONT_INCREASE", slant="italic")
+        mocked.assert_called_with("TkDefaultFont")
+        assert returned == mocked.return_value.copy.return_value
+        returned.configure.assert_called_once()
+        returned.configure.assert_called_with(size=12, slant="italic")
+
+    def test_view_FontsRegistry_get_shares_font_for_the_same_setting(self, mocker):
+        mocked = mocker.patch("arrangeit.view.nametofont")
+        mocked.return_value.copy.side_effect = lambda: mocker.MagicMock()
+        registry = FontsRegistry(Settings)
+        first = registry.get("TITLE_LABEL_FONT_INCREASE")
+        second = registry.get("TITLE_LABEL_FONT_INCREASE")
+        other = registry.get("TOOLBAR_BUTTON_FONT_INCREASE")
+        assert first is second
+        assert first is not other
+        assert mocked.return_value.copy.call_count == 2
+        assert len(registry) == 2
+
+    ## FontsRegistry.get_size
+    def test_view_FontsRegistry_get_size_functionality(self, mocker):
+        mocked = mocker.patch("arrangeit.view.nametofont")
+        mocked.return_value.__getitem__.return_value = 10
+        settings = mocker.MagicMock()
+        settings.TITLE_LABEL_FONT_INCREASE = 0.5
+        registry = FontsRegistry(settings)
+        assert registry.get_size("TITLE_LABEL_FONT_INCREASE") == 15
+
+    ## FontsRegistry.update
+    def test_view_FontsRegistry_update_configures_registered_font(self, mocker):
+        mocker.patch("arrangeit.view.nametofont")
+        mocker.patch("arrangeit.view.FontsRegistry.get_size", return_value=14)
+        registry = FontsRegistry(Settings)
+        font = registry.get("TITLE_LABEL_FONT_INCREASE")
+        font.configure.reset_mock()
+        registry.update("TITLE_LABEL_FONT_INCREASE")
+        font.configure.assert_called_once()
+        font.configure.assert_called_with(size=14)
+
+    def test_view_FontsRegistry_update_not_creating_font(self, mocker):
+        mocked = mocker.patch("arrangeit.view.nametofont")
+        registry = FontsRegistry(Settings)
+        registry.update("TITLE_LABEL_FONT_INCREASE")
+        mocked.return_value.copy.assert_not_called()
+        assert len(registry) == 0
+
+
+class TestPhotoImagesCache:
+    """Unit testing class for :class:`PhotoImagesCache` class."""
+
+    ## PhotoImagesCache
+    def test_view_PhotoImagesCache_inits_images_as_None(self):
+        assert PhotoImagesCache.images is None
+
+    @pytest.mark.parametrize("attr", ["memory_limit", "memory", "hits", "misses"])
+    def test_view_PhotoImagesCache_inits_counter_as_zero(self, attr):
+        assert getattr(PhotoImagesCache, attr) == 0
+
+    ## PhotoImagesCache.__init__
+    def test_view_PhotoImagesCache_init_sets_attributes(self):
+        cache = PhotoImagesCache(1024)
+        assert cache.memory_limit == 1024
+        assert len(cache) == 0
+
+    ## PhotoImagesCache.clear
+    def test_view_PhotoImagesCache_clear_functionality(self, mocker):
+        mocker.patch("arrangeit.view.ImageTk.PhotoImage")
+        cache = PhotoImagesCache(1024 * 1024)
+        cache.get(Image.new("RGBA", (32, 32)))
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.memory == 0
+
+    ## PhotoImagesCache.get
+    def test_view_PhotoImagesCache_get_reuses_image_with_same_content(self, mocker):
+        mocked = mocker.patch("arrangeit.view.ImageTk.PhotoImage")
+        cache = PhotoImagesCache(1024 * 1024)
+        first = cache.get(Image.new("RGBA", (32, 32), "red"))
+        second = cache.get(Image.new("RGBA", (32, 32), "red"))
+        mocked.assert_called_once()
+        assert first is second
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_view_PhotoImagesCache_get_creates_image_for_different_content(self, mocker):
+        mocked = mocker.patch("arrangeit.view.ImageTk.PhotoImage")
+        cache = PhotoImagesCache(1024 * 1024)
+        cache.get(Image.new("RGBA", (32, 32), "red"))
+        cache.get(Image.new("RGBA", (32, 32), "blue"))
+        assert mocked.call_count == 2
+
+    def test_view_PhotoImagesCache_get_creates_image_for_different_size(self, mocker):
+        mocked = mocker.patch("arrangeit.view.ImageTk.PhotoImage")
+        cache = PhotoImagesCache(1024 * 1024)
+        image = Image.new("RGBA", (32, 32), "red")
+        cache.get(image)
+        cache.get(image, (16, 16))
+        assert mocked.call_count == 2
+        assert mocked.call_args[0][0].size == (16, 16)
+        assert cache.memory == 32 * 32 * 4 + 16 * 16 * 4
+
+    def test_view_PhotoImagesCache_get_evicts_least_recently_used(self, mocker):
+        mocker.patch("arrangeit.view.ImageTk.PhotoImage")
+        cache = PhotoImagesCache(2 * 16 * 16 * 4)
+        red, green, blue = (
+            Image.new("RGBA", (16, 16), color) for color in ("red", "green", "blue")
+        )
+        cache.get(red)
+        cache.get(green)
+        cache.get(red)
+        cache.get(blue)
+        assert len(cache) == 2
+        assert cache.memory == 2 * 16 * 16 * 4
+        cache.get(red)
+        assert cache.misses == 3
+
+    def test_view_PhotoImagesCache_get_keeps_the_newest_image_over_limit(self, mocker):
+        mocker.patch("arrangeit.view.ImageTk.PhotoImage")
+        cache = PhotoImagesCache(10)
+        cache.get(Image.new("RGBA", (16, 16)))
+        assert len(cache) == 1
+
+    ## PhotoImagesCache.set_memory_limit
+    def test_view_PhotoImagesCache_set_memory_limit_evicts_images(self, mocker):
+        mocker.patch("arrangeit.view.ImageTk.PhotoImage")
+        cache = PhotoImagesCache(1024 * 1024)
+        cache.get(Image.new("RGBA", (16, 16), "red"))
+        cache.get(Image.new("RGBA", (16, 16), "blue"))
+        cache.set_memory_limit(16 * 16 * 4)
+        assert cache.memory_limit == 16 * 16 * 4
+        assert len(cache) == 1
+        assert cache.memory == 16 * 16 * 4
+
+
 class TestPropertyIcon:
     """Unit testing class for :class:`PropertyIcon` class."""
 
@@ -549,7 +712,9 @@ class TestWorkspacesCollection:
     def test_view_WorkspacesCollection_issubclass_of_Frame(self):
         assert issubclass(WorkspacesCollection, tk.Frame)
 
-    @pytest.mark.parametrize("attr,value", [("master", None), ("active", 0)])
+    @pytest.mark.parametrize(
+        "attr,value", [("master", None), ("active", 0), ("workspaces", None)]
+    )
     def test_view_WorkspacesCollection_inits_attributes(self, attr, value):
         assert getattr(WorkspacesCollection, attr) is value
 
@@ -566,6 +731,10 @@ class TestWorkspacesCollection:
         workspaces = WorkspacesCollection(master)
         assert workspaces.master == master
 
+    def test_view_WorkspacesCollection_init_sets_empty_workspaces(self, mocker):
+        workspaces = WorkspacesCollection(mocker.MagicMock())
+        assert workspaces.workspaces == OrderedDict()
+
     def test_view_WorkspacesCollection_init_calls_config_background(self, mocker):
         mocked = mocker.patch("arrangeit.view.tk.Frame.config")
         master = mocker.MagicMock()
@@ -629,66 +798,70 @@ class TestWorkspacesCollection:
             )
         mocked.return_value.place.assert_has_calls(calls, any_order=True)
 
+    def test_view_WorkspacesCollection_add_workspaces_deselects_workspaces(
+        self, mocker
+    ):
+        mocked = mocker.patch("arrangeit.view.Workspace")
+        workspaces = WorkspacesCollection(mocker.MagicMock())
+        workspaces.add_workspaces([(0, "foo"), (1, "bar")])
+        assert mocked.return_value.set_selected.call_count == 2
+        mocked.return_value.set_selected.assert_called_with(False)
+
+    def test_view_WorkspacesCollection_add_workspaces_sets_workspaces(self, mocker):
+        mocked = mocker.patch("arrangeit.view.Workspace")
+        workspaces = WorkspacesCollection(mocker.MagicMock())
+        workspaces.add_workspaces([(1002, "foo"), (1000, "bar")])
+        assert list(workspaces.workspaces.keys()) == [1002, 1000]
+        assert workspaces.workspaces[1000] == mocked.return_value
+
+    ## WorkspacesCollection.get_number
+    @pytest.mark.parametrize(
+        "position,expected", [(0, 1002), (1, 1000), (2, 1001), (3, None)]
+    )
+    def test_view_WorkspacesCollection_get_number_functionality(
+        self, mocker, position, expected
+    ):
+        workspaces = WorkspacesCollection(mocker.MagicMock())
+        workspaces.workspaces = OrderedDict(
+            [(1002, mocker.MagicMock()), (1000, None), (1001, None)]
+        )
+        assert workspaces.get_number(position) == expected
+
     ## WorkspacesCollection.select_active
+    def get_workspaces(self, mocker, numbers):
+        return OrderedDict((number, mocker.MagicMock()) for number in numbers)
+
     def test_view_WorkspacesCollection_select_active_for_single_workspace(self, mocker):
-        workspaces = WorkspacesCollection()
-        mocker.patch(
-            "arrangeit.view.WorkspacesCollection.winfo_children",
-            return_value=[mocker.MagicMock()],
-        )
+        workspaces = WorkspacesCollection(mocker.MagicMock())
+        workspaces.workspaces = self.get_workspaces(mocker, [1000])
         returned = workspaces.select_active(1000)
         assert returned is True
+        workspaces.workspaces[1000].set_selected.assert_not_called()
 
-    def test_view_WorkspacesCollection_select_active_calls_label_config(self, mocker):
-        workspaces = WorkspacesCollection()
-        widget0 = mocker.MagicMock()
-        type(widget0).number = mocker.PropertyMock(return_value=1000)
-        widget1 = mocker.MagicMock()
-        type(widget1).number = mocker.PropertyMock(return_value=1001)
-        widget2 = mocker.MagicMock()
-        type(widget2).number = mocker.PropertyMock(return_value=1002)
-        mocker.patch(
-            "arrangeit.view.WorkspacesCollection.winfo_children",
-            return_value=[widget0, widget1, widget2],
-        )
+    def test_view_WorkspacesCollection_select_active_calls_set_selected(self, mocker):
+        workspaces = WorkspacesCollection(mocker.MagicMock())
+        workspaces.workspaces = self.get_workspaces(mocker, [1000, 1001, 1002])
+        workspaces.active = 1000
         workspaces.select_active(1001)
-        calls = [mocker.call(foreground=Settings.WORKSPACE_NUMBER_LABEL_FG)]
-        widget0.number_label.config.assert_has_calls(calls, any_order=True)
-        widget2.number_label.config.assert_has_calls(calls, any_order=True)
-        calls = [mocker.call(foreground=Settings.WORKSPACE_NAME_LABEL_FG)]
-        widget0.name_label.config.assert_has_calls(calls, any_order=True)
-        widget2.name_label.config.assert_has_calls(calls, any_order=True)
-        calls = [mocker.call(foreground=Settings.SELECTED_COLOR)]
-        widget1.number_label.config.assert_has_calls(calls, any_order=True)
-        widget1.name_label.config.assert_has_calls(calls, any_order=True)
-
-    def test_view_WorkspacesCollection_select_active_calls_cursor_config(self, mocker):
-        workspaces = WorkspacesCollection()
-        widget0 = mocker.MagicMock()
-        type(widget0).number = mocker.PropertyMock(return_value=1000)
-        widget1 = mocker.MagicMock()
-        type(widget1).number = mocker.PropertyMock(return_value=1001)
-        widget2 = mocker.MagicMock()
-        type(widget2).number = mocker.PropertyMock(return_value=1002)
-        mocker.patch(
-            "arrangeit.view.WorkspacesCollection.winfo_children",
-            return_value=[widget0, widget1, widget2],
-        )
+        workspaces.workspaces[1000].set_selected.assert_called_once()
+        workspaces.workspaces[1000].set_selected.assert_called_with(False)
+        workspaces.workspaces[1001].set_selected.assert_called_once()
+        workspaces.workspaces[1001].set_selected.assert_called_with(True)
+        workspaces.workspaces[1002].set_selected.assert_not_called()
+
+    def test_view_WorkspacesCollection_select_active_for_unknown_active(self, mocker):
+        workspaces = WorkspacesCollection(mocker.MagicMock())
+        workspaces.workspaces = self.get_workspaces(mocker, [1000, 1001])
+        workspaces.active = 2000
         workspaces.select_active(1001)
-        calls = [mocker.call(cursor=Settings.SELECT_CURSOR)]
-        widget0.config.assert_has_calls(calls, any_order=True)
-        widget2.config.assert_has_calls(calls, any_order=True)
-        calls = [mocker.call(cursor=Settings.DEFAULT_CURSOR)]
-        widget1.config.assert_has_calls(calls, any_order=True)
+        workspaces.workspaces[1000].set_selected.assert_not_called()
+        workspaces.workspaces[1001].set_selected.assert_called_with(True)
 
     def test_view_WorkspacesCollection_select_active_sets_active_attr(self, mocker):
-        workspaces = WorkspacesCollection()
-        mocker.patch(
-            "arrangeit.view.WorkspacesCollection.winfo_children",
-            return_value=[mocker.MagicMock(), mocker.MagicMock()],
-        )
-        workspaces.select_active(1000)
-        assert workspaces.active == 1000
+        workspaces = WorkspacesCollection(mocker.MagicMock())
+        workspaces.workspaces = self.get_workspaces(mocker, [1000, 1001])
+        workspaces.select_active(1001)
+        assert workspaces.active == 1001
 
     ## WorkspacesCollection.on_workspace_label_button_down
     def test_view_WorkspacesCollection_on_workspace_label_button_down_calls_workspace_active(
@@ -716,7 +889,7 @@ class TestWindowsList:
     def test_view_WindowsList_issubclass_of_Frame(self):
         assert issubclass(WindowsList, tk.Frame)
 
-    @pytest.mark.parametrize("attr", ["master"])
+    @pytest.mark.parametrize("attr", ["master", "windows", "widgets", "pool"])
     def test_view_WindowsList_inits_attr_as_None(self, attr):
         assert getattr(WindowsList, attr) is None
 
@@ -733,6 +906,14 @@ class TestWindowsList:
         windows = WindowsList(master)
         assert windows.master == master
 
+    @pytest.mark.parametrize(
+        "attr,value",
+        [("windows", OrderedDict()), ("widgets", OrderedDict()), ("pool", [])],
+    )
+    def test_view_WindowsList_init_sets_empty_collections(self, mocker, attr, value):
+        windows = WindowsList(mocker.MagicMock())
+        assert getattr(windows, attr) == value
+
     def test_view_WindowsList_init_configures_background(self, mocker):
         mocked = mocker.patch("arrangeit.view.tk.Frame.config")
         WindowsList()
@@ -795,26 +976,167 @@ class TestWindowsList:
             calls.append(mocker.call(window.return_value, current))
         mocked.assert_has_calls(calls, any_order=True)
 
+    def test_view_WindowsList_add_windows_sets_windows(self, mocker):
+        mocker.patch("arrangeit.view.WindowsList.update_rows")
+        windows = WindowsList(mocker.MagicMock())
+        windows_list = [(100, "foo", Settings.BLANK_ICON)]
+        windows.add_windows(windows_list)
+        assert windows.windows == OrderedDict([(100, windows_list[0])])
+
+    def test_view_WindowsList_add_windows_creates_only_visible_widgets(self, mocker):
+        mocked = mocker.patch("arrangeit.view.ListedWindow")
+        mocker.patch("arrangeit.view.WindowsList.place_widget_on_position")
+        windows = WindowsList(mocker.MagicMock())
+        windows.add_windows([(wid, "foo", Settings.BLANK_ICON) for wid in range(100)])
+        assert mocked.call_count == Settings.WINDOWS_LIST_COUNT
+        assert len(windows.widgets) == Settings.WINDOWS_LIST_COUNT
+
     ## WindowsList.clear_list
-    def test_view_WindowsList_clear_list_calls_winfo_children(self, mocker):
-        mocked = mocker.patch(
-            "arrangeit.view.WindowsList.winfo_children",
-            return_value=[mocker.MagicMock()],
-        )
-        windows = WindowsList()
+    def test_view_WindowsList_clear_list_empties_windows(self, mocker):
+        windows = WindowsList(mocker.MagicMock())
+        windows.windows = OrderedDict([(100, (100, "foo", Settings.BLANK_ICON))])
+        mocked = mocker.patch("arrangeit.view.WindowsList.update_rows")
         windows.clear_list()
+        assert windows.windows == OrderedDict()
         mocked.assert_called_once()
 
-    def test_view_WindowsList_clear_list_calls_widget_destroy(self, mocker):
+    def test_view_WindowsList_clear_list_hides_widgets(self, mocker):
         widget1 = mocker.MagicMock()
         widget2 = mocker.MagicMock()
-        mocker.patch(
-            "arrangeit.view.WindowsList.winfo_children", return_value=[widget1, widget2]
-        )
-        windows = WindowsList()
+        windows = WindowsList(mocker.MagicMock())
+        windows.widgets = OrderedDict([(100, widget1), (200, widget2)])
         windows.clear_list()
-        widget1.destroy.assert_called_once()
-        widget2.destroy.assert_called_once()
+        widget1.place_forget.assert_called_once()
+        widget2.place_forget.assert_called_once()
+        widget1.destroy.assert_not_called()
+        assert windows.widgets == OrderedDict()
+        assert windows.pool == [widget1, widget2]
+
+    ## WindowsList.get_wid
+    @pytest.mark.parametrize(
+        "position,expected", [(0, 300), (1, 100), (2, 200), (3, None)]
+    )
+    def test_view_WindowsList_get_wid_functionality(self, mocker, position, expected):
+        windows = WindowsList(mocker.MagicMock())
+        windows.windows = OrderedDict(
+            [(300, (300, "", None)), (100, (100, "", None)), (200, (200, "", None))]
+        )
+        assert windows.get_wid(position) == expected
+
+    ## WindowsList.remove_window
+    def test_view_WindowsList_remove_window_functionality(self, mocker):
+        mocked = mocker.patch("arrangeit.view.WindowsList.update_rows")
+        windows = WindowsList(mocker.MagicMock())
+        windows.windows = OrderedDict(
+            [
+                (100, (100, "foo", Settings.BLANK_ICON)),
+                (200, (200, "bar", Settings.BLANK_ICON)),
+            ]
+        )
+        windows.widgets = OrderedDict([(100, mocker.MagicMock())])
+        windows.remove_window(100)
+        assert windows.windows == OrderedDict(
+            [(200, (200, "bar", Settings.BLANK_ICON))]
+        )
+        mocked.assert_called_once()
+
+    def test_view_WindowsList_remove_window_not_calling_update_rows(self, mocker):
+        mocked = mocker.patch("arrangeit.view.WindowsList.update_rows")
+        windows = WindowsList(mocker.MagicMock())
+        windows.windows = OrderedDict(
+            [
+                (100, (100, "foo", Settings.BLANK_ICON)),
+                (200, (200, "bar", Settings.BLANK_ICON)),
+            ]
+        )
+        windows.widgets = OrderedDict([(100, mocker.MagicMock())])
+        windows.remove_window(200)
+        windows.remove_window(300)
+        assert list(windows.windows.keys()) == [100]
+        mocked.assert_not_called()
+
+    ## WindowsList.update_rows
+    def get_widgets(self, mocker, wids):
+        return OrderedDict((wid, mocker.MagicMock()) for wid in wids)
+
+    def get_windows(self, wids):
+        return OrderedDict((wid, (wid, str(wid), Settings.BLANK_ICON)) for wid in wids)
+
+    def test_view_WindowsList_update_rows_reuses_bound_widgets(self, mocker):
+        mocked = mocker.patch("arrangeit.view.ListedWindow")
+        placed = mocker.patch("arrangeit.view.WindowsList.place_widget_on_position")
+        windows = WindowsList(mocker.MagicMock())
+        windows.widgets = self.get_widgets(mocker, [100, 200, 300])
+        widgets = list(windows.widgets.values())
+        windows.windows = self.get_windows([200, 300])
+        windows.update_rows()
+        mocked.assert_not_called()
+        for widget in widgets:
+            widget.set_window.assert_not_called()
+        placed.assert_has_calls(
+            [mocker.call(widgets[1], 0), mocker.call(widgets[2], 1)], any_order=False
+        )
+        widgets[0].place_forget.assert_called_once()
+        assert list(windows.widgets.items()) == [(200, widgets[1]), (300, widgets[2])]
+        assert windows.pool == [widgets[0]]
+
+    def test_view_WindowsList_update_rows_places_only_moved_widgets(self, mocker):
+        placed = mocker.patch("arrangeit.view.WindowsList.place_widget_on_position")
+        windows = WindowsList(mocker.MagicMock())
+        windows.widgets = self.get_widgets(mocker, [100, 200, 300])
+        widgets = list(windows.widgets.values())
+        windows.windows = self.get_windows([100, 300])
+        windows.update_rows()
+        placed.assert_called_once()
+        placed.assert_called_with(widgets[2], 1)
+        widgets[0].place_forget.assert_not_called()
+        widgets[1].place_forget.assert_called_once()
+
+    def test_view_WindowsList_update_rows_binds_free_widgets(self, mocker):
+        mocked = mocker.patch("arrangeit.view.ListedWindow")
+        placed = mocker.patch("arrangeit.view.WindowsList.place_widget_on_position")
+        windows = WindowsList(mocker.MagicMock())
+        windows.widgets = self.get_widgets(mocker, [100, 200])
+        widgets = list(windows.widgets.values())
+        windows.windows = self.get_windows([200, 400])
+        windows.update_rows()
+        mocked.assert_not_called()
+        widgets[0].set_window.assert_called_once()
+        widgets[0].set_window.assert_called_with(400, "400", Settings.BLANK_ICON)
+        widgets[0].place_forget.assert_not_called()
+        widgets[1].set_window.assert_not_called()
+        placed.assert_has_calls(
+            [mocker.call(widgets[1], 0), mocker.call(widgets[0], 1)], any_order=False
+        )
+        assert list(windows.widgets.values()) == [widgets[1], widgets[0]]
+        assert windows.pool == []
+
+    def test_view_WindowsList_update_rows_binds_pool_widgets(self, mocker):
+        mocked = mocker.patch("arrangeit.view.ListedWindow")
+        placed = mocker.patch("arrangeit.view.WindowsList.place_widget_on_position")
+        windows = WindowsList(mocker.MagicMock())
+        widget = mocker.MagicMock()
+        windows.pool = [widget]
+        windows.windows = self.get_windows([500])
+        windows.update_rows()
+        mocked.assert_not_called()
+        widget.set_window.assert_called_with(500, "500", Settings.BLANK_ICON)
+        placed.assert_called_with(widget, 0)
+        assert windows.widgets == OrderedDict([(500, widget)])
+        assert windows.pool == []
+
+    def test_view_WindowsList_update_rows_creates_missing_widgets(self, mocker):
+        mocked = mocker.patch("arrangeit.view.ListedWindow")
+        mocker.patch("arrangeit.view.WindowsList.place_widget_on_position")
+        windows = WindowsList(mocker.MagicMock())
+        windows.widgets = self.get_widgets(mocker, [100])
+        windows.windows = self.get_windows([100, 200])
+        windows.update_rows()
+        mocked.assert_called_once()
+        mocked.assert_called_with(
+            windows, wid=200, title="200", icon=Settings.BLANK_ICON
+        )
+        assert len(windows.widgets) == 2
 
     ## WindowsList.place_widget_on_position
     def test_view_WindowsList_place_widget_on_position_calls_place_on_frame(
@@ -844,29 +1166,6 @@ class TestWindowsList:
         ]
         mocked.place.assert_has_calls(calls, any_order=True)
 
-    ## WindowsList.place_children
-    def test_view_WindowsList_place_children_calls_place_widget_on_position(
-        self, mocker
-    ):
-        windows = WindowsList(master=mocker.MagicMock())
-        mocked = mocker.patch("arrangeit.view.WindowsList.place_widget_on_position")
-        widget0 = mocker.MagicMock()
-        widget1 = mocker.MagicMock()
-        widget2 = mocker.MagicMock()
-        children = mocker.patch(
-            "arrangeit.view.WindowsList.winfo_children",
-            return_value=[widget0, widget1, widget2],
-        )
-        windows.place_children()
-        assert children.call_count == 1
-        assert mocked.call_count == 3
-        calls = [
-            mocker.call(widget0, 0),
-            mocker.call(widget1, 1),
-            mocker.call(widget2, 2),
-        ]
-        mocked.assert_has_calls(calls, any_order=True)
-
     ## WindowsList.on_window_label_button_down
     def test_view_WindowsList_on_window_label_button_down_calls_listed_window_activated(
         self, mocker
@@ -930,17 +1229,38 @@ class TestWorkspace:
     ## Workspace.get_humanized_number
     @pytest.mark.parametrize("number", [1002, 2007, 5, 0])
     def test_view_Workspace_get_humanized_number(self, mocker, number):
-        mocker.patch("arrangeit.view.nametofont")
-        mocker.patch("arrangeit.view.increased_by_fraction")
+        mocker.patch("arrangeit.view.fonts")
         workspace = Workspace(mocker.MagicMock(), number=number)
         returned = workspace.get_humanized_number(number)
         assert isinstance(returned, str)
         assert returned == str(number % 1000 + 1)
 
+    ## Workspace.set_selected
+    @pytest.mark.parametrize(
+        "selected,color,cursor",
+        [
+            (True, Settings.SELECTED_COLOR, Settings.DEFAULT_CURSOR),
+            (False, Settings.WORKSPACE_NUMBER_LABEL_FG, Settings.SELECT_CURSOR),
+        ],
+    )
+    def test_view_Workspace_set_selected_functionality(
+        self, mocker, selected, color, cursor
+    ):
+        mocker.patch("arrangeit.view.Workspace.setup_bindings")
+        mocker.patch("arrangeit.view.Workspace.setup_widgets")
+        mocked = mocker.patch("arrangeit.view.tk.Frame.config")
+        workspace = Workspace(mocker.MagicMock())
+        workspace.number_label = mocker.MagicMock()
+        workspace.name_label = mocker.MagicMock()
+        workspace.set_selected(selected)
+        workspace.number_label.config.assert_called_once()
+        workspace.number_label.config.assert_called_with(foreground=color)
+        workspace.name_label.config.assert_called_with(foreground=color)
+        mocked.assert_called_with(cursor=cursor)
+
     ## Workspace.setup_widgets
     def test_view_Workspace_setup_widgets_calls_get_humanized_number(self, mocker):
-        mocker.patch("arrangeit.view.nametofont")
-        mocker.patch("arrangeit.view.increased_by_fraction")
+        mocker.patch("arrangeit.view.fonts")
         mocked = mocker.patch("arrangeit.view.Workspace.get_humanized_number")
         workspace = Workspace(mocker.MagicMock(), number=1002)
         mocked.reset_mock()
@@ -950,6 +1270,7 @@ class TestWorkspace:
         mocked.assert_has_calls(calls, any_order=True)
 
     def test_view_Workspace_setup_widgets_sets_number_label(self, mocker):
+        fonts = mocker.patch("arrangeit.view.fonts")
         mocked = mocker.patch("arrangeit.view.tk.Label")
         workspace = Workspace(mocker.MagicMock(), number=0)
         workspace.setup_widgets()
@@ -957,13 +1278,7 @@ class TestWorkspace:
             mocker.call(
                 workspace,
                 text="1",
-                font=(
-                    "TkDefaultFont",
-                    increased_by_fraction(
-                        nametofont("TkDefaultFont")["size"],
-                        Settings.WORKSPACE_NUMBER_FONT_INCREASE,
-                    ),
-                ),
+                font=fonts.get.return_value,
                 foreground=Settings.WORKSPACE_NUMBER_LABEL_FG,
                 background=Settings.WORKSPACE_NUMBER_LABEL_BG,
                 anchor=Settings.WORKSPACE_NUMBER_LABEL_ANCHOR,
@@ -972,8 +1287,10 @@ class TestWorkspace:
             )
         ]
         mocked.assert_has_calls(calls, any_order=True)
+        fonts.get.assert_any_call("WORKSPACE_NUMBER_FONT_INCREASE")
 
     def test_view_Workspace_setup_widgets_sets_name_label(self, mocker):
+        fonts = mocker.patch("arrangeit.view.fonts")
         mocked = mocker.patch("arrangeit.view.tk.Label")
         workspace = Workspace(mocker.MagicMock(), name="foo name")
         workspace.setup_widgets()
@@ -981,13 +1298,7 @@ class TestWorkspace:
             mocker.call(
                 workspace,
                 text="foo name",
-                font=(
-                    "TkDefaultFont",
-                    increased_by_fraction(
-                        nametofont("TkDefaultFont")["size"],
-                        Settings.WORKSPACE_NAME_FONT_INCREASE,
-                    ),
-                ),
+                font=fonts.get.return_value,
                 height=Settings.WORKSPACE_NAME_LABEL_HEIGHT,
                 foreground=Settings.WORKSPACE_NAME_LABEL_FG,
                 background=Settings.WORKSPACE_NAME_LABEL_BG,
@@ -997,10 +1308,10 @@ class TestWorkspace:
             )
         ]
         mocked.assert_has_calls(calls, any_order=True)
+        fonts.get.assert_any_call("WORKSPACE_NAME_FONT_INCREASE")
 
     def test_view_Workspace_setup_widgets_calls_label_place(self, mocker):
-        mocker.patch("arrangeit.view.nametofont")
-        mocker.patch("arrangeit.view.increased_by_fraction")
+        mocker.patch("arrangeit.view.fonts")
         mocker.patch("arrangeit.view.tk.Label.config")
         mocked = mocker.patch("arrangeit.view.tk.Label.place")
         workspace = Workspace(mocker.MagicMock(), mocker.MagicMock())
@@ -1025,8 +1336,7 @@ class TestWorkspace:
         "event,method", [("<Enter>", "on_widget_enter"), ("<Leave>", "on_widget_leave")]
     )
     def test_view_Workspace_setup_bindings_callbacks(self, mocker, event, method):
-        mocker.patch("arrangeit.view.nametofont")
-        mocker.patch("arrangeit.view.increased_by_fraction")
+        mocker.patch("arrangeit.view.fonts")
         mocker.patch("arrangeit.view.tk.Label.config")
         workspace = Workspace(mocker.MagicMock())
         callback = getattr(workspace, method)
@@ -1041,8 +1351,7 @@ class TestWorkspace:
     def test_view_Workspace_setup_bindings_labels_master_callbacks(
         self, mocker, event, method
     ):
-        mocker.patch("arrangeit.view.nametofont")
-        mocker.patch("arrangeit.view.increased_by_fraction")
+        mocker.patch("arrangeit.view.fonts")
         mocker.patch("arrangeit.view.tk.Label.config")
         workspace = Workspace(mocker.MagicMock())
         callback = getattr(workspace.master, method)
@@ -1053,8 +1362,7 @@ class TestWorkspace:
 
     ## Workspace.on_widget_enter
     def test_view_Workspace_on_widget_enter_sets_foreground(self, mocker):
-        mocker.patch("arrangeit.view.nametofont")
-        mocker.patch("arrangeit.view.increased_by_fraction")
+        mocker.patch("arrangeit.view.fonts")
         mocked = mocker.patch("arrangeit.view.tk.Label.config")
         workspace = Workspace(mocker.MagicMock())
         workspace.on_widget_enter(mocker.MagicMock())
@@ -1065,8 +1373,7 @@ class TestWorkspace:
     def test_view_Workspace_on_widget_enter_not_setting_foreground_for_active(
         self, mocker
     ):
-        mocker.patch("arrangeit.view.nametofont")
-        mocker.patch("arrangeit.view.increased_by_fraction")
+        mocker.patch("arrangeit.view.fonts")
         mocked = mocker.patch("arrangeit.view.tk.Label.config")
         master = mocker.MagicMock()
         type(master).active = mocker.PropertyMock(return_value=1000)
@@ -1075,8 +1382,7 @@ class TestWorkspace:
         assert mocked.call_count == 0
 
     def test_view_Workspace_on_widget_enter_returns_break(self, mocker):
-        mocker.patch("arrangeit.view.nametofont")
-        mocker.patch("arrangeit.view.increased_by_fraction")
+        mocker.patch("arrangeit.view.fonts")
         mocker.patch("arrangeit.view.tk.Label.config")
         workspace = Workspace(mocker.MagicMock())
         returned = workspace.on_widget_enter(mocker.MagicMock())
@@ -1084,8 +1390,7 @@ class TestWorkspace:
 
     ## Workspace.on_widget_leave
     def test_view_Workspace_on_widget_leave_sets_foreground(self, mocker):
-        mocker.patch("arrangeit.view.nametofont")
-        mocker.patch("arrangeit.view.increased_by_fraction")
+        mocker.patch("arrangeit.view.fonts")
         mocked = mocker.patch("arrangeit.view.tk.Label.config")
         workspace = Workspace(mocker.MagicMock())
         workspace.on_widget_leave(mocker.MagicMock())
@@ -1096,8 +1401,7 @@ class TestWorkspace:
     def test_view_Workspace_on_widget_leave_not_setting_foreground_for_active(
         self, mocker
     ):
-        mocker.patch("arrangeit.view.nametofont")
-        mocker.patch("arrangeit.view.increased_by_fraction")
+        mocker.patch("arrangeit.view.fonts")
         mocked = mocker.patch("arrangeit.view.tk.Label.config")
         master = mocker.MagicMock()
         type(master).active = mocker.PropertyMock(return_value=1000)
@@ -1106,8 +1410,7 @@ class TestWorkspace:
         assert mocked.call_count == 0
 
     def test_view_Workspace_on_widget_leave_returns_break(self, mocker):
-        mocker.patch("arrangeit.view.nametofont")
-        mocker.patch("arrangeit.view.increased_by_fraction")
+        mocker.patch("arrangeit.view.fonts")
         mocker.patch("arrangeit.view.tk.Label.config")
         workspace = Workspace(mocker.MagicMock())
         returned = workspace.on_widget_leave(mocker.MagicMock())
@@ -1166,6 +1469,23 @@ class TestListedWindow:
         ListedWindow(master=master)
         mocked.assert_called_once()
 
+    ## ListedWindow.set_window
+    def test_view_ListedWindow_set_window_functionality(self, mocker):
+        mocker.patch("arrangeit.view.ListedWindow.setup_bindings")
+        mocker.patch("arrangeit.view.ListedWindow.setup_widgets")
+        mocked = mocker.patch("arrangeit.view.ListedWindow.get_icon_image")
+        window = ListedWindow(master=mocker.MagicMock())
+        window.title_label = mocker.MagicMock()
+        window.icon_label = mocker.MagicMock()
+        mocked.reset_mock()
+        window.set_window(500, "foo", Settings.BLANK_ICON)
+        mocked.assert_called_once()
+        mocked.assert_called_with(Settings.BLANK_ICON)
+        assert (window.wid, window.title) == (500, "foo")
+        assert window.icon == mocked.return_value
+        window.title_label.config.assert_called_with(text="foo")
+        window.icon_label.config.assert_called_with(image=mocked.return_value)
+
     ## ListedWindow.get_icon_image
     def test_view_ListedWindow_get_icon_image_calls_ImageTk_PhotoImage(self, mocker):
         mocker.patch("arrangeit.view.ListedWindow.setup_bindings")
@@ -1174,11 +1494,36 @@ class TestListedWindow:
         mocked = mocker.patch("arrangeit.view.ImageTk.PhotoImage")
         window = ListedWindow(master=master)
         mocked.reset_mock()
+        icons_cache.clear()
         window.get_icon_image(Settings.BLANK_ICON)
         mocked.assert_called_once()
 
+    def test_view_ListedWindow_get_icon_image_calls_icons_cache_get(self, mocker):
+        mocker.patch("arrangeit.view.ListedWindow.setup_bindings")
+        mocker.patch("arrangeit.view.ListedWindow.setup_widgets")
+        mocked = mocker.patch("arrangeit.view.icons_cache")
+        window = ListedWindow(master=mocker.MagicMock())
+        mocked.reset_mock()
+        returned = window.get_icon_image(Settings.BLANK_ICON)
+        mocked.get.assert_called_once()
+        mocked.get.assert_called_with(
+            Settings.BLANK_ICON,
+            (int(Settings.ICON_SIZE / 2), int(Settings.ICON_SIZE / 2)),
+        )
+        assert returned == mocked.get.return_value
+
+    def test_view_ListedWindow_get_icon_image_reuses_image_for_same_icon(self, mocker):
+        mocker.patch("arrangeit.view.ListedWindow.setup_bindings")
+        mocker.patch("arrangeit.view.ListedWindow.setup_widgets")
+        mocked = mocker.patch("arrangeit.view.ImageTk.PhotoImage")
+        window1 = ListedWindow(mocker.MagicMock(), icon=Settings.BLANK_ICON.copy())
+        window2 = ListedWindow(mocker.MagicMock(), icon=Settings.BLANK_ICON.copy())
+        mocked.assert_called_once()
+        assert window1.icon is window2.icon
+
     ## ListedWindow.setup_widgets
     def test_view_ListedWindow_setup_widgets_sets_title_label(self, mocker):
+        fonts = mocker.patch("arrangeit.view.fonts")
         mocked = mocker.patch("arrangeit.view.tk.Label")
         window = ListedWindow(mocker.MagicMock(), title="foo")
         window.setup_widgets()
@@ -1186,13 +1531,7 @@ class TestListedWindow:
             mocker.call(
                 window,
                 text="foo",
-                font=(
-                    "TkDefaultFont",
-                    increased_by_fraction(
-                        nametofont("TkDefaultFont")["size"],
-                        Settings.LISTED_WINDOW_NAME_FONT_INCREASE,
-                    ),
-                ),
+                font=fonts.get.return_value,
                 foreground=Settings.LISTED_WINDOW_LABEL_FG,
                 background=Settings.LISTED_WINDOW_LABEL_BG,
                 anchor=Settings.LISTED_WINDOW_LABEL_ANCHOR,
@@ -1201,10 +1540,10 @@ class TestListedWindow:
             )
         ]
         mocked.assert_has_calls(calls, any_order=True)
+        fonts.get.assert_any_call("LISTED_WINDOW_NAME_FONT_INCREASE")
 
     def test_view_ListedWindow_setup_widgets_sets_icon_label(self, mocker):
-        mocker.patch("arrangeit.view.nametofont")
-        mocker.patch("arrangeit.view.increased_by_fraction")
+        mocker.patch("arrangeit.view.fonts")
         mocked_icon = mocker.patch("arrangeit.view.ImageTk.PhotoImage")
         mocked = mocker.patch("arrangeit.view.tk.Label")
         window = ListedWindow(mocker.MagicMock(), icon=Settings.BLANK_ICON)
@@ -1222,8 +1561,7 @@ class TestListedWindow:
         mocked.assert_has_calls(calls, any_order=True)
 
     def test_view_ListedWindow_setup_widgets_calls_label_place(self, mocker):
-        mocker.patch("arrangeit.view.nametofont")
-        mocker.patch("arrangeit.view.increased_by_fraction")
+        mocker.patch("arrangeit.view.fonts")
         mocker.patch("arrangeit.view.tk.Label.config")
         mocker.patch("arrangeit.view.ImageTk.PhotoImage")
         mocked = mocker.patch("arrangeit.view.tk.Label.place")
@@ -1247,8 +1585,7 @@ class TestListedWindow:
         mocked.assert_has_calls(calls, any_order=True)
 
     def test_view_ListedWindow_setup_widgets_calls_config_background(self, mocker):
-        mocker.patch("arrangeit.view.nametofont")
-        mocker.patch("arrangeit.view.increased_by_fraction")
+        mocker.patch("arrangeit.view.fonts")
         mocker.patch("arrangeit.view.tk.Label.config")
         mocker.patch("arrangeit.view.ImageTk.PhotoImage")
         mocked = mocker.patch("arrangeit.view.tk.Frame.config")
@@ -1264,8 +1601,7 @@ class TestListedWindow:
         "event,method", [("<Enter>", "on_widget_enter"), ("<Leave>", "on_widget_leave")]
     )
     def test_view_ListedWindow_setup_bindings_callbacks(self, mocker, event, method):
-        mocker.patch("arrangeit.view.nametofont")
-        mocker.patch("arrangeit.view.increased_by_fraction")
+        mocker.patch("arrangeit.view.fonts")
         mocker.patch("arrangeit.view.tk.Label.config")
         mocker.patch("arrangeit.view.ImageTk.PhotoImage")
         window = ListedWindow(mocker.MagicMock())
@@ -1281,8 +1617,7 @@ class TestListedWindow:
     def test_view_ListedWindow_setup_bindings_labels_master_callbacks(
         self, mocker, event, method
     ):
-        mocker.patch("arrangeit.view.nametofont")
-        mocker.patch("arrangeit.view.increased_by_fraction")
+        mocker.patch("arrangeit.view.fonts")
         mocker.patch("arrangeit.view.tk.Label.config")
         mocker.patch("arrangeit.view.ImageTk.PhotoImage")
         window = ListedWindow(mocker.MagicMock())
@@ -1294,8 +1629,7 @@ class TestListedWindow:
 
     ## ListedWindow.on_widget_enter
     def test_view_ListedWindow_on_widget_enter_sets_foreground(self, mocker):
-        mocker.patch("arrangeit.view.nametofont")
-        mocker.patch("arrangeit.view.increased_by_fraction")
+        mocker.patch("arrangeit.view.fonts")
         mocker.patch("arrangeit.view.ImageTk.PhotoImage")
         mocked = mocker.patch("arrangeit.view.tk.Label.config")
         window = ListedWindow(mocker.MagicMock())
@@ -1305,8 +1639,7 @@ class TestListedWindow:
         mocked.assert_has_calls(calls, any_order=True)
 
     def test_view_ListedWindow_on_widget_enter_returns_break(self, mocker):
-        mocker.patch("arrangeit.view.nametofont")
-        mocker.patch("arrangeit.view.increased_by_fraction")
+        mocker.patch("arrangeit.view.fonts")
         mocker.patch("arrangeit.view.ImageTk.PhotoImage")
         window = ListedWindow(mocker.MagicMock())
         returned = window.on_widget_enter(mocker.MagicMock())
@@ -1314,8 +1647,7 @@ class TestListedWindow:
 
     ## ListedWindow.on_widget_leave
     def test_view_ListedWindow_on_widget_leave_sets_foreground(self, mocker):
-        mocker.patch("arrangeit.view.nametofont")
-        mocker.patch("arrangeit.view.increased_by_fraction")
+        mocker.patch("arrangeit.view.fonts")
         mocker.patch("arrangeit.view.ImageTk.PhotoImage")
         mocked = mocker.patch("arrangeit.view.tk.Label.config")
         window = ListedWindow(mocker.MagicMock())
@@ -1325,8 +1657,7 @@ class TestListedWindow:
         mocked.assert_has_calls(calls, any_order=True)
 
     def test_view_ListedWindow_on_widget_leave_returns_break(self, mocker):
-        mocker.patch("arrangeit.view.nametofont")
-        mocker.patch("arrangeit.view.increased_by_fraction")
+        mocker.patch("arrangeit.view.fonts")
         mocker.patch("arrangeit.view.ImageTk.PhotoImage")
         window = ListedWindow(mocker.MagicMock())
         returned = window.on_widget_leave(mocker.MagicMock())
@@ -1380,6 +1711,7 @@ class TestStatusbar:
         assert isinstance(statusbar.message, tk.StringVar)
 
     def test_view_Statusbar_setup_widgets_sets_message_label(self, mocker):
+        fonts = mocker.patch("arrangeit.view.fonts")
         mocked = mocker.patch("arrangeit.view.tk.Label")
         master = mocker.MagicMock()
         statusbar = Statusbar(master)
@@ -1387,15 +1719,7 @@ class TestStatusbar:
         mocked.assert_called_with(
             statusbar,
             textvariable=statusbar.message,
-            font=(
-                "TkDefaultFont",
-                increased_by_fraction(
-                    nametofont("TkDefaultFont")["size"],
-                    Settings.STATUSBAR_LABEL_FONT_INCREASE,
-                ),
-                NORMAL,
-                ITALIC,
-            ),
+            font=fonts.get.return_value,
             height=Settings.STATUSBAR_LABEL_HEIGHT,
             foreground=Settings.STATUSBAR_FG,
             background=Settings.STATUSBAR_BG,
@@ -1403,6 +1727,9 @@ class TestStatusbar:
             padx=Settings.STATUSBAR_LABEL_PADX,
             pady=Settings.STATUSBAR_LABEL_PADY,
         )
+        fonts.get.assert_any_call(
+            "STATUSBAR_LABEL_FONT_INCREASE", weight=NORMAL, slant=ITALIC
+        )
 
     def test_view_Statusbar_setup_widgets_calls_label_pack(self, mocker):
         mocked = mocker.patch("arrangeit.view.tk.Label")
@@ -1455,6 +1782,7 @@ class TestToolbar:
 
     ## Toolbar.setup_widgets
     def test_view_Toolbar_setup_widgets_sets_options_button(self, mocker):
+        fonts = mocker.patch("arrangeit.view.fonts")
         mocked = mocker.patch("arrangeit.view.tk.Button")
         master = mocker.MagicMock()
         toolbar = Toolbar(master)
@@ -1462,21 +1790,17 @@ class TestToolbar:
         calls = [
             mocker.call(
                 toolbar,
-                font=(
-                    "TkDefaultFont",
-                    increased_by_fraction(
-                        nametofont("TkDefaultFont")["size"],
-                        Settings.TOOLBAR_BUTTON_FONT_INCREASE,
-                    ),
-                ),
+                font=fonts.get.return_value,
                 text=_("Options"),
                 activeforeground=Settings.HIGHLIGHTED_COLOR,
                 command=toolbar.on_options_click,
             )
         ]
         mocked.assert_has_calls(calls, any_order=True)
+        fonts.get.assert_any_call("TOOLBAR_BUTTON_FONT_INCREASE")
 
     def test_view_Toolbar_setup_widgets_sets_quit_button(self, mocker):
+        fonts = mocker.patch("arrangeit.view.fonts")
         mocked = mocker.patch("arrangeit.view.tk.Button")
         master = mocker.MagicMock()
         toolbar = Toolbar(master)
@@ -1484,19 +1808,14 @@ class TestToolbar:
         calls = [
             mocker.call(
                 toolbar,
-                font=(
-                    "TkDefaultFont",
-                    increased_by_fraction(
-                        nametofont("TkDefaultFont")["size"],
-                        Settings.TOOLBAR_BUTTON_FONT_INCREASE,
-                    ),
-                ),
+                font=fonts.get.return_value,
                 text=_("Quit"),
                 activeforeground=Settings.HIGHLIGHTED_COLOR,
                 command=master.controller.shutdown,
             )
         ]
         mocked.assert_has_calls(calls, any_order=True)
+        fonts.get.assert_any_call("TOOLBAR_BUTTON_FONT_INCREASE")
 
     def test_view_Toolbar_setup_widgets_calls_button_place(self, mocker):
         mocked = mocker.patch("arrangeit.view.tk.Button.place")
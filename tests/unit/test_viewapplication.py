@@ -15,13 +15,11 @@
 # along with this program. If not, see <https://www.gnu.org/licenses/>
 
 import tkinter as tk
-from tkinter.font import nametofont
 
 import pytest
 
 from arrangeit.data import WindowModel
 from arrangeit.settings import Settings
-from arrangeit.utils import increased_by_fraction
 from arrangeit.view import (
     Resizable,
     Restored,
@@ -211,8 +209,7 @@ class TestViewApplication:
         self, mocker, event, method
     ):
         mocker.patch("arrangeit.view.tk.StringVar")
-        mocker.patch("arrangeit.view.nametofont")
-        mocker.patch("arrangeit.view.increased_by_fraction")
+        mocker.patch("arrangeit.view.fonts")
         controller = mocker.MagicMock()
         master = mocker.MagicMock()
         view = ViewApplication(master, controller)
@@ -366,19 +363,14 @@ class TestViewApplication:
         assert isinstance(getattr(view, name), typ)
 
     def test_ViewApplication_setup_title_sets_title_label(self, mocker):
+        fonts = mocker.patch("arrangeit.view.fonts")
         mocked = mocker.patch("arrangeit.view.tk.Label")
         view = ViewApplication(None, mocker.MagicMock())
         view.setup_title()
         mocked.assert_called_with(
             view,
             textvariable=view.title,
-            font=(
-                "TkDefaultFont",
-                increased_by_fraction(
-                    nametofont("TkDefaultFont")["size"],
-                    Settings.TITLE_LABEL_FONT_INCREASE,
-                ),
-            ),
+            font=fonts.get.return_value,
             height=Settings.TITLE_LABEL_HEIGHT,
             foreground=Settings.TITLE_LABEL_FG,
             background=Settings.TITLE_LABEL_BG,
@@ -386,6 +378,7 @@ class TestViewApplication:
             padx=Settings.TITLE_LABEL_PADX,
             pady=Settings.TITLE_LABEL_PADY,
         )
+        fonts.get.assert_any_call("TITLE_LABEL_FONT_INCREASE")
 
     def test_ViewApplication_setup_title_calls_label_place(self, mocker):
         mocked = mocker.patch("arrangeit.view.tk.Label")
@@ -580,24 +573,21 @@ class TestViewApplication:
     ## ViewApplication.startup
     def test_ViewApplication_startup_calls_show_root(self, mocker):
         mocker.patch("arrangeit.view.tk.StringVar")
-        mocker.patch("arrangeit.view.nametofont")
-        mocker.patch("arrangeit.view.increased_by_fraction")
+        mocker.patch("arrangeit.view.fonts")
         mocked = mocker.patch("arrangeit.view.ViewApplication.show_root")
         ViewApplication(mocker.MagicMock(), mocker.MagicMock()).startup()
         mocked.assert_called_once()
 
     def test_ViewApplication_startup_calls_focus_set_on_view_frame(self, mocker):
         mocker.patch("arrangeit.view.tk.StringVar")
-        mocker.patch("arrangeit.view.nametofont")
-        mocker.patch("arrangeit.view.increased_by_fraction")
+        mocker.patch("arrangeit.view.fonts")
         mocked = mocker.patch("arrangeit.view.tk.Frame.focus_set")
         ViewApplication(mocker.MagicMock(), mocker.MagicMock()).startup()
         assert mocked.call_count == 1
 
     def test_ViewApplication_startup_calls_place_on_view_frame(self, mocker):
         mocker.patch("arrangeit.view.tk.StringVar")
-        mocker.patch("arrangeit.view.nametofont")
-        mocker.patch("arrangeit.view.increased_by_fraction")
+        mocker.patch("arrangeit.view.fonts")
         mocked = mocker.patch("arrangeit.view.tk.Frame.place")
         master = mocker.MagicMock()
         view = ViewApplication(master, mocker.MagicMock())
@@ -611,8 +601,7 @@ class TestViewApplication:
 
     def test_ViewApplication_startup_calls_configure_on_labels(self, mocker):
         mocker.patch("arrangeit.view.tk.StringVar")
-        mocker.patch("arrangeit.view.nametofont")
-        mocker.patch("arrangeit.view.increased_by_fraction")
+        mocker.patch("arrangeit.view.fonts")
         mocked = mocker.patch("arrangeit.view.tk.Label.config")
         master = mocker.MagicMock()
         master.winfo_width.return_value = 100
@@ -675,6 +664,18 @@ class TestViewApplication:
         mocked.call_count == 1
         mocked.assert_called_with(model.icon)
 
+    def test_ViewApplication_update_widgets_calls_icons_cache_get(self, mocker):
+        mocker.patch("arrangeit.view.Resizable")
+        mocker.patch("arrangeit.view.Restored")
+        view = ViewApplication(None, mocker.MagicMock())
+        model = WindowModel(icon=Settings.BLANK_ICON)
+        mocker.patch("arrangeit.view.tk.Label.config")
+        mocked = mocker.patch("arrangeit.view.icons_cache")
+        view.update_widgets(model)
+        mocked.get.assert_called_once()
+        mocked.get.assert_called_with(model.icon)
+        assert view.icon_image == mocked.get.return_value
+
     def test_ViewApplication_update_widgets_sets_icon_image(self, mocker):
         mocker.patch("arrangeit.view.Resizable")
         mocker.patch("arrangeit.view.Restored")
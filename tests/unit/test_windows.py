@@ -509,6 +509,7 @@ class TestWindowsApp:
             mocked_screenhot.return_value,
             blur_size=Settings.SCREENSHOT_BLUR_PIXELS,
             grayscale=Settings.SCREENSHOT_TO_GRAYSCALE,
+            downscale=Settings.SCREENSHOT_DOWNSCALE_FACTOR,
         )
         assert returned == (mocked.return_value, (-1, -1))
 